@@ -0,0 +1,67 @@
+"""
+Measures the render cost per email of reading and parsing the template on every
+send versus rendering the pre-parsed template from the registry.
+
+Usage: python -m benchmarks.email_template_benchmark [--emails 5000]
+"""
+
+import argparse
+import time
+
+import pystache
+
+from src.core.utils import get_template_path
+from src.services.email_template_service import get_template_registry
+
+_TEMPLATES = {
+    "otp_template.html": {
+        "full_name": "Benchmark User",
+        "otp_code": "123456",
+        "otp_expiration_minutes": 5,
+    },
+    "temporary_password_template.html": {
+        "full_name": "Benchmark User",
+        "temporary_password": "Tmp#1234",
+        "email": "user@mail.com",
+        "login_url": "https://medisupply.example.com/login",
+    },
+}
+
+
+def _render_from_disk(template_name: str, template_values: dict) -> str:
+    with open(get_template_path(template_name), encoding="utf-8") as template_file:
+        return pystache.render(template_file.read(), template_values)
+
+
+def _time_per_email(render, template_name: str, template_values: dict, emails: int):
+    started = time.perf_counter()
+    for _ in range(emails):
+        render(template_name, template_values)
+
+    return (time.perf_counter() - started) / emails * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--emails", type=int, default=5000)
+    arguments = parser.parse_args()
+    registry = get_template_registry()
+
+    for template_name, template_values in _TEMPLATES.items():
+        assert _render_from_disk(template_name, template_values) == registry.render(
+            template_name, template_values
+        )
+        from_disk = _time_per_email(
+            _render_from_disk, template_name, template_values, arguments.emails
+        )
+        from_registry = _time_per_email(
+            registry.render, template_name, template_values, arguments.emails
+        )
+        print(
+            f"template={template_name:<34} from_disk_us={from_disk:>8.1f} "
+            f"from_registry_us={from_registry:>8.1f} speedup={from_disk / from_registry:>5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
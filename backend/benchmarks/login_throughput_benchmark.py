@@ -0,0 +1,95 @@
+"""
+Simulates a login storm and compares inline bcrypt checks with the password pool.
+
+For each mode it reports completed logins per second and the worst delay seen
+by a heartbeat task that should tick every few milliseconds.
+
+Usage: python -m benchmarks.login_throughput_benchmark [--logins 64] [--rounds 12]
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.core.config import settings
+from src.core.security import (
+    hash_password,
+    shutdown_password_pool,
+    verify_password,
+    verify_password_async,
+)
+
+_HEARTBEAT_SECONDS = 0.005
+_PASSWORD = "benchmark-password"
+
+
+async def _inline_login(hashed_password: str) -> bool:
+    return verify_password(_PASSWORD, hashed_password)
+
+
+async def _pooled_login(hashed_password: str) -> bool:
+    return await verify_password_async(_PASSWORD, hashed_password)
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_HEARTBEAT_SECONDS)
+        lags.append(time.perf_counter() - started - _HEARTBEAT_SECONDS)
+
+
+async def _run(*, mode: str, login, logins: int, hashed_password: str) -> None:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    heartbeat = asyncio.create_task(_heartbeat(stop, lags))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(login(hashed_password) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await heartbeat
+
+    assert all(results)
+    print(
+        f"mode={mode:<7} logins={logins:>5} logins_per_second={logins / elapsed:>8.1f} "
+        f"max_loop_lag_ms={max(lags, default=elapsed) * 1000:>8.1f}"
+    )
+
+
+async def _main(*, logins: int) -> None:
+    hashed_password = hash_password(_PASSWORD)
+    await _run(
+        mode="inline",
+        login=_inline_login,
+        logins=logins,
+        hashed_password=hashed_password,
+    )
+    await _run(
+        mode="pooled",
+        login=_pooled_login,
+        logins=logins,
+        hashed_password=hashed_password,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--rounds", type=int, default=settings.bcrypt_rounds)
+    parser.add_argument(
+        "--workers", type=int, default=settings.password_hashing_workers
+    )
+    arguments = parser.parse_args()
+    settings.bcrypt_rounds = arguments.rounds
+    settings.password_hashing_workers = arguments.workers
+
+    print(f"bcrypt_rounds={settings.bcrypt_rounds} workers={arguments.workers}")
+    try:
+        asyncio.run(_main(logins=arguments.logins))
+    finally:
+        shutdown_password_pool()
+
+
+if __name__ == "__main__":
+    main()
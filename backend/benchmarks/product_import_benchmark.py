@@ -0,0 +1,119 @@
+"""
+Loads a synthetic catalog through the bulk product import and compares it with
+creating the same products one by one, reporting rows per second for each path.
+
+The benchmark creates its own provider and deletes it, with its products, when
+it finishes. It needs a reachable database configured through the usual env vars.
+
+Usage: python -m benchmarks.product_import_benchmark [--rows 10000] [--single-rows 1000]
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import delete
+
+from src.db.database import async_session_scope, init_async_database, init_database
+from src.models.db_models import Provider
+from src.schemas.product_schema import ProductCreateBulkRequest, ProductCreateRequest
+from src.services.product_service import create_product, create_products_bulk
+
+
+def _products(provider_id: str, rows: int) -> list[ProductCreateRequest]:
+    return [
+        ProductCreateRequest(
+            name=f"Benchmark Product {number}",
+            details="Product created by the import benchmark.",
+            store="Benchmark Store",
+            batch=f"BATCH{number:05d}",
+            due_date=date.today() + timedelta(days=365),
+            stock=100,
+            price_per_unit=9.99,
+            provider_id=provider_id,
+        )
+        for number in range(rows)
+    ]
+
+
+async def _create_provider() -> str:
+    suffix = uuid.uuid4().hex[:12]
+    async with async_session_scope() as db:
+        provider = Provider(
+            name="Benchmark Provider",
+            rit=f"BENCH-{suffix}",
+            city="Bogotá",
+            country="Colombia",
+            email=f"benchmark-{suffix}@mail.com",
+            phone="3000000000",
+        )
+        db.add(provider)
+        await db.commit()
+
+        return provider.id
+
+
+async def _delete_provider(provider_id: str) -> None:
+    async with async_session_scope() as db:
+        await db.execute(delete(Provider).filter_by(id=provider_id))
+        await db.commit()
+
+
+async def _one_by_one(products: list[ProductCreateRequest]) -> int:
+    async with async_session_scope() as db:
+        for product in products:
+            await create_product(db=db, product_create_request=product)
+
+    return len(products)
+
+
+async def _bulk(products: list[ProductCreateRequest]) -> int:
+    async with async_session_scope() as db:
+        response = await create_products_bulk(
+            db=db,
+            product_create_bulk_request=ProductCreateBulkRequest(products=products),
+        )
+
+    return response.rows_inserted
+
+
+async def _run(*, mode: str, load, products: list[ProductCreateRequest]) -> None:
+    started = time.perf_counter()
+    rows_inserted = await load(products)
+    elapsed = time.perf_counter() - started
+
+    assert rows_inserted == len(products)
+    print(
+        f"mode={mode:<10} rows={rows_inserted:>6} seconds={elapsed:>7.2f} "
+        f"rows_per_second={rows_inserted / elapsed:>9.1f}"
+    )
+
+
+async def _main(*, rows: int, single_rows: int) -> None:
+    provider_id = await _create_provider()
+    try:
+        await _run(
+            mode="one_by_one",
+            load=_one_by_one,
+            products=_products(provider_id, single_rows),
+        )
+        await _run(mode="bulk", load=_bulk, products=_products(provider_id, rows))
+    finally:
+        await _delete_provider(provider_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--single-rows", type=int, default=1000)
+    arguments = parser.parse_args()
+    init_database()
+    init_async_database()
+
+    asyncio.run(_main(rows=arguments.rows, single_rows=arguments.single_rows))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Seeds a synthetic order history and compares the latency of ranking products by
+aggregating the order lines on every request with reading the materialized
+rankings used by GET /products/recommended.
+
+The benchmark deletes the rows it creates when it finishes. It needs a reachable
+database configured through the usual env vars.
+
+Usage: python -m benchmarks.recommendation_benchmark [--orders 20000] [--clients 200] [--products 500]
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, desc, func, insert, select
+
+from src.db.database import async_session_scope, init_async_database, init_database
+from src.models.db_models import (
+    DistributionCenter,
+    Order,
+    OrderProduct,
+    Product,
+    Provider,
+    User,
+)
+from src.models.enums.user_role import UserRole
+from src.services.product_ranking_service import rebuild_product_rankings
+from src.services.product_service import _get_ranked_products
+
+_LIMIT = 20
+_LINES_PER_ORDER = 3
+
+
+async def _aggregate_ranking(db, client_id: str | None) -> list[Product]:
+    query = (
+        select(
+            Product,
+            func.sum(OrderProduct.quantity).label("total_quantity"),
+            func.max(Order.created_at).label("last_purchase_date"),
+        )
+        .join(OrderProduct, Product.id == OrderProduct.product_id)
+        .join(Order, Order.id == OrderProduct.order_id)
+        .filter(Product.stock > 0)
+        .group_by(Product.id)
+        .order_by(desc("total_quantity"), desc("last_purchase_date"), Product.id)
+    )
+    if client_id:
+        query = query.filter(Order.client_id == client_id)
+
+    return [row[0] for row in (await db.execute(query.limit(_LIMIT))).all()]
+
+
+async def _materialized_ranking(db, client_id: str | None) -> list[Product]:
+    return await _get_ranked_products(db=db, limit=_LIMIT, client_id=client_id)
+
+
+async def _seed(*, orders: int, clients: int, products: int) -> dict[str, list[str]]:
+    suffix = uuid.uuid4().hex[:12]
+    seeded = {
+        "provider": [str(uuid.uuid4())],
+        "distribution_center": [str(uuid.uuid4())],
+        "clients": [str(uuid.uuid4()) for _ in range(clients)],
+        "products": [str(uuid.uuid4()) for _ in range(products)],
+        "orders": [str(uuid.uuid4()) for _ in range(orders)],
+    }
+    now = datetime.now(timezone.utc)
+    async with async_session_scope() as db:
+        await db.execute(
+            insert(Provider).values(
+                id=seeded["provider"][0],
+                name="Benchmark Provider",
+                rit=f"BENCH-{suffix}",
+                city="Bogotá",
+                country="Colombia",
+                email=f"benchmark-{suffix}@mail.com",
+                phone="3000000000",
+            )
+        )
+        await db.execute(
+            insert(DistributionCenter).values(
+                id=seeded["distribution_center"][0],
+                name="Benchmark Center",
+                address="Calle 1 # 2-3",
+                city="Bogotá",
+                country="Colombia",
+            )
+        )
+        await db.execute(
+            insert(User),
+            [
+                {
+                    "id": client_id,
+                    "full_name": "Benchmark Client",
+                    "email": f"benchmark-{suffix}-{number}@mail.com",
+                    "hashed_password": "x" * 60,
+                    "phone": "3000000000",
+                    "doi": f"BENCH-{suffix}-{number}",
+                    "role": UserRole.INSTITUTIONAL,
+                }
+                for number, client_id in enumerate(seeded["clients"])
+            ],
+        )
+        await db.execute(
+            insert(Product),
+            [
+                {
+                    "id": product_id,
+                    "name": f"Benchmark Product {number}",
+                    "details": "Product created by the recommendation benchmark.",
+                    "store": "Benchmark Store",
+                    "batch": f"BATCH{number:05d}",
+                    "due_date": date.today() + timedelta(days=365),
+                    "stock": 1000,
+                    "price_per_unit": 9.99,
+                    "provider_id": seeded["provider"][0],
+                }
+                for number, product_id in enumerate(seeded["products"])
+            ],
+        )
+        await db.execute(
+            insert(Order),
+            [
+                {
+                    "id": order_id,
+                    "delivery_date": date.today(),
+                    "client_id": random.choice(seeded["clients"]),
+                    "distribution_center_id": seeded["distribution_center"][0],
+                    "created_at": now - timedelta(minutes=number),
+                }
+                for number, order_id in enumerate(seeded["orders"])
+            ],
+        )
+        await db.execute(
+            insert(OrderProduct),
+            [
+                {
+                    "order_id": order_id,
+                    "product_id": product_id,
+                    "quantity": random.randint(1, 20),
+                }
+                for order_id in seeded["orders"]
+                for product_id in random.sample(seeded["products"], _LINES_PER_ORDER)
+            ],
+        )
+        await db.commit()
+
+    return seeded
+
+
+async def _cleanup(seeded: dict[str, list[str]]) -> None:
+    async with async_session_scope() as db:
+        await db.execute(delete(Order).filter(Order.id.in_(seeded["orders"])))
+        await db.execute(delete(User).filter(User.id.in_(seeded["clients"])))
+        await db.execute(delete(Product).filter(Product.id.in_(seeded["products"])))
+        await db.execute(
+            delete(DistributionCenter).filter_by(id=seeded["distribution_center"][0])
+        )
+        await db.execute(delete(Provider).filter_by(id=seeded["provider"][0]))
+        await db.commit()
+
+
+async def _run(*, mode: str, rank, client_ids: list[str]) -> None:
+    latencies = []
+    async with async_session_scope() as db:
+        for client_id in client_ids:
+            started = time.perf_counter()
+            await rank(db, client_id)
+            latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    print(
+        f"mode={mode:<12} requests={len(latencies):>5} "
+        f"p50_ms={statistics.median(latencies):>8.3f} "
+        f"p95_ms={latencies[int(len(latencies) * 0.95)]:>8.3f}"
+    )
+
+
+async def _main(*, orders: int, clients: int, products: int, requests: int) -> None:
+    seeded = await _seed(orders=orders, clients=clients, products=products)
+    try:
+        async with async_session_scope() as db:
+            started = time.perf_counter()
+            rankings_count = await rebuild_product_rankings(db=db)
+        print(
+            f"rebuild rankings={rankings_count} "
+            f"seconds={time.perf_counter() - started:.2f}"
+        )
+
+        client_ids = [random.choice(seeded["clients"]) for _ in range(requests)]
+        async with async_session_scope() as db:
+            for client_id in client_ids[:10]:
+                assert [p.id for p in await _aggregate_ranking(db, client_id)] == [
+                    p.id for p in await _materialized_ranking(db, client_id)
+                ]
+        await _run(mode="aggregate", rank=_aggregate_ranking, client_ids=client_ids)
+        await _run(
+            mode="materialized", rank=_materialized_ranking, client_ids=client_ids
+        )
+    finally:
+        await _cleanup(seeded)
+        async with async_session_scope() as db:
+            await rebuild_product_rankings(db=db)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, default=20000)
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    arguments = parser.parse_args()
+    init_database()
+    init_async_database()
+
+    asyncio.run(
+        _main(
+            orders=arguments.orders,
+            clients=arguments.clients,
+            products=arguments.products,
+            requests=arguments.requests,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
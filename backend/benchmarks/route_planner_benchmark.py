@@ -0,0 +1,64 @@
+"""
+Times the multi-vehicle route planner over synthetic order sets.
+
+Usage: python -m benchmarks.route_planner_benchmark [--orders 500 2000 5000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from src.services.route_optimization_service import plan_vehicle_routes
+
+_DEPOT = (4.6534, -74.0836)
+
+
+def _run(*, orders: int, vehicle_capacity: int, max_stops: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    stops = [
+        (latitude, longitude)
+        for latitude, longitude in zip(
+            rng.normal(_DEPOT[0], 0.08, orders), rng.normal(_DEPOT[1], 0.08, orders)
+        )
+    ]
+    demands = rng.integers(1, 40, orders).tolist()
+
+    started = time.perf_counter()
+    plan = plan_vehicle_routes(
+        stops=stops,
+        demands=demands,
+        depot=_DEPOT,
+        vehicle_count=orders,
+        vehicle_capacity=vehicle_capacity,
+        max_stops=max_stops,
+    )
+    elapsed = time.perf_counter() - started
+
+    distance = sum(tour.distance_km for tour in plan.tours)
+    print(
+        f"orders={orders:>6} routes={len(plan.tours):>4} "
+        f"unassigned={len(plan.unassigned):>4} distance_km={distance:>10.1f} "
+        f"seconds={elapsed:.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--orders", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--vehicle-capacity", type=int, default=400)
+    parser.add_argument("--max-stops", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=7)
+    arguments = parser.parse_args()
+
+    for orders in arguments.orders:
+        _run(
+            orders=orders,
+            vehicle_capacity=arguments.vehicle_capacity,
+            max_stops=arguments.max_stops,
+            seed=arguments.seed,
+        )
+
+
+if __name__ == "__main__":
+    main()
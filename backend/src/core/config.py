@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import EmailStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -8,15 +10,56 @@ class Settings(BaseSettings):
     postgres_host: str
     postgres_port: int
     postgres_db: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_echo: bool = False
+    db_statement_timeout_ms: int = 30000
+    db_application_name: str = "medisupply-api"
+    db_null_pool: bool = False
     otp_expiration_minutes: int = 1
+    otp_sweep_interval_seconds: int = 300
+    otp_sweep_batch_size: int = 1000
+    principal_cache_ttl_seconds: int = 30
+    principal_cache_size: int = 10000
+    bcrypt_rounds: int = 12
+    password_hashing_workers: int = 4
     jwt_secret_key: str
     jwt_algorithm: str
     access_token_expire_minutes: int
     email_sender: EmailStr
     email_api_key: str
+    email_backend: Literal["smtp", "local"] = "smtp"
+    smtp_host: str = "smtp.gmail.com"
+    smtp_port: int = 465
+    smtp_timeout_seconds: float = 10.0
+    email_worker_batch_size: int = 50
+    email_worker_poll_seconds: float = 5.0
+    email_max_attempts: int = 5
+    email_retry_backoff_seconds: float = 30.0
+    email_templates_reload: bool = False
     cors_origins: str
     login_url: str
     google_maps_api_key: str
+    google_maps_timeout_seconds: float = 5.0
+    google_maps_queries_per_second: int = 10
+    google_maps_max_retries: int = 2
+    google_maps_retry_backoff_seconds: float = 0.5
+    google_maps_pool_size: int = 10
+    geocoder_backend: Literal["google", "local"] = "google"
+    geocoding_cache_size: int = 1024
+    geocoding_cache_ttl_hours: int = 720
+    client_import_max_rows: int = 200
+    client_import_batch_size: int = 500
+    client_import_geocoding_workers: int = 8
+    client_import_hashing_workers: int = 2
+    product_import_batch_size: int = 1000
+    product_import_max_error_details: int = 1000
+    recommendation_history_size: int = 20
+    recommendation_neighbors_top_k: int = 20
+    catalog_cache_ttl_seconds: int = 30
     bucket_name: str
     gcp_credentials: str
 
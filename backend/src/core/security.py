@@ -1,18 +1,25 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 import bcrypt
 import jwt
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
 from src.core.logging_config import logger
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import ApiError, ForbiddenException, UnauthorizedException
 from src.models.db_models import User
 from src.models.enums.user_role import UserRole
+from src.services.principal_cache_service import Principal, get_principal
+
+PRINCIPAL_CLAIMS = ("sub", "role", "seller_id", "zone_id")
 
 security = HTTPBearer(
     scheme_name="Access Token",
@@ -26,10 +33,13 @@ security = HTTPBearer(
     """,
 )
 
+_password_pool: ThreadPoolExecutor | None = None
+_password_pool_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     pw_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     hashed = bcrypt.hashpw(pw_bytes, salt)
     return hashed.decode("utf-8")
 
@@ -40,6 +50,51 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     )
 
 
+async def hash_password_async(password: str) -> str:
+    return await _run_in_password_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_password_pool(verify_password, plain_password, hashed_password)
+
+
+async def _run_in_password_pool(function: Callable[..., Any], *args: Any) -> Any:
+    # bcrypt releases the GIL, so a small thread pool hashes in parallel while
+    # keeping the event loop free and bounding the CPU spent on logins.
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_password_pool(), function, *args
+    )
+
+
+def _get_password_pool() -> ThreadPoolExecutor:
+    global _password_pool
+    with _password_pool_lock:
+        if _password_pool is None:
+            _password_pool = ThreadPoolExecutor(
+                max_workers=settings.password_hashing_workers,
+                thread_name_prefix="password-hashing",
+            )
+
+        return _password_pool
+
+
+def shutdown_password_pool() -> None:
+    global _password_pool
+    with _password_pool_lock:
+        if _password_pool is not None:
+            _password_pool.shutdown(wait=False)
+        _password_pool = None
+
+
+def get_principal_claims(user: User) -> dict[str, Any]:
+    return {
+        "sub": str(user.id),
+        "role": user.role.value,
+        "seller_id": user.seller_id,
+        "zone_id": user.zone_id,
+    }
+
+
 def create_access_token(data: dict[str, Any]) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(
@@ -53,25 +108,54 @@ def create_access_token(data: dict[str, Any]) -> str:
     return encoded_jwt
 
 
-def get_current_user(
+def _decode_token(
+    http_authorization_credentials: HTTPAuthorizationCredentials,
+) -> dict[str, Any]:
+    payload = jwt.decode(
+        http_authorization_credentials.credentials,
+        settings.jwt_secret_key,
+        algorithms=[settings.jwt_algorithm],
+    )
+    sub: str = payload.get("sub")
+    role: str = payload.get("role")
+    if sub is None or role is None:
+        raise UnauthorizedException("Token is invalid or has expired.")
+
+    return payload
+
+
+def _get_principal_from_claims(payload: dict[str, Any]) -> Principal | None:
+    # Tokens issued before the principal claims were added fall back to the
+    # cached lookup.
+    if not all(claim in payload for claim in PRINCIPAL_CLAIMS):
+        return None
+    try:
+        role = UserRole(payload["role"])
+    except ValueError:
+        raise UnauthorizedException("Token is invalid or has expired.")
+
+    return Principal(
+        id=payload["sub"],
+        role=role,
+        seller_id=payload["seller_id"],
+        zone_id=payload["zone_id"],
+    )
+
+
+async def get_current_principal(
     http_authorization_credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
-) -> User:
+    db: AsyncSession = Depends(get_async_db),
+) -> Principal:
+    """Authorizes from the signed claims; Postgres is only read for older tokens."""
     try:
-        payload = jwt.decode(
-            http_authorization_credentials.credentials,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
+        payload = _decode_token(http_authorization_credentials)
+        principal = _get_principal_from_claims(payload) or await get_principal(
+            db=db, user_id=payload["sub"]
         )
-        sub: str = payload.get("sub")
-        role: str = payload.get("role")
-        if sub is None or role is None:
-            raise UnauthorizedException("Token is invalid or has expired.")
-        user: User | None = db.query(User).filter_by(id=sub).first()
-        if not user:
+        if not principal:
             raise UnauthorizedException("Token is invalid or has expired.")
 
-        return user
+        return principal
     except jwt.PyJWTError as e:
         logger.error(f"JWT decoding error: {e}")
         raise UnauthorizedException("Token is invalid or has expired.") from e
@@ -82,10 +166,23 @@ def get_current_user(
         raise ApiError("An error occurred while processing the token.") from e
 
 
+async def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    user: User | None = await db.scalar(select(User).filter_by(id=principal.id))
+    if not user:
+        raise UnauthorizedException("Token is invalid or has expired.")
+
+    return user
+
+
 def require_roles(
     allowed_roles: list[UserRole],
-) -> Callable[[User], User]:
-    def role_checker(current_user: User = Depends(get_current_user)) -> User:
+) -> Callable[[Principal], Awaitable[Principal]]:
+    async def role_checker(
+        current_user: Principal = Depends(get_current_principal),
+    ) -> Principal:
         if current_user.role not in allowed_roles:
             raise ForbiddenException(
                 f"Access denied: requires one of the following roles: {', '.join(r.value for r in allowed_roles)}"
@@ -1,6 +1,27 @@
+import hashlib
+import json
 import os
+from typing import Any
 
 
 def get_template_path(template_name: str) -> str:
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     return os.path.join(base_dir, "templates", template_name)
+
+
+def compute_etag(content: Any) -> str:
+    encoded_content = json.dumps(content, sort_keys=True, separators=(",", ":"))
+
+    return f'"{hashlib.sha256(encoded_content.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Applies the weak comparison If-None-Match uses, list and `*` forms included."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
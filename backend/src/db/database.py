@@ -1,10 +1,26 @@
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator
+
+from sqlalchemy import Connection, Engine, QueuePool, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.schema import CreateColumn, CreateIndex
 
-from src.db.database_util import get_database_engine
+from src.core.logging_config import logger
+from src.db.database_util import (
+    get_async_database_engine,
+    get_database_engine,
+    get_max_connections_per_worker,
+)
 
 Base = declarative_base()
-_engine = None
+_SCHEMA_LOCK_ID = 4501
+# Indexes removed from the models that existing databases may still hold.
+_DROPPED_INDEXES = ("ix_users_role",)
+_engine: Engine | None = None
 _session_factory: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
 
 
 def init_database() -> None:
@@ -12,6 +28,66 @@ def init_database() -> None:
     _engine = get_database_engine()
     _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
     Base.metadata.create_all(bind=_engine)
+    _add_missing_columns(engine=_engine)
+    _create_missing_indexes(engine=_engine)
+    logger.info(
+        f"Database engine configured with up to [{get_max_connections_per_worker()}] connections per worker"
+    )
+
+
+def _add_missing_columns(*, engine: Engine) -> None:
+    # create_all does not alter existing tables either. Only nullable columns can
+    # be added safely this way; anything stricter needs a real migration.
+    with engine.begin() as connection:
+        _lock_schema(connection=connection)
+        inspector = inspect(connection)
+        for table in Base.metadata.sorted_tables:
+            existing_columns = {
+                column["name"] for column in inspector.get_columns(table.name)
+            }
+            for column in table.columns:
+                if column.name in existing_columns or not column.nullable:
+                    continue
+                ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                connection.execute(
+                    text(f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {ddl}")
+                )
+
+
+def _lock_schema(*, connection: Connection) -> None:
+    # Every worker runs these steps at startup; the lock lasts until the
+    # transaction ends, so they take turns instead of racing on the same DDL.
+    connection.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": _SCHEMA_LOCK_ID}
+    )
+
+
+def _create_missing_indexes(*, engine: Engine) -> None:
+    # create_all skips tables that already exist, so indexes added to existing
+    # models have to be created on their own.
+    with engine.begin() as connection:
+        _lock_schema(connection=connection)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+        for index_name in _DROPPED_INDEXES:
+            connection.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+
+def init_async_database() -> None:
+    global _async_engine, _async_session_factory
+    _async_engine = get_async_database_engine()
+    _async_session_factory = async_sessionmaker(
+        bind=_async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+async def dispose_async_database() -> None:  # pragma: no cover
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
 
 
 def get_db() -> sessionmaker:
@@ -22,3 +98,37 @@ def get_db() -> sessionmaker:
         yield db
     finally:
         db.close()
+
+
+@asynccontextmanager
+async def async_session_scope() -> AsyncGenerator[AsyncSession, None]:
+    if _async_session_factory is None:
+        init_async_database()
+    async with _async_session_factory() as db:
+        yield db
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session_scope() as db:
+        yield db
+
+
+def get_pool_stats() -> dict[str, Any]:
+    if _async_engine is None:
+        init_async_database()
+    pool = _async_engine.pool
+    stats = {
+        "pool_class": type(pool).__name__,
+        "max_connections": get_max_connections_per_worker(),
+    }
+    if isinstance(pool, QueuePool):
+        stats.update(
+            {
+                "pool_size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+            }
+        )
+
+    return stats
@@ -1,4 +1,7 @@
-from sqlalchemy import create_engine
+from typing import Any
+
+from sqlalchemy import Engine, NullPool, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from src.core.config import settings
 
@@ -10,8 +13,57 @@ def get_standard_postgres_connection() -> str:
     )
 
 
-def get_database_engine() -> create_engine:
+def get_async_postgres_connection() -> str:
+    return (
+        f"postgresql+asyncpg://{settings.postgres_user}:{settings.postgres_password}@"
+        f"{settings.postgres_host}:{settings.postgres_port}/{settings.postgres_db}"
+    )
+
+
+def get_database_engine() -> Engine:
     db_url = get_standard_postgres_connection()
-    engine = create_engine(db_url, echo=True)
+    engine = create_engine(
+        db_url,
+        echo=settings.db_echo,
+        **_get_pool_options(),
+        connect_args={
+            "application_name": settings.db_application_name,
+            "options": f"-c statement_timeout={settings.db_statement_timeout_ms}",
+        },
+    )
 
     return engine
+
+
+def get_async_database_engine() -> AsyncEngine:
+    db_url = get_async_postgres_connection()
+    engine = create_async_engine(
+        db_url,
+        echo=settings.db_echo,
+        **_get_pool_options(),
+        connect_args={
+            "server_settings": {
+                "application_name": settings.db_application_name,
+                "statement_timeout": str(settings.db_statement_timeout_ms),
+            },
+        },
+    )
+
+    return engine
+
+
+def get_max_connections_per_worker() -> int:
+    return settings.db_pool_size + settings.db_max_overflow
+
+
+def _get_pool_options() -> dict[str, Any]:
+    if settings.db_null_pool:
+        return {"poolclass": NullPool}
+
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
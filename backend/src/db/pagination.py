@@ -0,0 +1,84 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.errors.errors import BadRequestException
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+    total_count: int | None = None
+
+
+async def paginate(
+    *,
+    db: AsyncSession,
+    query: Select,
+    keys: tuple[InstrumentedAttribute, ...],
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page:
+    total_count = (
+        await db.scalar(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        if include_total
+        else None
+    )
+    query = query.order_by(*keys)
+    if cursor:
+        query = query.filter(tuple_(*keys) > tuple_(*decode_cursor(cursor, keys)))
+    if limit:
+        query = query.limit(limit + 1)
+
+    items = list(await db.scalars(query))
+    next_cursor = None
+    if limit and len(items) > limit:
+        items = items[:limit]
+        next_cursor = _encode_cursor(items[-1], keys)
+
+    return Page(items=items, next_cursor=next_cursor, total_count=total_count)
+
+
+def _encode_cursor(item: Any, keys: tuple[InstrumentedAttribute, ...]) -> str:
+    return encode_cursor([getattr(item, key.key) for key in keys])
+
+
+def encode_cursor(values: list[Any]) -> str:
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    )
+
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, keys: tuple[InstrumentedAttribute, ...]) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("Cursor does not match the pagination keys")
+
+        return [_parse_value(value, key) for value, key in zip(values, keys)]
+    except (ValueError, TypeError):
+        raise BadRequestException("Invalid pagination cursor")
+
+
+def _parse_value(value: Any, key: InstrumentedAttribute) -> Any:
+    python_type = key.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+
+    return python_type(value)
@@ -4,7 +4,12 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.config import settings
 from src.core.logging_config import logger
-from src.db.database import init_database
+from src.core.security import shutdown_password_pool
+from src.db.database import (
+    dispose_async_database,
+    init_async_database,
+    init_database,
+)
 from src.errors.exception_handlers import setup_exception_handlers
 from src.routers.auth_router import auth_router
 from src.routers.client_router import client_router
@@ -19,6 +24,13 @@ from src.routers.seller_router import seller_router
 from src.routers.selling_plan_router import selling_plan_router
 from src.routers.visit_router import visit_router
 from src.routers.zone_router import zone_router
+from src.services.client_import_service import shutdown_client_import_pools
+from src.services.email_outbox_service import start_email_worker, stop_email_worker
+from src.services.email_service import set_mailer
+from src.services.email_template_service import get_template_registry
+from src.services.geocoding_service import set_geocoder
+from src.services.otp_service import start_otp_sweeper, stop_otp_sweeper
+from src.services.permission_service import init_permission_index
 
 version = "1.0"
 prefix = f"/api/v{version.split('.')[0]}"
@@ -55,4 +67,22 @@ def startup_event():  # pragma: no cover
     logger.info("Starting up the application...")
     load_dotenv(override=True)
     init_database()
+    init_async_database()
+    get_template_registry()
+    init_permission_index(app.routes)
+    start_email_worker()
+    start_otp_sweeper()
     logger.info("Application startup complete")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():  # pragma: no cover
+    logger.info("Shutting down the application...")
+    await stop_email_worker()
+    await stop_otp_sweeper()
+    set_mailer(None)
+    await dispose_async_database()
+    set_geocoder(None)
+    shutdown_client_import_pools()
+    shutdown_password_pool()
+    logger.info("Application shutdown complete")
@@ -3,18 +3,23 @@ from datetime import date, datetime, timezone
 from typing import Optional
 
 from sqlalchemy import (
+    JSON,
+    BigInteger,
     Boolean,
     Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from src.db.database import Base
+from src.models.enums.email_status import EmailStatus
 from src.models.enums.order_status import OrderStatus
 from src.models.enums.user_role import UserRole
 from src.models.enums.visit_status import VisitStatus
@@ -22,6 +27,7 @@ from src.models.enums.visit_status import VisitStatus
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (Index("ix_users_seller_id_role", "seller_id", "role"),)
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
@@ -107,6 +113,16 @@ class User(Base):
 
 class OTP(Base):
     __tablename__ = "otps"
+    __table_args__ = (
+        Index(
+            "ix_otps_user_id_code_is_used_expires_at",
+            "user_id",
+            "code",
+            "is_used",
+            "expires_at",
+        ),
+        Index("ix_otps_expires_at", "expires_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
@@ -257,6 +273,8 @@ class DistributionCenter(Base):
     address: Mapped[str] = mapped_column(String(255), nullable=False)
     city: Mapped[str] = mapped_column(String(100), nullable=False)
     country: Mapped[str] = mapped_column(String(100), nullable=False)
+    latitude: Mapped[Optional[float]] = mapped_column(nullable=True)
+    longitude: Mapped[Optional[float]] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -274,6 +292,24 @@ class DistributionCenter(Base):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        Index(
+            "ix_orders_seller_id_delivery_date_status",
+            "seller_id",
+            "delivery_date",
+            "status",
+        ),
+        Index(
+            "ix_orders_client_id_delivery_date_status",
+            "client_id",
+            "delivery_date",
+            "status",
+        ),
+        Index("ix_orders_seller_id_created_at", "seller_id", "created_at"),
+        Index("ix_orders_distribution_center_id", "distribution_center_id"),
+        Index("ix_orders_route_id", "route_id"),
+        Index("ix_orders_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
@@ -308,6 +344,7 @@ class Order(Base):
         ForeignKey("routes.id", ondelete="SET NULL"),
         nullable=True,
     )
+    stop_sequence: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     seller: Mapped[Optional["User"]] = relationship(
         "User", foreign_keys=[seller_id], back_populates="managed_orders"
     )
@@ -328,6 +365,10 @@ class Order(Base):
 
 class OrderProduct(Base):
     __tablename__ = "order_products"
+    __table_args__ = (
+        Index("ix_order_products_order_id", "order_id"),
+        Index("ix_order_products_product_id_order_id", "product_id", "order_id"),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
@@ -367,8 +408,41 @@ class Geolocation(Base):
     )
 
 
+class GeocodedAddress(Base):
+    __tablename__ = "geocoded_addresses"
+
+    normalized_address: Mapped[str] = mapped_column(String(255), primary_key=True)
+    formatted_address: Mapped[str] = mapped_column(String(255), nullable=False)
+    latitude: Mapped[float] = mapped_column(nullable=False)
+    longitude: Mapped[float] = mapped_column(nullable=False)
+    precision: Mapped[str] = mapped_column(String(30), nullable=False)
+    raw: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+
+
 class Visit(Base):
     __tablename__ = "visits"
+    __table_args__ = (
+        Index(
+            "ix_visits_seller_id_expected_date_status",
+            "seller_id",
+            "expected_date",
+            "status",
+        ),
+        Index(
+            "ix_visits_client_id_expected_date_status",
+            "client_id",
+            "expected_date",
+            "status",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
         String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
@@ -437,6 +511,7 @@ class Route(Base):
     vehicle_plate: Mapped[str] = mapped_column(String(20), nullable=False)
     restrictions: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     delivery_deadline: Mapped[date] = mapped_column(Date, nullable=False)
+    estimated_distance_km: Mapped[Optional[float]] = mapped_column(nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -455,4 +530,133 @@ class Route(Base):
         "Order",
         back_populates="route",
         cascade="save-update",
+        order_by="Order.stop_sequence",
+    )
+
+
+class SalesDailyRollup(Base):
+    __tablename__ = "sales_daily_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "day",
+            "seller_id",
+            "product_id",
+            "zone_id",
+            "status",
+            name="sales_daily_rollup_bucket_constraint",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("ix_sales_daily_rollups_seller_id_day", "seller_id", "day"),
+        Index("ix_sales_daily_rollups_product_id_day", "product_id", "day"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
+    )
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    status: Mapped[OrderStatus] = mapped_column(Enum(OrderStatus), nullable=False)
+    units: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    revenue: Mapped[float] = mapped_column(nullable=False, default=0)
+    order_lines: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    seller_id: Mapped[Optional[str]] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+    )
+    product_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("products.id", ondelete="CASCADE"), nullable=False
+    )
+    zone_id: Mapped[Optional[str]] = mapped_column(
+        String(36), ForeignKey("zones.id", ondelete="CASCADE"), nullable=True
+    )
+
+
+class ProductRanking(Base):
+    __tablename__ = "product_rankings"
+    __table_args__ = (
+        # A null client holds the ranking across every client.
+        UniqueConstraint(
+            "client_id",
+            "product_id",
+            name="product_ranking_client_product_constraint",
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index(
+            "ix_product_rankings_client_id_units_last_purchase_at",
+            "client_id",
+            "units",
+            "last_purchase_at",
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
+    )
+    units: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_purchase_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    client_id: Mapped[Optional[str]] = mapped_column(
+        String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+    )
+    product_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("products.id", ondelete="CASCADE"), nullable=False
+    )
+
+
+class ProductNeighbor(Base):
+    __tablename__ = "product_neighbors"
+    __table_args__ = (
+        UniqueConstraint(
+            "product_id", "neighbor_id", name="product_neighbor_pair_constraint"
+        ),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
+    )
+    score: Mapped[float] = mapped_column(nullable=False)
+    product_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("products.id", ondelete="CASCADE"), nullable=False
+    )
+    neighbor_id: Mapped[str] = mapped_column(
+        String(36), ForeignKey("products.id", ondelete="CASCADE"), nullable=False
+    )
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_versions"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[str] = mapped_column(
+        String(36), primary_key=True, index=True, default=lambda: str(uuid.uuid4())
+    )
+    email_receiver: Mapped[str] = mapped_column(String(120), nullable=False)
+    email_subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Cleared once delivered, so one-time codes and passwords do not linger.
+    email_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    status: Mapped[EmailStatus] = mapped_column(
+        Enum(EmailStatus), nullable=False, default=EmailStatus.PENDING
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
     )
@@ -0,0 +1,6 @@
+import enum
+
+
+class ReportFormat(enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
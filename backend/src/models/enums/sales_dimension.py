@@ -0,0 +1,9 @@
+import enum
+
+
+class SalesDimension(enum.Enum):
+    DAY = "day"
+    SELLER = "seller"
+    PRODUCT = "product"
+    ZONE = "zone"
+    STATUS = "status"
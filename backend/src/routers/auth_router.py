@@ -1,14 +1,11 @@
-from collections import defaultdict
+from fastapi import APIRouter, Depends, Header, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse, Response
 
-from fastapi import APIRouter, Depends, status
-from fastapi.routing import APIRoute
-from sqlalchemy.orm import Session
-from starlette.responses import JSONResponse
-
-from src.core.security import get_current_user, require_roles
-from src.db.database import get_db
+from src.core.security import get_current_principal, require_roles
+from src.core.utils import compute_etag, etag_matches
+from src.db.database import get_async_db
 from src.errors.errors import UnauthorizedException
-from src.models.db_models import User
 from src.models.enums.user_role import UserRole
 from src.schemas.auth_schema import (
     LoginRequest,
@@ -18,6 +15,8 @@ from src.schemas.auth_schema import (
 )
 from src.schemas.user_schema import UserCreateRequest, UserResponse
 from src.services.auth_service import login_user, verify_otp_and_get_token
+from src.services.permission_service import get_role_permissions
+from src.services.principal_cache_service import Principal
 from src.services.user_service import create_user, get_user_by_email
 
 auth_router = APIRouter(prefix="/auth", tags=["Auth"])
@@ -56,9 +55,9 @@ Create a new user account.
 async def register_user(
     *,
     user_create_request: UserCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> UserResponse:
-    return create_user(db=db, user_create_request=user_create_request)
+    return await create_user(db=db, user_create_request=user_create_request)
 
 
 @auth_router.post(
@@ -80,9 +79,9 @@ If the credentials are valid, an OTP is generated and sent via email.
 """,
 )
 async def login(
-    *, login_request: LoginRequest, db: Session = Depends(get_db)
+    *, login_request: LoginRequest, db: AsyncSession = Depends(get_async_db)
 ) -> LoginResponse:
-    otp_expiration_minutes = login_user(db=db, login_request=login_request)
+    otp_expiration_minutes = await login_user(db=db, login_request=login_request)
 
     return LoginResponse(
         message="OTP generated successfully",
@@ -112,13 +111,13 @@ If valid, a JWT access token is returned.
 async def verify_otp(
     *,
     otp_verify_request: OTPVerifyRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> OTPVerifyResponse:
-    user = get_user_by_email(db=db, email=otp_verify_request.email)
+    user = await get_user_by_email(db=db, email=otp_verify_request.email)
     if not user:
         raise UnauthorizedException("Invalid or expired OTP")
 
-    access_token = verify_otp_and_get_token(
+    access_token = await verify_otp_and_get_token(
         db=db, otp_verify_request=otp_verify_request, user=user
     )
 
@@ -134,7 +133,13 @@ async def verify_otp(
     "/permissions",
     status_code=status.HTTP_200_OK,
     summary="Dynamically check accessible endpoints by role",
-    description="Retrieve a list of API endpoints accessible to the current user based on their role.",
+    description="""
+Retrieve a list of API endpoints accessible to the current user based on their role.
+
+The endpoint list is computed once from the route table and the user (`id`, `role`) comes from the access token,
+so the database is not queried. The response carries an `ETag`; send it back in `If-None-Match` to receive
+`304 Not Modified` while the user and the routes are unchanged.
+""",
     dependencies=[
         Depends(
             require_roles(
@@ -148,47 +153,23 @@ async def verify_otp(
     ],
 )
 def get_permissions(
-    current_user: User = Depends(get_current_user),
-) -> JSONResponse:  # pragma: no cover
-    user_role = current_user.role.value
-    grouped = defaultdict(set)
-    from src.main import app
-
-    for route in app.routes:
-        if not isinstance(route, APIRoute):
-            continue
-
-        roles = []
-        for dep in route.dependant.dependencies:
-            if hasattr(dep.call, "allowed_roles"):
-                roles.extend([r.value for r in dep.call.allowed_roles])
-        for dep in getattr(route.dependant, "path_dependencies", []):
-            if hasattr(dep.call, "allowed_roles"):
-                roles.extend([r.value for r in dep.call.allowed_roles])
-
-        roles = list(set(roles)) or ["public"]
-
-        if "public" in roles or user_role in roles:
-            grouped[(route.path, frozenset(roles))].update(
-                route.methods - {"HEAD", "OPTIONS"}
-            )
-
-    allowed_endpoints = [
-        {
-            "path": path,
-            "methods": sorted(list(methods)),
-            "allowed_roles": sorted(list(roles)),
-        }
-        for (path, roles), methods in grouped.items()
-    ]
+    current_user: Principal = Depends(get_current_principal),
+    if_none_match: str | None = Header(None),
+) -> Response:
+    # Everything comes from the token and the startup index, so a revalidation
+    # never reaches the database.
+    role_permissions = get_role_permissions(current_user.role)
+    user = {"id": current_user.id, "role": current_user.role.value}
+    etag = compute_etag({"user": user, "allowed_endpoints": role_permissions.etag})
+    if etag_matches(if_none_match, etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
 
     return JSONResponse(
         content={
-            "user": {
-                "id": str(current_user.id),
-                "email": current_user.email,
-                "role": current_user.role.value,
-            },
-            "allowed_endpoints": allowed_endpoints,
-        }
+            "user": user,
+            "allowed_endpoints": role_permissions.allowed_endpoints,
+        },
+        headers={"ETag": etag},
     )
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.security import require_roles
-from src.db.database import get_db
-from src.models.db_models import User
+from src.db.database import get_async_db
 from src.models.enums.user_role import UserRole
-from src.schemas.client_schema import GetClientsResponse
+from src.schemas.client_schema import ClientCreateBulkResponse, GetClientsResponse
+from src.services.client_import_service import CLIENT_IMPORT_COLUMNS, import_clients
+from src.services.principal_cache_service import Principal
 from src.services.seller_service import get_clients_by_seller_id
 
 client_router = APIRouter(
@@ -36,9 +38,46 @@ Returns a list of clients of the seller with the following details for each clie
 )
 async def get_clients(
     *,
-    current_user: User = Depends(require_roles(allowed_roles=[UserRole.COMMERCIAL])),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(
+        require_roles(allowed_roles=[UserRole.COMMERCIAL])
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetClientsResponse:
-    clients = get_clients_by_seller_id(db=db, seller_id=current_user.id)
+    clients = await get_clients_by_seller_id(db=db, seller_id=current_user.id)
 
     return GetClientsResponse(total_count=len(clients), clients=clients)
+
+
+@client_router.post(
+    "-batch",
+    response_model=ClientCreateBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import institutional clients in bulk",
+    dependencies=[Depends(require_roles(allowed_roles=[UserRole.ADMIN]))],
+    description=f"""
+Import institutional clients from a CSV or JSON file.
+
+### Request Body
+- **file**: A `.json` file with a list of clients or a CSV file with the header
+`{",".join(CLIENT_IMPORT_COLUMNS)}`. Each client follows the same rules as `POST /auth/register`.
+The import runs within the request, so a file holds at most {settings.client_import_max_rows} clients.
+
+Repeated addresses are geocoded once, each client is assigned to the seller with the fewest clients and rows are
+inserted in batches. Invalid rows are reported without stopping the import.
+
+### Response
+- **success**: Indicates if every client was imported.
+- **rows_total**: Total number of clients in the file.
+- **rows_inserted**: Number of clients imported.
+- **errors**: Number of clients that could not be imported.
+- **errors_details**: Error message for each client that could not be imported, with its row number.
+""",
+)
+async def import_clients_bulk(
+    *,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+) -> ClientCreateBulkResponse:
+    return await import_clients(
+        db=db, content=await file.read(), filename=file.filename
+    )
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
 from src.models.enums.user_role import UserRole
 from src.schemas.distribution_center_schema import (
+    DistributionCenterCreateRequest,
     DistributionCenterResponse,
     GetDistributionCentersResponse,
 )
 from src.services.distribution_center_service import (
+    create_distribution_center,
     get_distribution_center_by_id,
     get_distribution_centers,
 )
@@ -31,6 +33,48 @@ distribution_center_router = APIRouter(
 )
 
 
+@distribution_center_router.post(
+    "",
+    response_model=DistributionCenterResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Register a new distribution center",
+    dependencies=[Depends(require_roles(allowed_roles=[UserRole.ADMIN]))],
+    description="""
+Register a new distribution center. Optimized routes start and end at its coordinates.
+
+### Request Body
+- **name**: Name of the distribution center (1-100 characters)
+- **address**: Address of the distribution center (1-255 characters)
+- **city**: City where the distribution center is located (1-100 characters)
+- **country**: Country where the distribution center is located (1-100 characters)
+- **latitude**: (Optional) Latitude of the distribution center (-90 to 90)
+- **longitude**: (Optional) Longitude of the distribution center (-180 to 180)
+
+When the coordinates are omitted, the address, city and country are geocoded.
+
+### Response
+- **id**: Unique identifier of the distribution center.
+- **name**: Name of the distribution center.
+- **address**: Address of the distribution center.
+- **city**: City where the distribution center is located.
+- **country**: Country where the distribution center is located.
+- **latitude**: Latitude of the distribution center.
+- **longitude**: Longitude of the distribution center.
+- **created_at**: Timestamp when the distribution center was created.
+- **orders**: List of orders associated with the distribution center.
+- **routes**: List of routes associated with the distribution center.
+""",
+)
+async def register_distribution_center(
+    *,
+    distribution_center_create_request: DistributionCenterCreateRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> DistributionCenterResponse:
+    return await create_distribution_center(
+        db=db, distribution_center_create_request=distribution_center_create_request
+    )
+
+
 @distribution_center_router.get(
     "",
     response_model=GetDistributionCentersResponse,
@@ -46,13 +90,15 @@ Returns a list of distribution centers with the following details for each cente
 - **address**: Address of the distribution center.
 - **city**: City where the distribution center is located.
 - **country**: Country where the distribution center is located.
+- **latitude**: Latitude of the distribution center.
+- **longitude**: Longitude of the distribution center.
 - **created_at**: Timestamp when the distribution center was created.
 """,
 )
 async def get_all_distribution_centers(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetDistributionCentersResponse:
-    distribution_centers = get_distribution_centers(db=db)
+    distribution_centers = await get_distribution_centers(db=db)
 
     return GetDistributionCentersResponse(
         total_count=len(distribution_centers), distribution_centers=distribution_centers
@@ -76,15 +122,17 @@ Retrieve details of a specific distribution center by its ID.
 - **address**: Address of the distribution center.
 - **city**: City where the distribution center is located.
 - **country**: Country where the distribution center is located.
+- **latitude**: Latitude of the distribution center.
+- **longitude**: Longitude of the distribution center.
 - **created_at**: Timestamp when the distribution center was created.
 - **orders**: List of orders associated with the distribution center.
 """,
 )
 async def get_distribution_center(
     distribution_center_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DistributionCenterResponse:
-    distribution_center = get_distribution_center_by_id(
+    distribution_center = await get_distribution_center_by_id(
         db=db, distribution_center_id=distribution_center_id
     )
     if not distribution_center:
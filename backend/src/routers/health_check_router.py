@@ -1,9 +1,14 @@
 import socket
 from datetime import datetime
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import JSONResponse
 
+from src.db.database import get_async_db, get_pool_stats
+from src.services.geocoding_cache_service import get_geocoding_cache_stats
+from src.services.otp_service import get_otp_table_stats
+
 health_check_router = APIRouter(tags=["HealthCheck"], prefix="/health")
 
 
@@ -28,3 +33,71 @@ async def health_check() -> JSONResponse:
         },
         headers={"hostname": hostname, "ip_address": ip_address},
     )
+
+
+@health_check_router.get(
+    "/db-pool",
+    status_code=status.HTTP_200_OK,
+    summary="Database Pool Stats Endpoint",
+    description="""
+Returns the connection pool usage of the worker that served the request.
+
+### Response
+- **pool_size**: Number of persistent connections kept by the pool.
+- **checked_in**: Idle connections currently available in the pool.
+- **checked_out**: Connections currently in use.
+- **overflow**: Connections opened beyond the pool size.
+- **max_connections**: Maximum connections this worker may open (pool size + max overflow).
+""",
+)
+async def db_pool_stats() -> JSONResponse:
+    return JSONResponse(
+        content=get_pool_stats(),
+        headers={"hostname": socket.gethostname()},
+    )
+
+
+@health_check_router.get(
+    "/geocoding-cache",
+    status_code=status.HTTP_200_OK,
+    summary="Geocoding Cache Stats Endpoint",
+    description="""
+Returns the geocoding cache counters of the worker that served the request.
+
+### Response
+- **memory_hits**: Lookups answered by the in-process cache.
+- **database_hits**: Lookups answered by the shared `geocoded_addresses` table.
+- **misses**: Lookups that had to call the geocoder.
+- **hit_ratio**: Share of lookups answered from either cache (null before the first lookup).
+- **memory_entries**: Addresses currently held in the in-process cache.
+- **memory_capacity**: Maximum addresses held in the in-process cache.
+""",
+)
+async def geocoding_cache_stats() -> JSONResponse:
+    return JSONResponse(
+        content=get_geocoding_cache_stats(),
+        headers={"hostname": socket.gethostname()},
+    )
+
+
+@health_check_router.get(
+    "/otps",
+    status_code=status.HTTP_200_OK,
+    summary="OTP Table Stats Endpoint",
+    description="""
+Returns the size of the `otps` table and the result of the last sweep run by the worker that served the request.
+
+### Response
+- **total**: Rows currently in the table.
+- **active**: Unused codes that have not expired yet.
+- **used**: Codes already verified or superseded by a newer login, waiting to be swept.
+- **expired**: Unused codes past their expiration, waiting to be swept.
+- **last_sweep_deleted**: Rows deleted by the last sweep (null before the first sweep).
+- **last_sweep_at**: When the last sweep finished (null before the first sweep).
+""",
+)
+async def otp_table_stats(*, db: AsyncSession = Depends(get_async_db)) -> JSONResponse:
+    return JSONResponse(
+        content=await get_otp_table_stats(db=db),
+        headers={"hostname": socket.gethostname()},
+    )
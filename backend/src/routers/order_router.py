@@ -1,14 +1,15 @@
 from datetime import date
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import BadRequestException, NotFoundException
-from src.models.db_models import Order, User
+from src.models.db_models import Order
 from src.models.enums.order_status import OrderStatus
 from src.models.enums.user_role import UserRole
+from src.schemas.base_schema import OrderBase
 from src.schemas.order_schema import (
     GetOrdersResponse,
     OrderCreateRequest,
@@ -16,6 +17,7 @@ from src.schemas.order_schema import (
     OrderResponse,
 )
 from src.services.order_service import create_order, get_order_by_id, get_orders
+from src.services.principal_cache_service import Principal
 
 order_router = APIRouter(tags=["Orders"], prefix="/orders")
 
@@ -53,8 +55,8 @@ Create a new order in the system.
 async def register_order(
     *,
     order_create_request: OrderCreateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(allowed_roles=[UserRole.COMMERCIAL, UserRole.INSTITUTIONAL])
     ),
 ) -> OrderResponse:
@@ -63,7 +65,7 @@ async def register_order(
     if is_commercial and not client_id:
         raise BadRequestException("Client ID must be provided for commercial users")
     seller_id = current_user.id if is_commercial else None
-    order = create_order(
+    order = await create_order(
         db=db,
         order_create_request=order_create_request,
         client_id=client_id,
@@ -91,9 +93,13 @@ Retrieve a list of all orders created by the current user.
     - returned
 - **distribution_center_id**: (Optional) Filter orders by distribution center ID (36 characters).
 - **route_id**: (Optional) Filter orders by route ID (36 characters).
+- **limit**: (Optional) Maximum number of orders to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
 
 ### Response
-- **total_count**: Total number of orders created by the user.
+- **total_count**: Total number of orders created by the user (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more orders are available.
 - **orders**: List of orders with their basic information:
     - **id**: Unique identifier of the order.
     - **comments**: Comments about the order.
@@ -108,23 +114,31 @@ async def get_all_orders(
     order_status: OrderStatus | None = Query(None),
     distribution_center_id: str | None = Query(None),
     route_id: str | None = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(
             allowed_roles=[UserRole.ADMIN, UserRole.COMMERCIAL, UserRole.INSTITUTIONAL]
         )
     ),
 ) -> GetOrdersResponse:
-    orders = get_orders(
+    page = await get_orders(
         db=db,
         current_user=current_user,
         delivery_date=delivery_date,
         order_status=order_status,
         distribution_center_id=distribution_center_id,
         route_id=route_id,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
 
-    return GetOrdersResponse(total_count=len(orders), orders=orders)
+    return GetOrdersResponse(
+        total_count=page.total_count, next_cursor=page.next_cursor, orders=page.items
+    )
 
 
 @order_router.get(
@@ -154,14 +168,14 @@ Retrieve detailed information about a specific order by its ID for the current u
 async def get_order(
     *,
     order_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(
             allowed_roles=[UserRole.ADMIN, UserRole.COMMERCIAL, UserRole.INSTITUTIONAL]
         )
     ),
 ) -> OrderResponse:
-    order = get_order_by_id(db=db, current_user=current_user, order_id=order_id)
+    order = await get_order_by_id(db=db, current_user=current_user, order_id=order_id)
     if not order:
         raise NotFoundException("Order not found")
 
@@ -170,7 +184,7 @@ async def get_order(
 
 def _build_order_response(order: Order) -> OrderResponse:
     return OrderResponse(
-        **order.__dict__,
+        **OrderBase.model_validate(order).model_dump(),
         seller=order.seller,
         client=order.client,
         distribution_center=order.distribution_center,
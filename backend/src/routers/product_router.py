@@ -1,19 +1,30 @@
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, Header, Query, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import JSONResponse, Response
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.core.utils import etag_matches
+from src.db.database import get_async_db
 from src.errors.errors import BadRequestException, NotFoundException
-from src.models.db_models import Product, User
+from src.models.db_models import Product
 from src.models.enums.user_role import UserRole
+from src.schemas.base_schema import ProductBase
 from src.schemas.product_schema import (
     GetProductsResponse,
     OrderProductDetail,
     ProductCreateBulkRequest,
     ProductCreateBulkResponse,
     ProductCreateRequest,
+    ProductRankingRebuildResponse,
     ProductResponse,
 )
+from src.services.catalog_cache_service import get_catalog_page
+from src.services.principal_cache_service import Principal
+from src.services.product_import_service import (
+    PRODUCT_IMPORT_COLUMNS,
+    import_products,
+)
+from src.services.product_ranking_service import rebuild_product_rankings
 from src.services.product_service import (
     create_product,
     create_products_bulk,
@@ -21,6 +32,7 @@ from src.services.product_service import (
     get_products,
     get_recommended_products,
 )
+from src.services.product_similarity_service import rebuild_product_neighbors
 
 product_router = APIRouter(
     tags=["Products"],
@@ -67,9 +79,9 @@ Register a new product in the system.
 async def register_product(
     *,
     product_create_request: ProductCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProductResponse:
-    product = create_product(db=db, product_create_request=product_create_request)
+    product = await create_product(db=db, product_create_request=product_create_request)
 
     return _build_product_response(product=product)
 
@@ -106,13 +118,45 @@ Register multiple products in the system in a single request.
 async def register_products_bulk(
     *,
     product_create_bulk_request: ProductCreateBulkRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProductCreateBulkResponse:
-    return create_products_bulk(
+    return await create_products_bulk(
         db=db, product_create_bulk_request=product_create_bulk_request
     )
 
 
+@product_router.post(
+    "-batch/file",
+    response_model=ProductCreateBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Import a product catalog from a CSV file",
+    dependencies=[Depends(require_roles(allowed_roles=[UserRole.ADMIN]))],
+    description=f"""
+Import a product catalog from a CSV file without loading it whole in memory.
+
+### Request Body
+- **file**: A UTF-8 CSV file with the header `{",".join(PRODUCT_IMPORT_COLUMNS)}`. `image_url` may be empty and
+each product follows the same rules as `POST /products`.
+
+The file is read in chunks of `PRODUCT_IMPORT_BATCH_SIZE` rows; each chunk is validated and inserted while the
+next one is parsed. Invalid rows are reported without stopping the import.
+
+### Response
+- **success**: Indicates if every product was imported.
+- **rows_total**: Total number of products in the file.
+- **rows_inserted**: Number of products imported.
+- **errors**: Number of products that could not be imported.
+- **errors_details**: Error message, with its row number, for the first products that could not be imported.
+""",
+)
+async def import_products_file(
+    *,
+    file: UploadFile = File(...),
+    db: AsyncSession = Depends(get_async_db),
+) -> ProductCreateBulkResponse:
+    return await import_products(db=db, file=file.file)
+
+
 @product_router.get(
     "",
     response_model=GetProductsResponse,
@@ -122,9 +166,18 @@ async def register_products_bulk(
 Retrieve a list of all products in the system.
 
 ### Query Parameters
-- **limit**: (Optional) The maximum number of products to retrieve.
+- **limit**: (Optional) The maximum number of products to retrieve in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+
+Pages are served from an in-memory copy of the catalog visible to the user's role, rebuilt when products are
+created or their stock changes. The response carries an `ETag`; send it back in `If-None-Match` to receive
+`304 Not Modified` while the page is unchanged.
 
 ### Response
+- **total_count**: Total number of products (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more products are available.
+
 Returns a list of products with the following details for each product:
 - **id**: Unique identifier of the product.
 - **name**: Name of the product.
@@ -141,16 +194,58 @@ Returns a list of products with the following details for each product:
 async def get_all_products(
     *,
     limit: int | None = Query(None, gt=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    if_none_match: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(
             allowed_roles=[UserRole.ADMIN, UserRole.COMMERCIAL, UserRole.INSTITUTIONAL]
         )
     ),
-) -> GetProductsResponse:
-    products = get_products(db=db, current_user=current_user, limit=limit)
+) -> Response:
+    cached = await get_catalog_page(
+        db=db,
+        current_user=current_user,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+    if cached:
+        page, etag = cached
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+            )
 
-    return GetProductsResponse(total_count=len(products), products=products)
+        content = {
+            "total_count": page.total_count,
+            "next_cursor": page.next_cursor,
+            "products": page.items,
+        }
+
+        return JSONResponse(
+            content={key: value for key, value in content.items() if value is not None},
+            headers={"ETag": etag},
+        )
+
+    # The cursor points at a product that left the cached view, so page it from
+    # the database as before.
+    page = await get_products(
+        db=db,
+        current_user=current_user,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    response = GetProductsResponse(
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
+        products=page.items,
+    )
+
+    return JSONResponse(content=response.model_dump(mode="json"))
 
 
 @product_router.get(
@@ -184,8 +279,8 @@ async def get_all_recommended_products(
     *,
     client_id: str | None = Query(None),
     limit: int = Query(20, gt=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(
             allowed_roles=[UserRole.ADMIN, UserRole.COMMERCIAL, UserRole.INSTITUTIONAL]
         )
@@ -197,13 +292,39 @@ async def get_all_recommended_products(
             "Client ID must be provided for non-institutional users"
         )
     client_id = current_user.id if is_institutional else client_id
-    products = get_recommended_products(
+    products = await get_recommended_products(
         db=db, current_user=current_user, client_id=client_id, limit=limit
     )
 
     return GetProductsResponse(total_count=len(products), products=products)
 
 
+@product_router.post(
+    "/recommended/rebuild",
+    response_model=ProductRankingRebuildResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild product rankings",
+    dependencies=[Depends(require_roles(allowed_roles=[UserRole.ADMIN]))],
+    description="""
+Recompute from the orders table the data used by `GET /products/recommended`:
+- the per-client and global product rankings, which new orders also update as they are created.
+- the top `RECOMMENDATION_NEIGHBORS_TOP_K` co-purchased products of each product, by cosine similarity of the
+orders that include them. Run it periodically to take new orders into account.
+
+### Response
+- **rankings_count**: Number of ranking rows after the rebuild.
+- **neighbors_count**: Number of co-purchase neighbour rows after the rebuild.
+""",
+)
+async def rebuild_recommended_products(
+    *, db: AsyncSession = Depends(get_async_db)
+) -> ProductRankingRebuildResponse:
+    return ProductRankingRebuildResponse(
+        rankings_count=await rebuild_product_rankings(db=db),
+        neighbors_count=await rebuild_product_neighbors(db=db),
+    )
+
+
 @product_router.get(
     "/{product_id}",
     response_model=ProductResponse,
@@ -245,9 +366,9 @@ Retrieve a product's details by their unique ID.
 async def get_product(
     *,
     product_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProductResponse:
-    product = get_product_by_id(db=db, product_id=product_id)
+    product = await get_product_by_id(db=db, product_id=product_id)
     if not product:
         raise NotFoundException("Product not found")
 
@@ -256,7 +377,7 @@ async def get_product(
 
 def _build_product_response(product: Product) -> ProductResponse:
     return ProductResponse(
-        **product.__dict__,
+        **ProductBase.model_validate(product).model_dump(),
         provider=product.provider,
         selling_plans=product.selling_plans,
         orders=[
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
 from src.models.enums.user_role import UserRole
 from src.schemas.provider_schema import (
@@ -56,9 +56,9 @@ Register a new provider in the system.
 async def register_provider(
     *,
     provider_create_request: ProviderCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProviderResponse:
-    return create_provider(db=db, provider_create_request=provider_create_request)
+    return await create_provider(db=db, provider_create_request=provider_create_request)
 
 
 @provider_router.get(
@@ -69,7 +69,14 @@ async def register_provider(
     description="""
 Retrieve a list of all providers in the system.
 
+### Query Parameters
+- **limit**: (Optional) Maximum number of providers to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+
 ### Response
+- **total_count**: Total number of providers (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more providers are available.
 Returns a list of providers with the following details for each provider:
 - **id**: Unique identifier of the provider.
 - **name**: Full name of the provider.
@@ -84,11 +91,20 @@ Returns a list of providers with the following details for each provider:
 )
 async def get_all_providers(
     *,
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetProvidersResponse:
-    providers = get_providers(db=db)
+    page = await get_providers(
+        db=db, limit=limit, cursor=cursor, include_total=include_total
+    )
 
-    return GetProvidersResponse(total_count=len(providers), providers=providers)
+    return GetProvidersResponse(
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
+        providers=page.items,
+    )
 
 
 @provider_router.get(
@@ -118,9 +134,9 @@ Retrieve a provider's details by their unique ID.
 async def get_provider(
     *,
     provider_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ProviderResponse:
-    provider = get_provider_by_id(db=db, provider_id=provider_id)
+    provider = await get_provider_by_id(db=db, provider_id=provider_id)
     if not provider:
         raise NotFoundException("Provider not found")
 
@@ -1,17 +1,29 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import AsyncGenerator
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import StreamingResponse
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import async_session_scope, get_async_db
 from src.models.db_models import Order
 from src.models.enums.order_status import OrderStatus
+from src.models.enums.report_format import ReportFormat
+from src.models.enums.sales_dimension import SalesDimension
 from src.models.enums.user_role import UserRole
+from src.schemas.base_schema import OrderBase
 from src.schemas.order_schema import OrderProductDetail
-from src.schemas.report_schema import GetOrderReportResponse, OrderReportResponse
+from src.schemas.report_schema import (
+    GetOrderReportResponse,
+    GetSalesReportResponse,
+    OrderReportResponse,
+    SalesBucketResponse,
+    SalesRollupRebuildResponse,
+)
 from src.schemas.seller_schema import SellerMinimalResponse
-from src.services.report_service import get_orders_report
+from src.services.report_service import export_orders_report, get_orders_report
+from src.services.sales_rollup_service import get_sales_report, rebuild_sales_rollups
 
 report_router = APIRouter(
     tags=["Reports"],
@@ -19,6 +31,22 @@ report_router = APIRouter(
     dependencies=[Depends(require_roles(allowed_roles=[UserRole.ADMIN]))],
 )
 
+_EXPORT_MEDIA_TYPES = {
+    ReportFormat.CSV: "text/csv",
+    ReportFormat.NDJSON: "application/x-ndjson",
+}
+
+
+async def _get_orders_report_db(
+    report_format: ReportFormat | None = Query(None, alias="format"),
+) -> AsyncGenerator[AsyncSession | None, None]:
+    # Exports stream from a session of their own, so they get no request session.
+    if report_format:
+        yield None
+        return
+    async with async_session_scope() as db:
+        yield db
+
 
 @report_router.get(
     "/orders",
@@ -34,9 +62,17 @@ Generate a report of orders with optional filters such as seller ID, order statu
 `in_transit`, `delivered`, `returned`.
 - **start_date**: (Optional) Filter orders created on or after this date.
 - **end_date**: (Optional) Filter orders created on or before this date.
+- **limit**: (Optional) Maximum number of orders to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+- **format**: (Optional) Stream the whole report as `csv` or `ndjson` instead of returning JSON pages.
+Each exported record is one order line with the columns: `order_id`, `created_at`, `delivery_date`, `status`,
+`comments`, `seller_id`, `seller_name`, `zone`, `product_id`, `product_name`, `quantity`, `price_per_unit`,
+`line_total`. `limit`, `cursor` and `include_total` are ignored when exporting.
 
 ### Response:
-- **total_count**: Total number of orders matching the filters.
+- **total_count**: Total number of orders matching the filters (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more orders are available.
 - **orders**: List of orders with the following details:
     - **id**: Unique identifier of the order.
     - **comments**: Any comments associated with the order.
@@ -49,27 +85,128 @@ Generate a report of orders with optional filters such as seller ID, order statu
 )
 async def get_all_orders_report(
     *,
-    db: Session = Depends(get_db),
+    db: AsyncSession | None = Depends(_get_orders_report_db),
     seller_id: str | None = Query(None),
     order_status: OrderStatus | None = Query(None),
     start_date: datetime | None = Query(None),
     end_date: datetime | None = Query(None),
-) -> GetOrderReportResponse:
-    orders = get_orders_report(
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    report_format: ReportFormat | None = Query(None, alias="format"),
+) -> GetOrderReportResponse | StreamingResponse:
+    if report_format:
+        return StreamingResponse(
+            export_orders_report(
+                report_format=report_format,
+                seller_id=seller_id,
+                order_status=order_status,
+                start_date=start_date,
+                end_date=end_date,
+            ),
+            media_type=_EXPORT_MEDIA_TYPES[report_format],
+            headers={
+                "Content-Disposition": (
+                    f"attachment; filename=orders_report.{report_format.value}"
+                )
+            },
+        )
+
+    page = await get_orders_report(
         db=db,
         seller_id=seller_id,
         order_status=order_status,
         start_date=start_date,
         end_date=end_date,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+    return GetOrderReportResponse(
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
+        orders=[_build_order_report_response(order=order) for order in page.items],
+    )
+
+
+@report_router.get(
+    "/sales",
+    response_model=GetSalesReportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Generate Sales Report",
+    description="""
+Aggregate units and revenue from the daily sales rollups, grouped by any combination of dimensions.
+
+### Query Parameters:
+- **group_by**: (Optional, repeatable) Dimensions to group by. Possible values are: `day`, `seller`, `product`,
+`zone`, `status`. When omitted a single bucket with the grand totals is returned.
+- **start_day**: (Optional) Include sales on or after this day (UTC).
+- **end_day**: (Optional) Include sales on or before this day (UTC).
+- **seller_id**: (Optional) Filter sales by the seller's unique identifier.
+- **product_id**: (Optional) Filter sales by the product's unique identifier.
+- **zone_id**: (Optional) Filter sales by the seller's zone.
+- **order_status**: (Optional) Filter sales by order status.
+
+### Response:
+- **total_units**: Units sold across all buckets.
+- **total_revenue**: Revenue across all buckets.
+- **buckets**: One entry per group with the requested dimensions plus `units`, `revenue` and `order_lines`.
+""",
+)
+async def get_sales_summary_report(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    group_by: list[SalesDimension] = Query([]),
+    start_day: date | None = Query(None),
+    end_day: date | None = Query(None),
+    seller_id: str | None = Query(None),
+    product_id: str | None = Query(None),
+    zone_id: str | None = Query(None),
+    order_status: OrderStatus | None = Query(None),
+) -> GetSalesReportResponse:
+    buckets = [
+        SalesBucketResponse(**bucket)
+        for bucket in await get_sales_report(
+            db=db,
+            group_by=group_by,
+            start_day=start_day,
+            end_day=end_day,
+            seller_id=seller_id,
+            product_id=product_id,
+            zone_id=zone_id,
+            order_status=order_status,
+        )
+    ]
+
+    return GetSalesReportResponse(
+        total_units=sum(bucket.units for bucket in buckets),
+        total_revenue=round(sum(bucket.revenue for bucket in buckets), 2),
+        buckets=buckets,
     )
-    orders = [_build_order_report_response(order=order) for order in orders]
 
-    return GetOrderReportResponse(total_count=len(orders), orders=orders)
+
+@report_router.post(
+    "/sales/rebuild",
+    response_model=SalesRollupRebuildResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Rebuild Sales Rollups",
+    description="""
+Recompute the daily sales rollups from the orders table. Use it to backfill existing orders.
+
+### Response:
+- **buckets_count**: Number of rollup rows after the rebuild.
+""",
+)
+async def rebuild_sales_report(
+    *, db: AsyncSession = Depends(get_async_db)
+) -> SalesRollupRebuildResponse:
+    return SalesRollupRebuildResponse(buckets_count=await rebuild_sales_rollups(db=db))
 
 
 def _build_order_report_response(order: Order) -> OrderReportResponse:
     return OrderReportResponse(
-        **order.__dict__,
+        **OrderBase.model_validate(order).model_dump(),
         seller=SellerMinimalResponse.model_validate(order.seller),
         products=[
             OrderProductDetail.from_order_product(order_product=order_product)
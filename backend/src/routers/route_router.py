@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
 from src.models.enums.user_role import UserRole
 from src.schemas.route_schema import (
@@ -10,9 +10,16 @@ from src.schemas.route_schema import (
     RouteCreateRequest,
     RouteMapDetail,
     RouteMapResponse,
+    RoutePlanRequest,
+    RoutePlanResponse,
     RouteResponse,
 )
-from src.services.route_service import create_route, get_route_by_id, get_routes
+from src.services.route_service import (
+    create_route,
+    get_route_by_id,
+    get_routes,
+    plan_routes,
+)
 
 route_router = APIRouter(
     tags=["Routes"],
@@ -36,12 +43,17 @@ Create a new route in the system.
 - **distribution_center_id**: ID of the distribution center (36 characters).
 - **order_ids**: List of order IDs to be included in the route (at least 1).
 
+The stops are ordered from the clients' coordinates with a nearest-neighbour tour improved by 2-opt and
+Or-opt moves. When the distribution center has coordinates the tour starts and ends there; otherwise it is an
+open path.
+
 ### Response
 - **id**: Unique identifier of the route.
 - **name**: Name of the route.
 - **vehicle_plate**: Vehicle plate associated with the route.
 - **restrictions**: Restrictions for the route (if any).
 - **delivery_deadline**: Delivery deadline for the route.
+- **estimated_distance_km**: Great-circle length of the optimized tour (if the stops have coordinates).
 - **created_at**: Timestamp when the route was created.
 - **distribution_center**: Information about the distribution center.
 - **orders**: List of orders included in the route with their details.
@@ -50,13 +62,50 @@ Create a new route in the system.
 async def register_route(
     *,
     route_create_request: RouteCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RouteResponse:
-    route = create_route(db=db, route_create_request=route_create_request)
+    route = await create_route(db=db, route_create_request=route_create_request)
 
     return route
 
 
+@route_router.post(
+    "/plan",
+    response_model=RoutePlanResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Plan routes for unassigned orders",
+    description="""
+Propose vehicle routes for the orders of a distribution center that are not assigned to a route yet. Nothing is
+persisted; each proposed route can be registered with `POST /routes`.
+
+Orders in `received` or `preparing` status with a delivery date on or before `delivery_date` are split across the
+vehicles with sweep clustering and Clarke-Wright savings, and each route is then sequenced like `POST /routes`.
+
+### Request Body
+- **distribution_center_id**: ID of the distribution center (36 characters).
+- **delivery_date**: Latest delivery date of the orders to plan.
+- **vehicle_count**: Number of available vehicles.
+- **vehicle_capacity**: Units each vehicle can carry.
+- **max_stops**: (Optional) Maximum number of stops per vehicle.
+
+### Response
+- **routes**: Proposed routes, largest load first.
+    - **delivery_deadline**: Earliest delivery date among the route's orders.
+    - **total_units**: Units carried by the vehicle.
+    - **estimated_distance_km**: Great-circle length of the sequenced tour.
+    - **order_ids**: Orders in visiting order.
+- **unassigned_order_ids**: Orders that did not fit in the vehicles, exceed the capacity on their own, or whose
+client has no coordinates.
+""",
+)
+async def plan_unassigned_routes(
+    *,
+    route_plan_request: RoutePlanRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> RoutePlanResponse:
+    return await plan_routes(db=db, route_plan_request=route_plan_request)
+
+
 @route_router.get(
     "",
     response_model=GetRoutesResponse,
@@ -65,8 +114,14 @@ async def register_route(
     description="""
 Retrieve a list of all routes in the system.
 
+### Query Parameters
+- **limit**: (Optional) Maximum number of routes to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+
 ### Response
-- **total_count**: Total number of routes.
+- **total_count**: Total number of routes (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more routes are available.
 - **routes**: List of routes with the basic route information.
     - **id**: Unique identifier of the route.
     - **name**: Name of the route.
@@ -78,11 +133,18 @@ Retrieve a list of all routes in the system.
 )
 async def get_all_routes(
     *,
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetRoutesResponse:
-    routes = get_routes(db=db)
+    page = await get_routes(
+        db=db, limit=limit, cursor=cursor, include_total=include_total
+    )
 
-    return GetRoutesResponse(total_count=len(routes), routes=routes)
+    return GetRoutesResponse(
+        total_count=page.total_count, next_cursor=page.next_cursor, routes=page.items
+    )
 
 
 @route_router.get(
@@ -102,6 +164,7 @@ Retrieve detailed information about a specific route by its ID.
 - **vehicle_plate**: Vehicle plate associated with the route.
 - **restrictions**: Restrictions for the route (if any).
 - **delivery_deadline**: Delivery deadline for the route.
+- **estimated_distance_km**: Great-circle length of the optimized tour (if the stops have coordinates).
 - **created_at**: Timestamp when the route was created.
 - **distribution_center**: Information about the distribution center.
 - **orders**: List of orders included in the route with their details.
@@ -110,9 +173,9 @@ Retrieve detailed information about a specific route by its ID.
 async def get_route(
     *,
     route_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RouteResponse:
-    route = get_route_by_id(db=db, route_id=route_id)
+    route = await get_route_by_id(db=db, route_id=route_id)
     if not route:
         raise NotFoundException("Route not found")
 
@@ -136,9 +199,11 @@ Retrieve the map details of a specific route by its ID.
 - **vehicle_plate**: Vehicle plate associated with the route.
 - **restrictions**: Restrictions for the route (if any).
 - **delivery_deadline**: Delivery deadline for the route.
+- **estimated_distance_km**: Great-circle length of the optimized tour (if the stops have coordinates).
 - **created_at**: Timestamp when the route was created.
 - **total_count**: Total number of stops in the route.
-- **stops**: List of stops in the route with their details.
+- **stops**: List of stops in the route, in visiting order, with their details.
+    - **stop_sequence**: Position of the stop in the optimized tour.
     - **order_id**: Unique identifier of the order.
     - **order_status**: Current status of the order.
     - **delivery_date**: Date when the order should be delivered.
@@ -152,9 +217,9 @@ Retrieve the map details of a specific route by its ID.
 async def get_route_map(
     *,
     route_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RouteMapResponse:
-    route = get_route_by_id(db=db, route_id=route_id)
+    route = await get_route_by_id(db=db, route_id=route_id)
     if not route:
         raise NotFoundException("Route not found")
 
@@ -162,6 +227,7 @@ async def get_route_map(
     for order in route.orders:
         stops.append(
             RouteMapDetail(
+                stop_sequence=order.stop_sequence,
                 order_id=order.id,
                 order_status=order.status,
                 delivery_date=order.delivery_date,
@@ -1,10 +1,9 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
-from src.models.db_models import User
 from src.models.enums.user_role import UserRole
 from src.schemas.seller_schema import (
     GetSellersResponse,
@@ -12,7 +11,13 @@ from src.schemas.seller_schema import (
     SellerResponse,
     SellerSummaryResponse,
 )
-from src.services.seller_service import create_seller, get_seller_by_id, get_sellers
+from src.services.principal_cache_service import Principal
+from src.services.seller_service import (
+    create_seller,
+    get_seller_by_id,
+    get_sellers,
+    summarize_seller,
+)
 
 seller_router = APIRouter(
     tags=["Sellers"],
@@ -32,22 +37,19 @@ Retrieve a summary of the authenticated seller's account.
 - **id**: Unique identifier of the seller
 - **clients_count**: Total number of clients associated with the seller
 - **orders_count**: Total number of orders managed by the seller
+- **units_sold**: Total units sold by the seller, read from the daily sales rollups
+- **revenue**: Total revenue of the seller's orders, read from the daily sales rollups
 - **zone**: Zone associated with the seller
 """,
 )
 async def get_seller_summary(
     *,
-    current_user: User = Depends(require_roles(allowed_roles=[UserRole.COMMERCIAL])),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
+        require_roles(allowed_roles=[UserRole.COMMERCIAL])
+    ),
 ) -> SellerSummaryResponse:
-    clients_count = len(current_user.clients)
-    orders_count = len(current_user.managed_orders)
-
-    return SellerSummaryResponse(
-        id=current_user.id,
-        clients_count=clients_count,
-        orders_count=orders_count,
-        zone=current_user.zone.description,
-    )
+    return await summarize_seller(db=db, seller=current_user)
 
 
 @seller_router.post(
@@ -83,9 +85,9 @@ Create a new seller account.
 async def register_seller(
     *,
     seller_create_request: SellerCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SellerResponse:
-    return create_seller(db=db, seller_create_request=seller_create_request)
+    return await create_seller(db=db, seller_create_request=seller_create_request)
 
 
 @seller_router.get(
@@ -97,7 +99,14 @@ async def register_seller(
     description="""
 Retrieve a list of all registered sellers.
 
+### Query Parameters
+- **limit**: (Optional) Maximum number of sellers to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+
 ### Response
+- **total_count**: Total number of sellers (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more sellers are available.
 Returns a list of sellers with the following details for each seller:
 - **id**: Unique identifier of the seller
 - **full_name**: Seller's full name
@@ -111,11 +120,18 @@ Returns a list of sellers with the following details for each seller:
 )
 async def get_all_sellers(
     *,
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetSellersResponse:
-    sellers = get_sellers(db=db)
+    page = await get_sellers(
+        db=db, limit=limit, cursor=cursor, include_total=include_total
+    )
 
-    return GetSellersResponse(total_count=len(sellers), sellers=sellers)
+    return GetSellersResponse(
+        total_count=page.total_count, next_cursor=page.next_cursor, sellers=page.items
+    )
 
 
 @seller_router.get(
@@ -148,9 +164,9 @@ Retrieve a seller's details by their unique ID.
 async def get_seller(
     *,
     seller_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SellerResponse:
-    seller = get_seller_by_id(db=db, seller_id=seller_id)
+    seller = await get_seller_by_id(db=db, seller_id=seller_id)
     if not seller:
         raise NotFoundException("Seller not found")
 
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
 from src.models.enums.user_role import UserRole
 from src.schemas.selling_plan_schema import (
@@ -51,9 +51,9 @@ Create a new selling plan in the system.
 async def register_selling_plan(
     *,
     selling_plan_create_request: SellingPlanCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SellingPlanResponse:
-    return create_selling_plan(
+    return await create_selling_plan(
         db=db, selling_plan_create_request=selling_plan_create_request
     )
 
@@ -66,7 +66,14 @@ async def register_selling_plan(
     description="""
 Retrieve a list of all selling plans in the system.
 
+### Query Parameters
+- **limit**: (Optional) Maximum number of selling plans to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
+
 ### Response
+- **total_count**: Total number of selling plans (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more selling plans are available.
 Returns a list of selling plans with the following details for each selling plan:
 - **id**: Unique identifier of the selling plan.
 - **period**: Period of the selling plan.
@@ -76,12 +83,19 @@ Returns a list of selling plans with the following details for each selling plan
 )
 async def get_all_selling_plans(
     *,
-    db: Session = Depends(get_db),
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
 ) -> GetSellingPlansResponse:
-    selling_plans = get_selling_plans(db=db)
+    page = await get_selling_plans(
+        db=db, limit=limit, cursor=cursor, include_total=include_total
+    )
 
     return GetSellingPlansResponse(
-        total_count=len(selling_plans), selling_plans=selling_plans
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
+        selling_plans=page.items,
     )
 
 
@@ -109,9 +123,9 @@ Retrieve a selling plan's details by its unique ID.
 async def get_selling_plan(
     *,
     selling_plan_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SellingPlanResponse:
-    selling_plan = get_selling_plan_by_id(db=db, selling_plan_id=selling_plan_id)
+    selling_plan = await get_selling_plan_by_id(db=db, selling_plan_id=selling_plan_id)
     if not selling_plan:
         raise NotFoundException("Selling plan not found")
 
@@ -3,15 +3,16 @@ from typing import Union
 
 from fastapi import APIRouter, Depends, File, Form, Query, UploadFile, status
 from google.cloud import storage
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.dependencies.gcp_dependency import StorageClientSingleton
 from src.errors.errors import NotFoundException
-from src.models.db_models import User, Visit
+from src.models.db_models import Visit
 from src.models.enums.user_role import UserRole
 from src.models.enums.visit_status import VisitStatus
+from src.schemas.base_schema import VisitBase
 from src.schemas.visit_schema import (
     ClientVisitResponse,
     GetClientVisitsResponse,
@@ -21,6 +22,7 @@ from src.schemas.visit_schema import (
     VisitReportRequest,
     VisitResponse,
 )
+from src.services.principal_cache_service import Principal
 from src.services.storage_service import generate_signed_url
 from src.services.visit_service import (
     create_visit,
@@ -57,10 +59,12 @@ Create a new visit request in the system.
 async def register_visit(
     *,
     visit_create_request: VisitCreateRequest,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles(allowed_roles=[UserRole.INSTITUTIONAL])),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
+        require_roles(allowed_roles=[UserRole.INSTITUTIONAL])
+    ),
 ) -> VisitResponse:
-    return create_visit(
+    return await create_visit(
         db=db, visit_create_request=visit_create_request, current_user=current_user
     )
 
@@ -76,9 +80,13 @@ Retrieve all visits scheduled or assigned to the current user.
 ### Query Parameters
 - **expected_date**: (Optional) Filter visits by expected date (YYYY-MM-DD format).
 - **visit_status**: (Optional) Filter visits by their status. Possible values are: 'pending' and 'completed'.
+- **limit**: (Optional) Maximum number of visits to return in this page.
+- **cursor**: (Optional) Opaque `next_cursor` returned by the previous page.
+- **include_total**: (Optional) Whether to compute `total_count`. Default is true.
 
 ### Response
-- **total_count**: Total number of visits matching the criteria.
+- **total_count**: Total number of visits matching the criteria (omitted when `include_total` is false).
+- **next_cursor**: Cursor for the next page, present only when more visits are available.
 - **visits**: List of visits with their basic information:
     - **id**: Unique identifier of the visit.
     - **expected_date**: Date when the visit is expected to occur.
@@ -97,29 +105,37 @@ async def get_all_visits(
     *,
     expected_date: date | None = Query(None),
     visit_status: VisitStatus | None = Query(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    limit: int | None = Query(None, gt=0),
+    cursor: str | None = Query(None),
+    include_total: bool = Query(True),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(allowed_roles=[UserRole.COMMERCIAL, UserRole.INSTITUTIONAL])
     ),
     storage_client: storage.Client = Depends(StorageClientSingleton),
 ) -> Union[GetSellerVisitsResponse, GetClientVisitsResponse]:
-    visits = get_visits(
+    page = await get_visits(
         db=db,
         current_user=current_user,
         expected_date=expected_date,
         visit_status=visit_status,
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     visit_responses = _build_visit_responses(
-        visits=visits, storage_client=storage_client
+        visits=page.items, storage_client=storage_client
     )
     if current_user.role == UserRole.COMMERCIAL:
         return GetSellerVisitsResponse(
-            total_count=len(visits),
+            total_count=page.total_count,
+            next_cursor=page.next_cursor,
             visits=[SellerVisitResponse.model_validate(v) for v in visit_responses],
         )
 
     return GetClientVisitsResponse(
-        total_count=len(visits),
+        total_count=page.total_count,
+        next_cursor=page.next_cursor,
         visits=[ClientVisitResponse.model_validate(v) for v in visit_responses],
     )
 
@@ -152,13 +168,13 @@ Retrieve detailed information about a specific visit by its ID for the current u
 async def get_visit(
     *,
     visit_id: str,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
         require_roles(allowed_roles=[UserRole.COMMERCIAL, UserRole.INSTITUTIONAL])
     ),
     storage_client: storage.Client = Depends(StorageClientSingleton),
 ) -> VisitResponse:
-    visit = get_visit_by_id(db=db, current_user=current_user, visit_id=visit_id)
+    visit = await get_visit_by_id(db=db, current_user=current_user, visit_id=visit_id)
     if not visit:
         raise NotFoundException("Visit not found")
 
@@ -206,8 +222,10 @@ async def report_visit_by_id(
     latitude: float = Form(...),
     longitude: float = Form(...),
     visual_evidence: UploadFile | None = File(None),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(require_roles(allowed_roles=[UserRole.COMMERCIAL])),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: Principal = Depends(
+        require_roles(allowed_roles=[UserRole.COMMERCIAL])
+    ),
     storage_client: storage.Client = Depends(StorageClientSingleton),
 ) -> VisitResponse:
     visit_report_request = VisitReportRequest(
@@ -218,7 +236,7 @@ async def report_visit_by_id(
         longitude=longitude,
     )
 
-    visit = report_visit(
+    visit = await report_visit(
         db=db,
         visit_report_request=visit_report_request,
         current_user=current_user,
@@ -239,7 +257,7 @@ def _build_visit_response(
         )
 
     return VisitResponse(
-        **visit.__dict__,
+        **VisitBase.model_validate(visit).model_dump(exclude={"visual_evidence_url"}),
         visual_evidence_url=visual_evidence_url,
         expected_geolocation=visit.expected_geolocation,
         report_geolocation=visit.report_geolocation,
@@ -259,7 +277,9 @@ def _build_visit_responses(
                 storage_client=storage_client, blob_name=str(visit.visual_evidence_path)
             )
         visit_response = VisitResponse(
-            **visit.__dict__,
+            **VisitBase.model_validate(visit).model_dump(
+                exclude={"visual_evidence_url"}
+            ),
             visual_evidence_url=visual_evidence_url,
             expected_geolocation=visit.expected_geolocation,
             report_geolocation=visit.report_geolocation,
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.security import require_roles
-from src.db.database import get_db
+from src.db.database import get_async_db
 from src.errors.errors import NotFoundException
 from src.models.enums.user_role import UserRole
 from src.schemas.zone_schema import GetZonesResponse, ZoneResponse
@@ -30,8 +30,8 @@ Returns a list of zones with the following details for each zone:
 - **created_at**: Timestamp of zone creation
 """,
 )
-async def get_all_zones(db: Session = Depends(get_db)) -> GetZonesResponse:
-    zones = get_zones(db=db)
+async def get_all_zones(db: AsyncSession = Depends(get_async_db)) -> GetZonesResponse:
+    zones = await get_zones(db=db)
 
     return GetZonesResponse(total_count=len(zones), zones=zones)
 
@@ -55,8 +55,10 @@ Retrieve a zone by its unique ID.
 - **selling_plans**: List of associated selling plans
 """,
 )
-async def get_zone(*, zone_id: str, db: Session = Depends(get_db)) -> ZoneResponse:
-    zone = get_zone_by_id(db=db, zone_id=zone_id)
+async def get_zone(
+    *, zone_id: str, db: AsyncSession = Depends(get_async_db)
+) -> ZoneResponse:
+    zone = await get_zone_by_id(db=db, zone_id=zone_id)
     if not zone:
         raise NotFoundException("Zone not found")
 
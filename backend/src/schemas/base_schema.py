@@ -23,6 +23,11 @@ class BaseSchema(BaseModel):
         return data
 
 
+class PaginatedResponse(BaseSchema):
+    total_count: int | None = None
+    next_cursor: str | None = None
+
+
 class UserBase(BaseSchema):
     id: str
     full_name: str
@@ -82,6 +87,8 @@ class DistributionCenterBase(BaseSchema):
     address: str
     city: str
     country: str
+    latitude: float | None = None
+    longitude: float | None = None
     created_at: datetime
 
 
@@ -117,4 +124,5 @@ class RouteBase(BaseSchema):
     vehicle_plate: str
     restrictions: str | None = None
     delivery_deadline: date
+    estimated_distance_km: float | None = None
     created_at: datetime
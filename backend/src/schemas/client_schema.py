@@ -4,3 +4,11 @@ from src.schemas.base_schema import BaseSchema, UserBase
 class GetClientsResponse(BaseSchema):
     total_count: int
     clients: list[UserBase]
+
+
+class ClientCreateBulkResponse(BaseSchema):
+    success: bool
+    rows_total: int
+    rows_inserted: int
+    errors: int
+    errors_details: list[str]
@@ -1,3 +1,8 @@
+from typing import Annotated
+
+from pydantic import Field, model_validator
+
+from src.errors.errors import BadRequestException
 from src.schemas.base_schema import (
     BaseSchema,
     DistributionCenterBase,
@@ -6,6 +11,23 @@ from src.schemas.base_schema import (
 )
 
 
+class DistributionCenterCreateRequest(BaseSchema):
+    name: Annotated[str, Field(min_length=1, max_length=100)]
+    address: Annotated[str, Field(min_length=1, max_length=255)]
+    city: Annotated[str, Field(min_length=1, max_length=100)]
+    country: Annotated[str, Field(min_length=1, max_length=100)]
+    latitude: Annotated[float | None, Field(ge=-90, le=90)] = None
+    longitude: Annotated[float | None, Field(ge=-180, le=180)] = None
+
+    @model_validator(mode="after")
+    def validate_coordinates(self) -> "DistributionCenterCreateRequest":
+        if (self.latitude is None) != (self.longitude is None):
+            raise BadRequestException(
+                "Latitude and longitude must be provided together"
+            )
+        return self
+
+
 class DistributionCenterResponse(DistributionCenterBase):
     orders: list[OrderBase]
     routes: list[RouteBase]
@@ -8,6 +8,7 @@ from src.schemas.base_schema import (
     BaseSchema,
     DistributionCenterBase,
     OrderBase,
+    PaginatedResponse,
     RouteBase,
     SellerBase,
     UserBase,
@@ -64,6 +65,5 @@ class OrderMinimalResponse(OrderBase):
     route: RouteBase | None = None
 
 
-class GetOrdersResponse(BaseSchema):
-    total_count: int
+class GetOrdersResponse(PaginatedResponse):
     orders: list[OrderMinimalResponse]
@@ -7,6 +7,7 @@ from src.models.db_models import OrderProduct
 from src.models.enums.order_status import OrderStatus
 from src.schemas.base_schema import (
     BaseSchema,
+    PaginatedResponse,
     ProductBase,
     ProviderBase,
     SellingPlanBase,
@@ -61,6 +62,10 @@ class ProductCreateBulkResponse(BaseSchema):
     errors_details: list[str]
 
 
-class GetProductsResponse(BaseSchema):
-    total_count: int
+class ProductRankingRebuildResponse(BaseSchema):
+    rankings_count: int
+    neighbors_count: int
+
+
+class GetProductsResponse(PaginatedResponse):
     products: list[ProductBase]
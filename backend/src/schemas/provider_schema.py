@@ -4,7 +4,12 @@ from typing import Annotated
 from pydantic import EmailStr, Field, field_validator
 
 from src.errors.errors import BadRequestException
-from src.schemas.base_schema import BaseSchema, ProductBase, ProviderBase
+from src.schemas.base_schema import (
+    BaseSchema,
+    PaginatedResponse,
+    ProductBase,
+    ProviderBase,
+)
 
 
 class ProviderCreateRequest(BaseSchema):
@@ -29,6 +34,5 @@ class ProviderResponse(ProviderBase):
     products: list[ProductBase]
 
 
-class GetProvidersResponse(BaseSchema):
-    total_count: int
+class GetProvidersResponse(PaginatedResponse):
     providers: list[ProviderBase]
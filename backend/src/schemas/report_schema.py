@@ -1,4 +1,7 @@
-from src.schemas.base_schema import BaseSchema, OrderBase
+from datetime import date
+
+from src.models.enums.order_status import OrderStatus
+from src.schemas.base_schema import BaseSchema, OrderBase, PaginatedResponse
 from src.schemas.order_schema import OrderProductDetail
 from src.schemas.seller_schema import SellerMinimalResponse
 
@@ -8,6 +11,26 @@ class OrderReportResponse(OrderBase):
     products: list[OrderProductDetail]
 
 
-class GetOrderReportResponse(BaseSchema):
-    total_count: int
+class GetOrderReportResponse(PaginatedResponse):
     orders: list[OrderReportResponse]
+
+
+class SalesBucketResponse(BaseSchema):
+    day: date | None = None
+    seller_id: str | None = None
+    product_id: str | None = None
+    zone_id: str | None = None
+    status: OrderStatus | None = None
+    units: int
+    revenue: float
+    order_lines: int
+
+
+class GetSalesReportResponse(BaseSchema):
+    total_units: int
+    total_revenue: float
+    buckets: list[SalesBucketResponse]
+
+
+class SalesRollupRebuildResponse(BaseSchema):
+    buckets_count: int
@@ -8,6 +8,7 @@ from src.schemas.base_schema import (
     BaseSchema,
     DistributionCenterBase,
     OrderBase,
+    PaginatedResponse,
     RouteBase,
 )
 
@@ -20,6 +21,26 @@ class RouteCreateRequest(BaseSchema):
     order_ids: Annotated[list[str], Field(min_length=1)]
 
 
+class RoutePlanRequest(BaseSchema):
+    distribution_center_id: Annotated[str, Field(min_length=36, max_length=36)]
+    delivery_date: date
+    vehicle_count: Annotated[int, Field(gt=0)]
+    vehicle_capacity: Annotated[int, Field(gt=0)]
+    max_stops: Annotated[int | None, Field(gt=0)] = None
+
+
+class ProposedRoute(BaseSchema):
+    delivery_deadline: date
+    total_units: int
+    estimated_distance_km: float
+    order_ids: list[str]
+
+
+class RoutePlanResponse(BaseSchema):
+    routes: list[ProposedRoute]
+    unassigned_order_ids: list[str]
+
+
 class RouteResponse(RouteBase):
     distribution_center: DistributionCenterBase
     orders: list[OrderBase]
@@ -29,12 +50,12 @@ class RouteMinimalResponse(RouteBase):
     distribution_center: DistributionCenterBase
 
 
-class GetRoutesResponse(BaseSchema):
-    total_count: int
+class GetRoutesResponse(PaginatedResponse):
     routes: list[RouteMinimalResponse]
 
 
 class RouteMapDetail(BaseSchema):
+    stop_sequence: int | None = None
     order_id: str
     order_status: OrderStatus
     delivery_date: date
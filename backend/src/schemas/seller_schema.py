@@ -6,6 +6,7 @@ from src.errors.errors import BadRequestException
 from src.schemas.base_schema import (
     BaseSchema,
     OrderBase,
+    PaginatedResponse,
     SellerBase,
     SellingPlanBase,
     UserBase,
@@ -46,8 +47,7 @@ class SellerMinimalResponse(SellerBase):
     zone: ZoneBase
 
 
-class GetSellersResponse(BaseSchema):
-    total_count: int
+class GetSellersResponse(PaginatedResponse):
     sellers: list[SellerMinimalResponse]
 
 
@@ -55,4 +55,6 @@ class SellerSummaryResponse(BaseSchema):
     id: str
     clients_count: int
     orders_count: int
+    units_sold: int
+    revenue: float
     zone: str
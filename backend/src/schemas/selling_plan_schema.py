@@ -4,6 +4,7 @@ from pydantic import Field
 
 from src.schemas.base_schema import (
     BaseSchema,
+    PaginatedResponse,
     ProductBase,
     SellerBase,
     SellingPlanBase,
@@ -25,6 +26,5 @@ class SellingPlanResponse(SellingPlanBase):
     seller: SellerBase | None = None
 
 
-class GetSellingPlansResponse(BaseSchema):
-    total_count: int
+class GetSellingPlansResponse(PaginatedResponse):
     selling_plans: list[SellingPlanResponse]
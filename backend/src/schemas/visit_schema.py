@@ -6,6 +6,7 @@ from pydantic import Field
 from src.schemas.base_schema import (
     BaseSchema,
     GeolocationBase,
+    PaginatedResponse,
     SellerBase,
     UserBase,
     VisitBase,
@@ -43,8 +44,8 @@ class ClientVisitResponse(VisitBaseResponse):
     seller: SellerBase
 
 
-class GetVisitsResponse(BaseSchema):
-    total_count: int
+class GetVisitsResponse(PaginatedResponse):
+    pass
 
 
 class GetSellerVisitsResponse(GetVisitsResponse):
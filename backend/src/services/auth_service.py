@@ -1,27 +1,29 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.security import create_access_token, verify_password
-from src.core.utils import get_template_path
+from src.core.security import (
+    create_access_token,
+    get_principal_claims,
+    verify_password_async,
+)
 from src.errors.errors import UnauthorizedException
 from src.models.db_models import User
 from src.schemas.auth_schema import LoginRequest, OTPVerifyRequest
-from src.services.email_service import send_email
+from src.services.email_outbox_service import enqueue_email, notify_email_worker
 from src.services.otp_service import create_otp, verify_otp
 from src.services.requests.email_request import EmailRequest
 from src.services.user_service import get_user_by_email
 
 
-def login_user(*, db: Session, login_request: LoginRequest) -> int:
-    user = get_user_by_email(db=db, email=login_request.email)
-    if not user or not verify_password(login_request.password, user.hashed_password):
+async def login_user(*, db: AsyncSession, login_request: LoginRequest) -> int:
+    user = await get_user_by_email(db=db, email=login_request.email)
+    if not user or not await verify_password_async(
+        login_request.password, user.hashed_password
+    ):
         raise UnauthorizedException("Invalid email or password")
 
-    otp = create_otp(db=db, user=user)
-    html_template = open(
-        get_template_path("otp_template.html"), encoding="utf-8"
-    ).read()
+    otp = await create_otp(db=db, user=user)
     email_request = EmailRequest.from_template(
-        html_template=html_template,
+        template_name="otp_template.html",
         email_receiver=user.email,
         email_subject="Tu código de verificación para MediSupply",
         template_values={
@@ -30,19 +32,18 @@ def login_user(*, db: Session, login_request: LoginRequest) -> int:
             "otp_expiration_minutes": otp.expiration_minutes,
         },
     )
-    send_email(email_request)
+    await enqueue_email(db=db, email_request=email_request)
+    # The OTP and its email are committed together; delivery happens in the worker.
+    await db.commit()
+    notify_email_worker()
 
     return otp.expiration_minutes
 
 
-def verify_otp_and_get_token(
-    *, db: Session, otp_verify_request: OTPVerifyRequest, user: User
+async def verify_otp_and_get_token(
+    *, db: AsyncSession, otp_verify_request: OTPVerifyRequest, user: User
 ) -> str:
-    verify_otp(db=db, user=user, otp_code=otp_verify_request.otp_code)
-    token_data = {
-        "sub": str(user.id),
-        "role": user.role.value,
-    }
-    access_token = create_access_token(data=token_data)
+    await verify_otp(db=db, user=user, otp_code=otp_verify_request.otp_code)
+    access_token = create_access_token(data=get_principal_claims(user))
 
     return access_token
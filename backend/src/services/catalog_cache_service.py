@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session, raiseload
+
+from src.core.config import settings
+from src.core.utils import compute_etag
+from src.db.pagination import Page, decode_cursor, encode_cursor
+from src.models.db_models import CatalogVersion, Product
+from src.models.enums.user_role import UserRole
+from src.schemas.base_schema import ProductBase
+from src.services.principal_cache_service import Principal
+
+CATALOG_KEYS = (Product.name, Product.id)
+_CATALOG_CHANGED = "catalog_changed"
+_CATALOG_VERSION_ID = 1
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    products: list[dict[str, Any]]
+    positions: dict[tuple[str, str], int]
+    etag: str
+    version: int
+    expires_at: float
+
+
+# Keyed by whether the snapshot only holds products in stock.
+_snapshots: dict[bool, CatalogSnapshot] = {}
+_lock = threading.Lock()
+# asyncio locks belong to one event loop, so each loop gets its own set.
+_rebuild_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[bool, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+async def get_catalog_page(
+    *,
+    db: AsyncSession,
+    current_user: Principal,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> tuple[Page[dict[str, Any]], str] | None:
+    """
+    Pages the serialized catalog visible to the user and returns it with its ETag.
+
+    Returns None when the cache is disabled or the cursor points at a product the
+    snapshot does not hold, so the caller can page from the database instead.
+    """
+    if settings.catalog_cache_ttl_seconds <= 0:
+        return None
+
+    snapshot = await _get_snapshot(
+        db=db, in_stock_only=current_user.role != UserRole.ADMIN
+    )
+    start = 0
+    if cursor:
+        position = snapshot.positions.get(tuple(decode_cursor(cursor, CATALOG_KEYS)))
+        if position is None:
+            return None
+        start = position + 1
+    stop = start + limit if limit else len(snapshot.products)
+    items = snapshot.products[start:stop]
+    next_cursor = (
+        encode_cursor([items[-1]["name"], items[-1]["id"]])
+        if items and stop < len(snapshot.products)
+        else None
+    )
+    etag = compute_etag(
+        {
+            "catalog": snapshot.etag,
+            "limit": limit,
+            "cursor": cursor,
+            "include_total": include_total,
+        }
+    )
+
+    return (
+        Page(
+            items=items,
+            next_cursor=next_cursor,
+            total_count=len(snapshot.products) if include_total else None,
+        ),
+        etag,
+    )
+
+
+async def _get_snapshot(*, db: AsyncSession, in_stock_only: bool) -> CatalogSnapshot:
+    # The version is read before the products, so a snapshot never claims a
+    # version newer than the rows it holds.
+    version = (
+        await db.scalar(
+            select(CatalogVersion.version).filter_by(id=_CATALOG_VERSION_ID)
+        )
+        or 0
+    )
+    snapshot = _snapshots.get(in_stock_only)
+    if _is_fresh(snapshot=snapshot, version=version):
+        return snapshot
+
+    # Requests that miss together wait for a single rebuild.
+    async with _get_rebuild_lock(in_stock_only):
+        snapshot = _snapshots.get(in_stock_only)
+        if _is_fresh(snapshot=snapshot, version=version):
+            return snapshot
+
+        query = select(Product).options(raiseload("*")).order_by(*CATALOG_KEYS)
+        if in_stock_only:
+            query = query.filter(Product.stock > 0)
+        products = [
+            ProductBase.model_validate(product).model_dump(mode="json")
+            for product in await db.scalars(query)
+        ]
+        snapshot = CatalogSnapshot(
+            products=products,
+            positions={
+                (product["name"], product["id"]): position
+                for position, product in enumerate(products)
+            },
+            etag=compute_etag(products),
+            version=version,
+            expires_at=time.monotonic() + settings.catalog_cache_ttl_seconds,
+        )
+        with _lock:
+            current = _snapshots.get(in_stock_only)
+            if current is None or current.version <= version:
+                _snapshots[in_stock_only] = snapshot
+
+    return snapshot
+
+
+def _is_fresh(*, snapshot: CatalogSnapshot | None, version: int) -> bool:
+    return (
+        snapshot is not None
+        and snapshot.version >= version
+        and snapshot.expires_at > time.monotonic()
+    )
+
+
+def _get_rebuild_lock(in_stock_only: bool) -> asyncio.Lock:
+    with _lock:
+        locks = _rebuild_locks.setdefault(asyncio.get_running_loop(), {})
+
+        return locks.setdefault(in_stock_only, asyncio.Lock())
+
+
+def invalidate_catalog() -> None:
+    with _lock:
+        _snapshots.clear()
+
+
+def mark_catalog_changed(db: AsyncSession) -> None:
+    """Bumps the catalog version when the session commits, for bulk statements."""
+    db.info[_CATALOG_CHANGED] = True
+
+
+@event.listens_for(Product, "after_insert")
+@event.listens_for(Product, "after_update")
+@event.listens_for(Product, "after_delete")
+def _mark_changed_product(_mapper, _connection, product: Product) -> None:
+    session = object_session(product)
+    if session is not None:
+        session.info[_CATALOG_CHANGED] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_catalog_version(session: Session) -> None:
+    # The bump commits with the change itself, so every worker sees both at
+    # once. It runs last to hold the version row lock as briefly as possible.
+    # Releasing a savepoint commits nothing.
+    if session.in_nested_transaction():
+        return
+    session.flush()
+    if not session.info.pop(_CATALOG_CHANGED, False):
+        return
+    statement = insert(CatalogVersion).values(id=_CATALOG_VERSION_ID, version=1)
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[CatalogVersion.id],
+            set_={"version": CatalogVersion.version + 1},
+        )
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_catalog(session: Session) -> None:
+    # A savepoint rollback keeps the changes made before the savepoint.
+    if not session.in_nested_transaction():
+        session.info.pop(_CATALOG_CHANGED, None)
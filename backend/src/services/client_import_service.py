@@ -0,0 +1,356 @@
+import asyncio
+import csv
+import heapq
+import io
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from pydantic import ValidationError
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.logging_config import logger
+from src.core.security import hash_password
+from src.errors.errors import (
+    ApiError,
+    BadRequestException,
+    UnprocessableEntityException,
+)
+from src.models.db_models import Geolocation, User
+from src.models.enums.user_role import UserRole
+from src.schemas.client_schema import ClientCreateBulkResponse
+from src.schemas.user_schema import UserCreateRequest
+from src.services.geocoding_cache_service import cache_addresses, get_cached_addresses
+from src.services.geocoding_service import (
+    ValidatedAddress,
+    get_validated_address,
+    normalize_address,
+)
+
+CLIENT_IMPORT_COLUMNS = ("full_name", "email", "phone", "doi", "address", "password")
+
+_geocoding_pool: ThreadPoolExecutor | None = None
+_hashing_pool: ThreadPoolExecutor | None = None
+
+
+@dataclass
+class _ClientRow:
+    number: int
+    request: UserCreateRequest
+    geolocation: ValidatedAddress | None = None
+    hashed_password: str | None = None
+    seller_id: str | None = None
+
+
+async def import_clients(
+    *, db: AsyncSession, content: bytes, filename: str | None
+) -> ClientCreateBulkResponse:
+    records = _parse_records(content=content, filename=filename)
+    errors_details = []
+
+    rows = []
+    for number, record in enumerate(records, start=1):
+        try:
+            rows.append(_ClientRow(number=number, request=UserCreateRequest(**record)))
+        except ValidationError as e:
+            errors_details.append(_row_error(number, record, _validation_message(e)))
+        except ApiError as e:
+            errors_details.append(_row_error(number, record, e.message))
+
+    rows = await _drop_duplicated_clients(
+        db=db, rows=rows, errors_details=errors_details
+    )
+    rows = await _geocode_rows(db=db, rows=rows, errors_details=errors_details)
+    if rows:
+        await _hash_passwords(rows=rows)
+        await _assign_sellers(db=db, rows=rows)
+    rows_inserted = await _insert_rows(db=db, rows=rows, errors_details=errors_details)
+
+    errors = len(records) - rows_inserted
+    logger.info(f"Imported [{rows_inserted}] of [{len(records)}] clients")
+
+    return ClientCreateBulkResponse(
+        success=errors == 0,
+        rows_total=len(records),
+        rows_inserted=rows_inserted,
+        errors=errors,
+        errors_details=[detail for _, detail in sorted(errors_details)],
+    )
+
+
+def _parse_records(*, content: bytes, filename: str | None) -> list[dict]:
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BadRequestException("The file must be UTF-8 encoded")
+
+    if (filename or "").lower().endswith(".json"):
+        try:
+            records = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise BadRequestException(f"Invalid JSON file: {e}")
+        if not isinstance(records, list) or not all(
+            isinstance(record, dict) for record in records
+        ):
+            raise BadRequestException("The JSON file must contain a list of clients")
+    else:
+        reader = csv.DictReader(io.StringIO(text))
+        missing_columns = set(CLIENT_IMPORT_COLUMNS) - set(reader.fieldnames or [])
+        if missing_columns:
+            raise BadRequestException(
+                f"Missing CSV columns: {', '.join(sorted(missing_columns))}"
+            )
+        records = [
+            {column: record[column] for column in CLIENT_IMPORT_COLUMNS}
+            for record in reader
+        ]
+
+    if not records:
+        raise BadRequestException("The file does not contain any client")
+    if len(records) > settings.client_import_max_rows:
+        raise UnprocessableEntityException(
+            f"The file exceeds the limit of {settings.client_import_max_rows} clients"
+        )
+
+    return records
+
+
+async def _drop_duplicated_clients(
+    *, db: AsyncSession, rows: list[_ClientRow], errors_details: list[tuple]
+) -> list[_ClientRow]:
+    if not rows:
+        return rows
+
+    existing = (
+        await db.execute(
+            select(User.email, User.doi).filter(
+                or_(
+                    User.email.in_({row.request.email for row in rows}),
+                    User.doi.in_({row.request.doi for row in rows}),
+                )
+            )
+        )
+    ).all()
+    seen_emails = {email for email, _ in existing}
+    seen_dois = {doi for _, doi in existing}
+
+    unique_rows = []
+    for row in rows:
+        if row.request.email in seen_emails or row.request.doi in seen_dois:
+            errors_details.append(
+                _row_error(
+                    row.number,
+                    row.request.model_dump(),
+                    "User with this email or DOI already exists",
+                )
+            )
+            continue
+        seen_emails.add(row.request.email)
+        seen_dois.add(row.request.doi)
+        unique_rows.append(row)
+
+    return unique_rows
+
+
+async def _geocode_rows(
+    *, db: AsyncSession, rows: list[_ClientRow], errors_details: list[tuple]
+) -> list[_ClientRow]:
+    if not rows:
+        return rows
+
+    # Every distinct address is resolved once, whatever the number of rows using it.
+    addresses = {}
+    for row in rows:
+        addresses.setdefault(
+            normalize_address(row.request.address), row.request.address
+        )
+    geolocations = await get_cached_addresses(db=db, addresses=list(addresses.values()))
+
+    pending_addresses = [
+        address
+        for normalized_address, address in addresses.items()
+        if normalized_address not in geolocations
+    ]
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(_get_geocoding_pool(), get_validated_address, address)
+            for address in pending_addresses
+        ),
+        return_exceptions=True,
+    )
+    failures = {}
+    resolved_addresses = {}
+    for address, result in zip(pending_addresses, results):
+        if isinstance(result, ValidatedAddress):
+            resolved_addresses[address] = result
+            geolocations[normalize_address(address)] = result
+        else:
+            failures[normalize_address(address)] = (
+                result.message if isinstance(result, ApiError) else str(result)
+            )
+    await cache_addresses(db=db, validated_addresses=resolved_addresses)
+    await db.commit()
+
+    geocoded_rows = []
+    for row in rows:
+        normalized_address = normalize_address(row.request.address)
+        if normalized_address in failures:
+            errors_details.append(
+                _row_error(
+                    row.number, row.request.model_dump(), failures[normalized_address]
+                )
+            )
+            continue
+        row.geolocation = geolocations[normalized_address]
+        geocoded_rows.append(row)
+
+    return geocoded_rows
+
+
+async def _hash_passwords(*, rows: list[_ClientRow]) -> None:
+    # Imports hash on their own pool, so a large file never queues logins behind it.
+    loop = asyncio.get_running_loop()
+    hashed_passwords = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                _get_hashing_pool(), hash_password, row.request.password
+            )
+            for row in rows
+        )
+    )
+    for row, hashed_password in zip(rows, hashed_passwords):
+        row.hashed_password = hashed_password
+
+
+async def _assign_sellers(*, db: AsyncSession, rows: list[_ClientRow]) -> None:
+    # Each client goes to the commercial user with the fewest clients so far.
+    client = User.__table__.alias("client")
+    sellers = [
+        [clients_count, seller_id]
+        for seller_id, clients_count in await db.execute(
+            select(User.id, func.count(client.c.id))
+            .outerjoin(client, client.c.seller_id == User.id)
+            .filter(User.role == UserRole.COMMERCIAL)
+            .group_by(User.id)
+        )
+    ]
+    if not sellers:
+        return
+
+    heapq.heapify(sellers)
+    for row in rows:
+        row.seller_id = sellers[0][1]
+        heapq.heapreplace(sellers, [sellers[0][0] + 1, sellers[0][1]])
+
+
+async def _insert_rows(
+    *, db: AsyncSession, rows: list[_ClientRow], errors_details: list[tuple]
+) -> int:
+    rows_inserted = 0
+    for start in range(0, len(rows), settings.client_import_batch_size):
+        stop = start + settings.client_import_batch_size
+        batch = rows[start:stop]
+        try:
+            await _insert_batch(db=db, rows=batch)
+            await db.commit()
+            rows_inserted += len(batch)
+            continue
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"Client import batch failed, retrying row by row: {e}")
+
+        for row in batch:
+            try:
+                async with db.begin_nested():
+                    await _insert_batch(db=db, rows=[row])
+                rows_inserted += 1
+            except Exception as e:
+                errors_details.append(
+                    _row_error(
+                        row.number,
+                        row.request.model_dump(),
+                        f"Unexpected error: {str(e.__cause__ or e).splitlines()[0]}",
+                    )
+                )
+        await db.commit()
+
+    return rows_inserted
+
+
+async def _insert_batch(*, db: AsyncSession, rows: list[_ClientRow]) -> None:
+    geolocation_ids = [str(uuid.uuid4()) for _ in rows]
+    await db.execute(
+        insert(Geolocation),
+        [
+            {
+                "id": geolocation_id,
+                "address": row.geolocation.formatted_address,
+                "latitude": row.geolocation.latitude,
+                "longitude": row.geolocation.longitude,
+            }
+            for geolocation_id, row in zip(geolocation_ids, rows)
+        ],
+    )
+    await db.execute(
+        insert(User),
+        [
+            {
+                "full_name": row.request.full_name,
+                "email": row.request.email,
+                "hashed_password": row.hashed_password,
+                "phone": row.request.phone,
+                "role": UserRole.INSTITUTIONAL,
+                "doi": row.request.doi,
+                "address": row.request.address,
+                "seller_id": row.seller_id,
+                "geolocation_id": geolocation_id,
+            }
+            for geolocation_id, row in zip(geolocation_ids, rows)
+        ],
+    )
+
+
+def _get_geocoding_pool() -> ThreadPoolExecutor:
+    global _geocoding_pool
+    if _geocoding_pool is None:
+        _geocoding_pool = ThreadPoolExecutor(
+            max_workers=settings.client_import_geocoding_workers,
+            thread_name_prefix="client-import-geocoding",
+        )
+
+    return _geocoding_pool
+
+
+def _get_hashing_pool() -> ThreadPoolExecutor:
+    global _hashing_pool
+    if _hashing_pool is None:
+        _hashing_pool = ThreadPoolExecutor(
+            max_workers=settings.client_import_hashing_workers,
+            thread_name_prefix="client-import-hashing",
+        )
+
+    return _hashing_pool
+
+
+def shutdown_client_import_pools() -> None:  # pragma: no cover
+    global _geocoding_pool, _hashing_pool
+    for pool in (_geocoding_pool, _hashing_pool):
+        if pool is not None:
+            pool.shutdown(wait=False)
+    _geocoding_pool = None
+    _hashing_pool = None
+
+
+def _row_error(number: int, record: dict, message: str) -> tuple[int, str]:
+    return number, f"Error for client '{record.get('email')}' (row {number}): {message}"
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
@@ -1,13 +1,72 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
+from src.core.logging_config import logger
 from src.models.db_models import DistributionCenter
+from src.schemas.distribution_center_schema import DistributionCenterCreateRequest
+from src.services.geolocation_service import geocode_address
 
 
-def get_distribution_centers(*, db: Session) -> list[DistributionCenter]:
-    return db.query(DistributionCenter).all()  # type: ignore
+async def create_distribution_center(
+    *,
+    db: AsyncSession,
+    distribution_center_create_request: DistributionCenterCreateRequest,
+) -> DistributionCenter:
+    latitude = distribution_center_create_request.latitude
+    longitude = distribution_center_create_request.longitude
+    # Routes start and end at the center, so it always needs coordinates.
+    if latitude is None:
+        validated_address = await geocode_address(
+            db=db,
+            address=", ".join(
+                [
+                    distribution_center_create_request.address,
+                    distribution_center_create_request.city,
+                    distribution_center_create_request.country,
+                ]
+            ),
+        )
+        latitude = validated_address.latitude
+        longitude = validated_address.longitude
 
+    distribution_center = DistributionCenter(
+        name=distribution_center_create_request.name,
+        address=distribution_center_create_request.address,
+        city=distribution_center_create_request.city,
+        country=distribution_center_create_request.country,
+        latitude=latitude,
+        longitude=longitude,
+    )
+    db.add(distribution_center)
+    await db.commit()
+    await db.refresh(distribution_center, attribute_names=["orders", "routes"])
+    logger.info(
+        f"Distribution center created successfully with id [{distribution_center.id}]"
+    )
 
-def get_distribution_center_by_id(
-    *, db: Session, distribution_center_id: str
+    return distribution_center
+
+
+async def get_distribution_centers(*, db: AsyncSession) -> list[DistributionCenter]:
+    return list(await db.scalars(select(DistributionCenter).options(raiseload("*"))))
+
+
+async def get_distribution_center_by_id(
+    *, db: AsyncSession, distribution_center_id: str
 ) -> DistributionCenter | None:
-    return db.query(DistributionCenter).filter_by(id=distribution_center_id).first()
+    return await db.scalar(
+        select(DistributionCenter)
+        .filter_by(id=distribution_center_id)
+        .options(
+            selectinload(DistributionCenter.orders),
+            selectinload(DistributionCenter.routes),
+            raiseload("*"),
+        )
+    )
+
+
+async def distribution_center_exists(
+    *, db: AsyncSession, distribution_center_id: str
+) -> bool:
+    return await db.get(DistributionCenter, distribution_center_id) is not None
@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.logging_config import logger
+from src.db.database import async_session_scope
+from src.models.db_models import EmailOutbox
+from src.models.enums.email_status import EmailStatus
+from src.services.email_service import get_mailer
+from src.services.requests.email_request import EmailRequest
+
+_worker_task: asyncio.Task | None = None
+_wake_up: asyncio.Event | None = None
+
+
+async def enqueue_email(
+    *, db: AsyncSession, email_request: EmailRequest
+) -> EmailOutbox:
+    """Stages the email in the session; it is delivered after the caller's commit."""
+    email = EmailOutbox(
+        email_receiver=email_request.email_receiver,
+        email_subject=email_request.email_subject,
+        email_content=email_request.email_content,
+        status=EmailStatus.PENDING,
+        attempts=0,
+    )
+    db.add(email)
+
+    return email
+
+
+async def deliver_pending_emails(*, db: AsyncSession, limit: int) -> int:
+    """Sends one batch of due emails and returns how many were processed."""
+    # Workers in other processes skip the rows this batch holds locked.
+    emails = list(
+        await db.scalars(
+            select(EmailOutbox)
+            .filter(
+                EmailOutbox.status == EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= datetime.now(timezone.utc),
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+    )
+    if not emails:
+        return 0
+
+    errors = await asyncio.to_thread(
+        _send_batch,
+        [
+            EmailRequest(
+                email_receiver=email.email_receiver,
+                email_subject=email.email_subject,
+                email_content=email.email_content,
+            )
+            for email in emails
+        ],
+    )
+    now = datetime.now(timezone.utc)
+    for email, error in zip(emails, errors):
+        email.attempts += 1
+        email.last_error = error
+        if error is None:
+            email.status = EmailStatus.SENT
+            email.sent_at = now
+            email.email_content = None
+        elif email.attempts >= settings.email_max_attempts:
+            email.status = EmailStatus.FAILED
+        else:
+            email.next_attempt_at = now + timedelta(
+                seconds=settings.email_retry_backoff_seconds * 2 ** (email.attempts - 1)
+            )
+    await db.commit()
+
+    return len(emails)
+
+
+def notify_email_worker() -> None:
+    """Wakes the worker up so a freshly committed email is not left waiting."""
+    if _wake_up is not None:
+        _wake_up.set()
+
+
+def start_email_worker() -> None:  # pragma: no cover
+    global _worker_task, _wake_up
+    if _worker_task is None:
+        _wake_up = asyncio.Event()
+        _worker_task = asyncio.get_running_loop().create_task(_run_email_worker())
+
+
+async def stop_email_worker() -> None:  # pragma: no cover
+    global _worker_task, _wake_up
+    if _worker_task is not None:
+        _worker_task.cancel()
+        try:
+            await _worker_task
+        except asyncio.CancelledError:
+            pass
+    _worker_task = _wake_up = None
+
+
+async def _run_email_worker() -> None:  # pragma: no cover
+    while True:
+        _wake_up.clear()
+        try:
+            async with async_session_scope() as db:
+                processed = await deliver_pending_emails(
+                    db=db, limit=settings.email_worker_batch_size
+                )
+        except Exception as e:
+            logger.error(f"Email worker failed to deliver a batch: {e}")
+            processed = 0
+        if processed == settings.email_worker_batch_size:
+            continue
+        try:
+            await asyncio.wait_for(
+                _wake_up.wait(), timeout=settings.email_worker_poll_seconds
+            )
+        except asyncio.TimeoutError:
+            pass
+
+
+def _send_batch(email_requests: list[EmailRequest]) -> list[str | None]:
+    mailer = get_mailer()
+    errors = []
+    for email_request in email_requests:
+        try:
+            mailer.send(email_request)
+            errors.append(None)
+        except Exception as e:
+            logger.error(
+                f"Failed to send email to [{email_request.email_receiver}]: {e}"
+            )
+            errors.append(str(e))
+
+    return errors
@@ -1,28 +1,103 @@
 import smtplib
 import ssl
+import threading
 from email.message import EmailMessage
+from typing import Protocol
 
 from src.core.config import settings
 from src.core.logging_config import logger
-from src.errors.errors import ApiError
 from src.services.requests.email_request import EmailRequest
 
 context = ssl.create_default_context()
 
 
-def send_email(email_request: EmailRequest) -> None:  # pragma: no cover
-    try:
-        email_message = EmailMessage()
-        email_message["From"] = settings.email_sender
-        email_message["To"] = email_request.email_receiver
-        email_message["Subject"] = email_request.email_subject
-        email_message.set_content(email_request.email_content, subtype="html")
+class Mailer(Protocol):
+    def send(self, email_request: EmailRequest) -> None: ...
 
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465, context=context) as smtp:
+    def close(self) -> None: ...
+
+
+class SmtpMailer:
+    """Keeps one authenticated SMTP connection open across messages."""
+
+    def __init__(self) -> None:
+        self._smtp: smtplib.SMTP_SSL | None = None
+
+    def send(self, email_request: EmailRequest) -> None:
+        email_message = _build_email_message(email_request)
+        try:
+            self._get_connection().send_message(email_message)
+        except smtplib.SMTPServerDisconnected:
+            # Idle connections are dropped by the server; retry once on a new one.
+            self.close()
+            self._get_connection().send_message(email_message)
+        logger.info(f"Email sent successfully to [{email_request.email_receiver}]")
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            pass
+        finally:
+            self._smtp = None
+
+    def _get_connection(self) -> smtplib.SMTP_SSL:
+        if self._smtp is None:
+            smtp = smtplib.SMTP_SSL(
+                settings.smtp_host,
+                settings.smtp_port,
+                context=context,
+                timeout=settings.smtp_timeout_seconds,
+            )
             smtp.login(settings.email_sender, settings.email_api_key)
-            smtp.send_message(email_message)
-            logger.info(f"Email sent successfully to [{email_request.email_receiver}]")
+            self._smtp = smtp
+
+        return self._smtp
+
+
+class LocalMailer:
+    """Keeps the messages in memory instead of sending them; meant for tests."""
+
+    def __init__(self) -> None:
+        self.sent: list[EmailRequest] = []
+
+    def send(self, email_request: EmailRequest) -> None:
+        self.sent.append(email_request)
+
+    def close(self) -> None:
+        pass
+
+
+_mailer: Mailer | None = None
+_mailer_lock = threading.Lock()
+
+
+def get_mailer() -> Mailer:
+    global _mailer
+    with _mailer_lock:
+        if _mailer is None:
+            _mailer = (
+                LocalMailer() if settings.email_backend == "local" else SmtpMailer()
+            )
+
+    return _mailer
+
+
+def set_mailer(mailer: Mailer | None) -> None:
+    global _mailer
+    with _mailer_lock:
+        if _mailer is not None and _mailer is not mailer:
+            _mailer.close()
+        _mailer = mailer
+
+
+def _build_email_message(email_request: EmailRequest) -> EmailMessage:
+    email_message = EmailMessage()
+    email_message["From"] = settings.email_sender
+    email_message["To"] = email_request.email_receiver
+    email_message["Subject"] = email_request.email_subject
+    email_message.set_content(email_request.email_content, subtype="html")
 
-    except Exception as e:
-        logger.error(f"Failed to send email: {e}")
-        raise ApiError(f"Failed to send email: {e}")
+    return email_message
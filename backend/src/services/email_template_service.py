@@ -0,0 +1,68 @@
+import os
+import threading
+from typing import Any
+
+import pystache
+from pystache.parsed import ParsedTemplate
+
+from src.core.config import settings
+from src.core.utils import get_template_path
+
+_renderer = pystache.Renderer()
+
+
+class TemplateRegistry:
+    """Parses the HTML templates of a directory once and renders them from memory."""
+
+    def __init__(self, directory: str, reload: bool = False) -> None:
+        self.directory = directory
+        self.reload = reload
+        self._templates: dict[str, tuple[float, ParsedTemplate]] = {}
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        for template_name in sorted(os.listdir(self.directory)):
+            if template_name.endswith(".html"):
+                self._parse(template_name)
+
+    def render(self, template_name: str, template_values: dict[str, Any]) -> str:
+        entry = self._templates.get(template_name)
+        if entry is None or (
+            self.reload and entry[0] != self._modified_at(template_name)
+        ):
+            entry = self._parse(template_name)
+
+        return _renderer.render(entry[1], template_values)
+
+    def _parse(self, template_name: str) -> tuple[float, ParsedTemplate]:
+        with self._lock:
+            modified_at = self._modified_at(template_name)
+            with open(
+                os.path.join(self.directory, template_name), encoding="utf-8"
+            ) as template_file:
+                entry = (modified_at, pystache.parse(template_file.read()))
+            self._templates[template_name] = entry
+
+        return entry
+
+    def _modified_at(self, template_name: str) -> float:
+        return os.path.getmtime(os.path.join(self.directory, template_name))
+
+
+_registry: TemplateRegistry | None = None
+
+
+def get_template_registry() -> TemplateRegistry:
+    global _registry
+    if _registry is None:
+        _registry = TemplateRegistry(
+            directory=os.path.dirname(get_template_path("")),
+            reload=settings.email_templates_reload,
+        )
+        _registry.load()
+
+    return _registry
+
+
+def render_template(template_name: str, template_values: dict[str, Any]) -> str:
+    return get_template_registry().render(template_name, template_values)
@@ -0,0 +1,188 @@
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.models.db_models import GeocodedAddress
+from src.services.geocoding_service import ValidatedAddress, normalize_address
+
+# Per-process LRU in front of the shared table; values are (expires_at, address).
+_memory_cache: OrderedDict[str, tuple[float, ValidatedAddress]] = OrderedDict()
+_stats = {"memory_hits": 0, "database_hits": 0, "misses": 0}
+_PENDING_ENTRIES = "geocoding_cache_pending"
+_MAX_KEY_LENGTH = GeocodedAddress.normalized_address.type.length
+
+
+async def get_cached_address(
+    *, db: AsyncSession, address: str
+) -> ValidatedAddress | None:
+    cached_addresses = await get_cached_addresses(db=db, addresses=[address])
+
+    return cached_addresses.get(normalize_address(address))
+
+
+async def get_cached_addresses(
+    *, db: AsyncSession, addresses: list[str]
+) -> dict[str, ValidatedAddress]:
+    """Returns the cached entries keyed by normalized address, in one query."""
+    cached_addresses = {}
+    pending_keys = {}
+    for normalized_address in {normalize_address(address) for address in addresses}:
+        key = _cache_key(normalized_address)
+        entry = _memory_cache.get(key)
+        if entry and entry[0] > time.time():
+            _memory_cache.move_to_end(key)
+            _stats["memory_hits"] += 1
+            cached_addresses[normalized_address] = entry[1]
+        else:
+            pending_keys[key] = normalized_address
+    if not pending_keys:
+        return cached_addresses
+
+    geocoded_addresses = await db.scalars(
+        select(GeocodedAddress).filter(
+            GeocodedAddress.normalized_address.in_(pending_keys),
+            GeocodedAddress.expires_at > datetime.now(timezone.utc),
+        )
+    )
+    # Entries this session wrote are remembered once it commits them.
+    uncommitted_keys = db.info.get(_PENDING_ENTRIES, {})
+    for geocoded_address in geocoded_addresses:
+        key = geocoded_address.normalized_address
+        validated_address = ValidatedAddress(
+            formatted_address=geocoded_address.formatted_address,
+            latitude=geocoded_address.latitude,
+            longitude=geocoded_address.longitude,
+            precision=geocoded_address.precision,
+            raw=geocoded_address.raw,
+        )
+        if key not in uncommitted_keys:
+            _remember(
+                key=key,
+                validated_address=validated_address,
+                expires_at=geocoded_address.expires_at,
+            )
+        _stats["database_hits"] += 1
+        cached_addresses[pending_keys.pop(key)] = validated_address
+
+    for key in pending_keys:
+        _memory_cache.pop(key, None)
+    _stats["misses"] += len(pending_keys)
+
+    return cached_addresses
+
+
+async def cache_address(
+    *, db: AsyncSession, address: str, validated_address: ValidatedAddress
+) -> None:
+    await cache_addresses(db=db, validated_addresses={address: validated_address})
+
+
+async def cache_addresses(
+    *, db: AsyncSession, validated_addresses: dict[str, ValidatedAddress]
+) -> None:
+    """
+    Stages the entries in the session; they are persisted with the caller's commit
+    and only reach the in-memory cache once that commit succeeds.
+    """
+    if not validated_addresses:
+        return
+
+    expires_at = datetime.now(timezone.utc) + timedelta(
+        hours=settings.geocoding_cache_ttl_hours
+    )
+    rows = {
+        _cache_key(normalize_address(address)): {
+            "normalized_address": _cache_key(normalize_address(address)),
+            "formatted_address": validated_address.formatted_address,
+            "latitude": validated_address.latitude,
+            "longitude": validated_address.longitude,
+            "precision": validated_address.precision,
+            "raw": validated_address.raw,
+            "expires_at": expires_at,
+        }
+        for address, validated_address in validated_addresses.items()
+    }
+    statement = insert(GeocodedAddress).values(list(rows.values()))
+    await db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[GeocodedAddress.normalized_address],
+            set_={
+                column: statement.excluded[column]
+                for column in (
+                    "formatted_address",
+                    "latitude",
+                    "longitude",
+                    "precision",
+                    "raw",
+                    "expires_at",
+                )
+            },
+        )
+    )
+    db.info.setdefault(_PENDING_ENTRIES, {}).update(
+        {
+            _cache_key(normalize_address(address)): (validated_address, expires_at)
+            for address, validated_address in validated_addresses.items()
+        }
+    )
+
+
+def get_geocoding_cache_stats() -> dict[str, Any]:
+    lookups = sum(_stats.values())
+    hits = _stats["memory_hits"] + _stats["database_hits"]
+
+    return {
+        **_stats,
+        "hit_ratio": round(hits / lookups, 4) if lookups else None,
+        "memory_entries": len(_memory_cache),
+        "memory_capacity": settings.geocoding_cache_size,
+    }
+
+
+def clear_geocoding_cache() -> None:
+    _memory_cache.clear()
+    for key in _stats:
+        _stats[key] = 0
+
+
+def _cache_key(normalized_address: str) -> str:
+    # Addresses that do not fit the key column are keyed by their digest.
+    if len(normalized_address) <= _MAX_KEY_LENGTH:
+        return normalized_address
+
+    return f"sha256:{hashlib.sha256(normalized_address.encode()).hexdigest()}"
+
+
+def _remember(
+    *, key: str, validated_address: ValidatedAddress, expires_at: datetime
+) -> None:
+    _memory_cache[key] = (expires_at.timestamp(), validated_address)
+    _memory_cache.move_to_end(key)
+    while len(_memory_cache) > settings.geocoding_cache_size:
+        _memory_cache.popitem(last=False)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_committed_addresses(session: Session) -> None:
+    # Releasing a savepoint commits nothing.
+    if session.in_nested_transaction():
+        return
+    for key, (validated_address, expires_at) in session.info.pop(
+        _PENDING_ENTRIES, {}
+    ).items():
+        _remember(key=key, validated_address=validated_address, expires_at=expires_at)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_addresses(session: Session) -> None:
+    # A savepoint rollback keeps the entries staged before the savepoint.
+    if not session.in_nested_transaction():
+        session.info.pop(_PENDING_ENTRIES, None)
@@ -1,10 +1,24 @@
+import hashlib
+import random
+import struct
+import threading
+import time
+from typing import Protocol
+
 import googlemaps
+import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
 
 from src.core.config import settings
 from src.core.logging_config import logger
 from src.errors.errors import ApiError, BadRequestException
 
+_RETRIABLE_ERRORS = (
+    googlemaps.exceptions.Timeout,
+    googlemaps.exceptions.TransportError,
+)
+
 
 class ValidatedAddress(BaseModel):
     formatted_address: str
@@ -14,9 +28,138 @@ class ValidatedAddress(BaseModel):
     raw: dict
 
 
-def get_validated_address(address: str) -> ValidatedAddress:  # pragma: no cover
+class Geocoder(Protocol):
+    def geocode(self, address: str) -> ValidatedAddress: ...
+
+    def close(self) -> None: ...
+
+
+class GoogleMapsGeocoder:
+    """
+    Shares one googlemaps client, and therefore one keep-alive HTTP session,
+    across requests. The client enforces the QPS quota and retries 5xx responses
+    within the timeout; transport errors and timeouts are retried here a bounded
+    number of times with jittered exponential backoff.
+    """
+
+    def __init__(self, client: googlemaps.Client | None = None):
+        self.client = client or _build_gmaps_client()
+
+    def geocode(self, address: str) -> ValidatedAddress:
+        results = self._geocode_with_retries(address)
+
+        if not results:
+            raise BadRequestException(
+                "Address not found. Please provide a valid and complete address."
+            )
+
+        result = results[0]
+        geometry = result.get("geometry", {})
+        location_type = geometry.get("location_type", "UNKNOWN")
+        location = geometry.get("location")
+
+        if not location or "lat" not in location or "lng" not in location:
+            raise ApiError("Google Maps returned incomplete location data.")
+
+        if location_type not in ("ROOFTOP",):
+            raise BadRequestException(
+                f"Address is not precise enough (type: {location_type}). Please provide a more specific address."
+            )
+
+        return ValidatedAddress(
+            formatted_address=result["formatted_address"],
+            latitude=location["lat"],
+            longitude=location["lng"],
+            precision=location_type,
+            raw=result,
+        )
+
+    def close(self) -> None:
+        self.client.session.close()
+
+    def _geocode_with_retries(self, address: str) -> list[dict]:
+        for attempt in range(settings.google_maps_max_retries + 1):
+            try:
+                return self.client.geocode(address)  # type: ignore
+            except _RETRIABLE_ERRORS as e:
+                if attempt == settings.google_maps_max_retries:
+                    logger.error(f"Google Maps API error: {e}")
+                    raise ApiError(f"Error communicating with Google Maps: {e}")
+                delay = settings.google_maps_retry_backoff_seconds * 2**attempt
+                time.sleep(delay * random.uniform(0.5, 1.5))
+            except Exception as e:
+                logger.error(f"Google Maps API error: {e}")
+                raise ApiError(f"Error communicating with Google Maps: {e}")
+
+        return []  # pragma: no cover
+
+
+class LocalGeocoder:
+    """
+    Offline stand-in for tests and local development. Known addresses resolve
+    to their fixed result; any other address gets stable coordinates derived
+    from its normalized form.
     """
-    Resolves and validates an address using Google Maps.
+
+    def __init__(self, known_addresses: dict[str, ValidatedAddress] | None = None):
+        self.known_addresses = {
+            normalize_address(address): validated_address
+            for address, validated_address in (known_addresses or {}).items()
+        }
+
+    def geocode(self, address: str) -> ValidatedAddress:
+        normalized_address = normalize_address(address)
+        if normalized_address in self.known_addresses:
+            return self.known_addresses[normalized_address]
+
+        digest = hashlib.sha256(normalized_address.encode()).digest()
+        latitude_offset, longitude_offset = struct.unpack(">HH", digest[:4])
+
+        return ValidatedAddress(
+            formatted_address=address,
+            latitude=round(4.5 + 0.3 * latitude_offset / 0xFFFF, 7),
+            longitude=round(-74.2 + 0.3 * longitude_offset / 0xFFFF, 7),
+            precision="ROOFTOP",
+            raw={},
+        )
+
+    def close(self) -> None:
+        pass
+
+
+_geocoder: Geocoder | None = None
+_geocoder_lock = threading.Lock()
+
+
+def get_geocoder() -> Geocoder:
+    global _geocoder
+    # Geocoding runs in worker threads, so the first callers may race here.
+    with _geocoder_lock:
+        if _geocoder is None:
+            _geocoder = (
+                LocalGeocoder()
+                if settings.geocoder_backend == "local"
+                else GoogleMapsGeocoder()
+            )
+
+    return _geocoder
+
+
+def set_geocoder(geocoder: Geocoder | None) -> None:
+    global _geocoder
+    with _geocoder_lock:
+        if _geocoder is not None and _geocoder is not geocoder:
+            _geocoder.close()
+        _geocoder = geocoder
+
+
+def normalize_address(address: str) -> str:
+    return " ".join(address.lower().split()).strip(" ,.")
+
+
+def get_validated_address(address: str) -> ValidatedAddress:
+    """
+    Resolves and validates an address using the configured geocoder.
 
     Args:
         address (str): The address to validate.
@@ -26,50 +169,30 @@ def get_validated_address(address: str) -> ValidatedAddress:  # pragma: no cover
 
     Raises:
         BadRequestException: If the address is invalid or not precise enough.
-        ApiError: If there is an error communicating with Google Maps.
+        ApiError: If there is an error communicating with the geocoder.
     """
 
     if not address or len(address.strip()) < 5:
         raise BadRequestException("Address is too short or empty.")
 
-    address = address.strip()
-    gmaps_client = _get_gmaps_client()
-
-    try:
-        results = gmaps_client.geocode(address)  # type: ignore
-    except Exception as e:
-        logger.error(f"Google Maps API error: {e}")
-        raise ApiError(f"Error communicating with Google Maps: {e}")
-
-    if not results:
-        raise BadRequestException(
-            "Address not found. Please provide a valid and complete address."
-        )
-
-    result = results[0]
-    geometry = result.get("geometry", {})
-    location_type = geometry.get("location_type", "UNKNOWN")
-    location = geometry.get("location")
-
-    if not location or "lat" not in location or "lng" not in location:
-        raise ApiError("Google Maps returned incomplete location data.")
-
-    if location_type not in ("ROOFTOP",):
-        raise BadRequestException(
-            f"Address is not precise enough (type: {location_type}). Please provide a more specific address."
-        )
-
-    validated_address = ValidatedAddress(
-        formatted_address=result["formatted_address"],
-        latitude=location["lat"],
-        longitude=location["lng"],
-        precision=location_type,
-        raw=result,
-    )
+    validated_address = get_geocoder().geocode(address.strip())
     logger.info(f"Validated address: {validated_address}")
 
     return validated_address
 
 
-def _get_gmaps_client() -> googlemaps.Client:  # pragma: no cover
-    return googlemaps.Client(key=settings.google_maps_api_key)
+def _build_gmaps_client() -> googlemaps.Client:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=settings.google_maps_pool_size
+    )
+    session.mount("https://", adapter)
+
+    return googlemaps.Client(
+        key=settings.google_maps_api_key,
+        connect_timeout=settings.google_maps_timeout_seconds,
+        read_timeout=settings.google_maps_timeout_seconds,
+        retry_timeout=settings.google_maps_timeout_seconds * 2,
+        queries_per_second=settings.google_maps_queries_per_second,
+        requests_session=session,
+    )
@@ -1,33 +1,46 @@
-from sqlalchemy.orm import Session
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.db_models import Geolocation
-from src.services.geocoding_service import get_validated_address
+from src.services.geocoding_cache_service import cache_address, get_cached_address
+from src.services.geocoding_service import ValidatedAddress, get_validated_address
+
+
+async def geocode_address(*, db: AsyncSession, address: str) -> ValidatedAddress:
+    validated_address = await get_cached_address(db=db, address=address)
+    if not validated_address:
+        validated_address = await asyncio.to_thread(
+            get_validated_address, address=address
+        )
+        await cache_address(db=db, address=address, validated_address=validated_address)
 
+    return validated_address
 
-def create_geolocation(*, db: Session, address: str) -> Geolocation:
-    validated_address = get_validated_address(address=address)
 
+async def create_geolocation(*, db: AsyncSession, address: str) -> Geolocation:
+    validated_address = await geocode_address(db=db, address=address)
     geolocation = Geolocation(
         address=validated_address.formatted_address,
         latitude=validated_address.latitude,
         longitude=validated_address.longitude,
     )
     db.add(geolocation)
-    db.commit()
-    db.refresh(geolocation)
+    await db.commit()
+    await db.refresh(geolocation)
 
     return geolocation
 
 
-def create_geolocation_with_coordinates(
-    *, db: Session, latitude: float, longitude: float
+async def create_geolocation_with_coordinates(
+    *, db: AsyncSession, latitude: float, longitude: float
 ) -> Geolocation:
     geolocation = Geolocation(
         latitude=latitude,
         longitude=longitude,
     )
     db.add(geolocation)
-    db.commit()
-    db.refresh(geolocation)
+    await db.commit()
+    await db.refresh(geolocation)
 
     return geolocation
@@ -1,37 +1,52 @@
 from datetime import date
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from src.core.logging_config import logger
+from src.db.pagination import Page, paginate
 from src.errors.errors import (
     ApiError,
     BadRequestException,
     ConflictException,
     NotFoundException,
 )
-from src.models.db_models import Order, OrderProduct, User
+from src.models.db_models import Order, OrderProduct, Product, User
 from src.models.enums.order_status import OrderStatus
 from src.models.enums.user_role import UserRole
 from src.schemas.order_schema import OrderCreateRequest
-from src.services.distribution_center_service import get_distribution_center_by_id
-from src.services.product_service import get_product_by_id
+from src.services.distribution_center_service import distribution_center_exists
+from src.services.principal_cache_service import Principal
+from src.services.product_ranking_service import record_order_rankings
+from src.services.sales_rollup_service import record_order_sales
 from src.services.seller_service import get_institutional_client_for_seller
 from src.services.user_service import get_user_by_id
 
+_ORDER_DETAIL_OPTIONS = (
+    joinedload(Order.seller),
+    joinedload(Order.client),
+    joinedload(Order.distribution_center),
+    joinedload(Order.route),
+    selectinload(Order.order_products).joinedload(OrderProduct.product),
+    raiseload("*"),
+)
+
 
-def create_order(
+async def create_order(
     *,
-    db: Session,
+    db: AsyncSession,
     order_create_request: OrderCreateRequest,
     client_id: str,
     seller_id: str | None = None,
 ) -> Order:
-    _validate_order_request(
+    await _validate_order_request(
         db=db,
         order_create_request=order_create_request,
         client_id=client_id,
         seller_id=seller_id,
     )
+    products = await _reserve_stock(db=db, order_create_request=order_create_request)
     order = Order(
         comments=order_create_request.comments,
         delivery_date=order_create_request.delivery_date,
@@ -41,48 +56,60 @@ def create_order(
     )
 
     db.add(order)
-    db.flush()
-
-    for item in order_create_request.products:
-        product = get_product_by_id(db=db, product_id=item.product_id)
-        if not product:
-            raise NotFoundException(f"Product '{item.product_id}' not found")
-
-        if product.stock < item.quantity:
-            raise ConflictException(
-                f"Insufficient stock for product '{product.name}'. \
-                Available: {product.stock}, requested: {item.quantity}",
-            )
-
-        product.stock -= item.quantity
-
-        order_product = OrderProduct(
-            quantity=item.quantity,
-            order_id=order.id,
-            product_id=product.id,
-        )
-        db.add(order_product)
+    await db.flush()
+    await db.execute(
+        insert(OrderProduct),
+        [
+            {
+                "quantity": item.quantity,
+                "order_id": order.id,
+                "product_id": item.product_id,
+            }
+            for item in order_create_request.products
+        ],
+    )
+    order_lines = [
+        (products[item.product_id], item.quantity)
+        for item in order_create_request.products
+    ]
+    await record_order_sales(
+        db=db,
+        order=order,
+        zone_id=(
+            await db.scalar(select(User.zone_id).filter_by(id=seller_id))
+            if seller_id
+            else None
+        ),
+        order_lines=order_lines,
+    )
+    await record_order_rankings(db=db, order=order, order_lines=order_lines)
 
     try:
-        db.commit()
+        await db.commit()
     except Exception as e:
         logger.error(f"Error creating order: {str(e)}")
         raise ApiError("An error occurred while creating the order")
 
-    db.refresh(order)
-    return order
+    return await _get_order_details(db=db, order_id=order.id)
 
 
-def get_orders(
+async def get_orders(
     *,
-    db: Session,
-    current_user: User,
+    db: AsyncSession,
+    current_user: Principal,
     delivery_date: date | None = None,
     order_status: OrderStatus | None = None,
     distribution_center_id: str | None = None,
     route_id: str | None = None,
-) -> list[Order]:
-    query = db.query(Order)
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Order]:
+    query = select(Order).options(
+        joinedload(Order.distribution_center),
+        joinedload(Order.route),
+        raiseload("*"),
+    )
     if current_user.role == UserRole.COMMERCIAL:
         query = query.filter_by(seller_id=current_user.id)
     elif current_user.role == UserRole.INSTITUTIONAL:
@@ -99,22 +126,71 @@ def get_orders(
         else:
             query = query.filter_by(route_id=route_id)
 
-    return query.all()  # type: ignore
+    return await paginate(
+        db=db,
+        query=query,
+        keys=(Order.created_at, Order.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
-def get_order_by_id(*, db: Session, current_user: User, order_id: str) -> Order | None:
-    query = db.query(Order).filter_by(id=order_id)
+async def get_order_by_id(
+    *, db: AsyncSession, current_user: Principal, order_id: str
+) -> Order | None:
+    query = select(Order).filter_by(id=order_id).options(*_ORDER_DETAIL_OPTIONS)
     if current_user.role == UserRole.COMMERCIAL:
         query = query.filter_by(seller_id=current_user.id)
     elif current_user.role == UserRole.INSTITUTIONAL:
         query = query.filter_by(client_id=current_user.id)
 
-    return query.first()
+    return await db.scalar(query)
+
+
+async def _get_order_details(*, db: AsyncSession, order_id: str) -> Order:
+    return await db.scalar(
+        select(Order)
+        .filter_by(id=order_id)
+        .options(*_ORDER_DETAIL_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+
+
+async def _reserve_stock(
+    *, db: AsyncSession, order_create_request: OrderCreateRequest
+) -> dict[str, Product]:
+    # Rows are locked in id order so concurrent orders over the same products
+    # queue behind each other instead of deadlocking or losing updates.
+    locked_products = await db.scalars(
+        select(Product)
+        .filter(
+            Product.id.in_([item.product_id for item in order_create_request.products])
+        )
+        .order_by(Product.id)
+        .with_for_update()
+    )
+    products = {product.id: product for product in locked_products}
+
+    for item in order_create_request.products:
+        product = products.get(item.product_id)
+        if not product:
+            raise NotFoundException(f"Product '{item.product_id}' not found")
+
+        if product.stock < item.quantity:
+            raise ConflictException(
+                f"Insufficient stock for product '{product.name}'. \
+                Available: {product.stock}, requested: {item.quantity}",
+            )
+
+        product.stock -= item.quantity
+
+    return products
 
 
-def _validate_order_request(
+async def _validate_order_request(
     *,
-    db: Session,
+    db: AsyncSession,
     order_create_request: OrderCreateRequest,
     client_id: str,
     seller_id: str | None = None,
@@ -126,18 +202,18 @@ def _validate_order_request(
             f"Duplicated product IDs in order: {', '.join(duplicated_ids)}"
         )
 
-    distribution_center = get_distribution_center_by_id(
+    distribution_center_found = await distribution_center_exists(
         db=db, distribution_center_id=order_create_request.distribution_center_id
     )
     client = (
-        get_institutional_client_for_seller(
+        await get_institutional_client_for_seller(
             db=db, seller_id=seller_id, client_id=client_id
         )
         if seller_id
-        else get_user_by_id(db=db, user_id=client_id)
+        else await get_user_by_id(db=db, user_id=client_id)
     )
 
-    if not distribution_center or not client:
+    if not distribution_center_found or not client:
         raise NotFoundException("Distribution center or client not found")
 
     if order_create_request.delivery_date < date.today():
@@ -1,17 +1,29 @@
+import asyncio
 import random
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.logging_config import logger
+from src.db.database import async_session_scope
 from src.errors.errors import UnauthorizedException
 from src.models.db_models import OTP, User
 
+_sweeper_task: asyncio.Task | None = None
+_last_sweep: dict[str, Any] = {"deleted": None, "swept_at": None}
 
-def create_otp(*, db: Session, user: User) -> OTP:
+
+async def create_otp(*, db: AsyncSession, user: User) -> OTP:
     otp_code = f"{random.randint(0, 999999):06d}"  # noqa
-    expires_at = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.otp_expiration_minutes
+    expires_at = _utc_now() + timedelta(minutes=settings.otp_expiration_minutes)
+    # Only the latest code is valid; the sweeper removes the superseded ones.
+    await db.execute(
+        update(OTP)
+        .filter(OTP.user_id == user.id, OTP.is_used.is_(False))
+        .values(is_used=True)
     )
 
     otp = OTP(
@@ -22,26 +34,109 @@ def create_otp(*, db: Session, user: User) -> OTP:
         user_id=user.id,
     )
     db.add(otp)
-    db.commit()
-    db.refresh(otp)
+    await db.flush()
 
     return otp
 
 
-def verify_otp(*, db: Session, user: User, otp_code: str) -> None:
-    otp = (
-        db.query(OTP)
-        .filter(
+async def verify_otp(*, db: AsyncSession, user: User, otp_code: str) -> None:
+    otp = await db.scalar(
+        select(OTP).filter(
             OTP.user_id == user.id,
             OTP.code == otp_code,
             OTP.is_used.is_(False),
-            OTP.expires_at > datetime.now(timezone.utc),
+            OTP.expires_at > _utc_now(),
         )
-        .first()
     )
 
     if not otp:
         raise UnauthorizedException("Invalid or expired OTP")
 
     otp.is_used = True
-    db.commit()
+    await db.commit()
+
+
+async def purge_spent_otps(*, db: AsyncSession, batch_size: int) -> int:
+    """Deletes used and expired OTPs in batches, committing after each one."""
+    deleted = 0
+    while True:
+        spent_otps = (
+            select(OTP.id)
+            .filter(or_(OTP.is_used.is_(True), OTP.expires_at <= _utc_now()))
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await db.execute(
+            delete(OTP)
+            .filter(OTP.id.in_(spent_otps))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            break
+
+    _last_sweep.update(deleted=deleted, swept_at=datetime.now(timezone.utc))
+
+    return deleted
+
+
+async def get_otp_table_stats(*, db: AsyncSession) -> dict[str, Any]:
+    now = _utc_now()
+    total, used, expired = (
+        await db.execute(
+            select(
+                func.count(OTP.id),
+                func.count(OTP.id).filter(OTP.is_used.is_(True)),
+                func.count(OTP.id).filter(
+                    OTP.is_used.is_(False), OTP.expires_at <= now
+                ),
+            )
+        )
+    ).one()
+
+    return {
+        "total": total,
+        "active": total - used - expired,
+        "used": used,
+        "expired": expired,
+        "last_sweep_deleted": _last_sweep["deleted"],
+        "last_sweep_at": (
+            _last_sweep["swept_at"].isoformat() if _last_sweep["swept_at"] else None
+        ),
+    }
+
+
+def start_otp_sweeper() -> None:  # pragma: no cover
+    global _sweeper_task
+    if _sweeper_task is None:
+        _sweeper_task = asyncio.get_running_loop().create_task(_run_otp_sweeper())
+
+
+async def stop_otp_sweeper() -> None:  # pragma: no cover
+    global _sweeper_task
+    if _sweeper_task is not None:
+        _sweeper_task.cancel()
+        try:
+            await _sweeper_task
+        except asyncio.CancelledError:
+            pass
+    _sweeper_task = None
+
+
+async def _run_otp_sweeper() -> None:  # pragma: no cover
+    while True:
+        try:
+            async with async_session_scope() as db:
+                deleted = await purge_spent_otps(
+                    db=db, batch_size=settings.otp_sweep_batch_size
+                )
+            logger.info(f"OTP sweeper deleted [{deleted}] used or expired codes")
+        except Exception as e:
+            logger.error(f"OTP sweeper failed: {e}")
+        await asyncio.sleep(settings.otp_sweep_interval_seconds)
+
+
+def _utc_now() -> datetime:
+    # OTP.expires_at is a naive column; asyncpg rejects tz-aware values for it.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,86 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from fastapi.routing import APIRoute
+from starlette.routing import BaseRoute
+
+try:
+    from fastapi.routing import iter_route_contexts
+except ImportError:  # pragma: no cover
+    iter_route_contexts = None
+
+from src.core.utils import compute_etag
+from src.models.enums.user_role import UserRole
+
+PUBLIC_ROLE = "public"
+
+
+@dataclass(frozen=True)
+class RolePermissions:
+    allowed_endpoints: list[dict[str, Any]]
+    etag: str
+
+
+_permission_index: dict[UserRole, RolePermissions] | None = None
+
+
+def build_permission_index(
+    routes: Iterable[BaseRoute],
+) -> dict[UserRole, RolePermissions]:
+    """Groups the endpoints each role can call, public endpoints included."""
+    grouped_by_role = {role: defaultdict(set) for role in UserRole}
+    for route in _iter_api_routes(routes):
+        roles = set()
+        for dependency in [
+            *route.dependant.dependencies,
+            *getattr(route.dependant, "path_dependencies", []),
+        ]:
+            roles.update(
+                role.value for role in getattr(dependency.call, "allowed_roles", [])
+            )
+        roles = frozenset(roles or {PUBLIC_ROLE})
+
+        for role in UserRole:
+            if PUBLIC_ROLE in roles or role.value in roles:
+                grouped_by_role[role][(route.path, roles)].update(
+                    route.methods - {"HEAD", "OPTIONS"}
+                )
+
+    permission_index = {}
+    for role, grouped in grouped_by_role.items():
+        allowed_endpoints = [
+            {
+                "path": path,
+                "methods": sorted(methods),
+                "allowed_roles": sorted(roles),
+            }
+            for (path, roles), methods in grouped.items()
+        ]
+        permission_index[role] = RolePermissions(
+            allowed_endpoints=allowed_endpoints, etag=compute_etag(allowed_endpoints)
+        )
+
+    return permission_index
+
+
+def _iter_api_routes(routes: Iterable[BaseRoute]) -> Iterable[Any]:
+    # Recent FastAPI releases keep included routers nested in app.routes and
+    # expose the resolved routes, prefixes included, through route contexts.
+    if iter_route_contexts is not None:
+        routes = iter_route_contexts(list(routes))
+    for route in routes:
+        if isinstance(getattr(route, "original_route", route), APIRoute):
+            yield route
+
+
+def init_permission_index(routes: Iterable[BaseRoute]) -> None:
+    global _permission_index
+    _permission_index = build_permission_index(routes)
+
+
+def get_role_permissions(role: UserRole) -> RolePermissions:
+    if _permission_index is None:
+        raise RuntimeError("The permission index is built at application startup")
+
+    return _permission_index[role]
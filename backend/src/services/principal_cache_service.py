@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Protocol
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
+
+from src.core.config import settings
+from src.models.db_models import User
+from src.models.enums.user_role import UserRole
+
+_CHANGED_USER_IDS = "changed_user_ids"
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: str
+    role: UserRole
+    seller_id: str | None = None
+    zone_id: str | None = None
+
+
+class PrincipalCacheBackend(Protocol):
+    def get(self, user_id: str) -> Principal | None: ...
+
+    def set(self, principal: Principal, ttl_seconds: int) -> None: ...
+
+    def delete(self, user_id: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryPrincipalCache:
+    """Per-process LRU; entries expire after the TTL given on set."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Principal | None:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if not entry:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+
+            return entry[1]
+
+    def set(self, principal: Principal, ttl_seconds: int) -> None:
+        with self._lock:
+            self._entries[principal.id] = (time.monotonic() + ttl_seconds, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_backend: PrincipalCacheBackend | None = None
+
+
+def get_principal_cache_backend() -> PrincipalCacheBackend:
+    global _backend
+    if _backend is None:
+        _backend = InMemoryPrincipalCache(max_entries=settings.principal_cache_size)
+
+    return _backend
+
+
+def set_principal_cache_backend(backend: PrincipalCacheBackend | None) -> None:
+    """Swaps the cache, e.g. for a backend shared by every worker."""
+    global _backend
+    _backend = backend
+
+
+async def get_principal(*, db: AsyncSession, user_id: str) -> Principal | None:
+    backend = get_principal_cache_backend()
+    principal = backend.get(user_id)
+    if principal:
+        return principal
+
+    row = (
+        await db.execute(
+            select(User.id, User.role, User.seller_id, User.zone_id).filter_by(
+                id=user_id
+            )
+        )
+    ).one_or_none()
+    if not row:
+        return None
+    principal = Principal(
+        id=row.id, role=row.role, seller_id=row.seller_id, zone_id=row.zone_id
+    )
+    if settings.principal_cache_ttl_seconds > 0:
+        backend.set(principal, settings.principal_cache_ttl_seconds)
+
+    return principal
+
+
+def invalidate_principal(user_id: str) -> None:
+    get_principal_cache_backend().delete(user_id)
+
+
+def clear_principal_cache() -> None:
+    get_principal_cache_backend().clear()
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _collect_changed_user(_mapper, _connection, user: User) -> None:
+    # Covers changes flushed through the ORM; bulk UPDATE/DELETE statements
+    # on users must call invalidate_principal themselves.
+    session = object_session(user)
+    if session is not None:
+        session.info.setdefault(_CHANGED_USER_IDS, set()).add(user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # Invalidating at flush would let a concurrent request cache the old row
+    # again before the commit. Releasing a savepoint commits nothing.
+    if session.in_nested_transaction():
+        return
+    for user_id in session.info.pop(_CHANGED_USER_IDS, set()):
+        invalidate_principal(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    # A savepoint rollback keeps the changes made before the savepoint.
+    if not session.in_nested_transaction():
+        session.info.pop(_CHANGED_USER_IDS, None)
@@ -0,0 +1,143 @@
+import asyncio
+import csv
+import io
+from itertools import islice
+from typing import BinaryIO
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.core.logging_config import logger
+from src.errors.errors import BadRequestException
+from src.schemas.product_schema import ProductCreateBulkResponse, ProductCreateRequest
+from src.services.product_service import (
+    filter_known_providers,
+    insert_product_rows,
+    product_error,
+)
+
+PRODUCT_IMPORT_COLUMNS = (
+    "name",
+    "details",
+    "store",
+    "batch",
+    "image_url",
+    "due_date",
+    "stock",
+    "price_per_unit",
+    "provider_id",
+)
+_REQUIRED_COLUMNS = set(PRODUCT_IMPORT_COLUMNS) - {"image_url"}
+
+
+async def import_products(
+    *, db: AsyncSession, file: BinaryIO
+) -> ProductCreateBulkResponse:
+    """Streams a CSV catalog into the database one chunk of rows at a time."""
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    fieldnames = await _read(lambda: reader.fieldnames, rows_read=0)
+    missing_columns = _REQUIRED_COLUMNS - set(fieldnames or [])
+    if missing_columns:
+        raise BadRequestException(
+            f"Missing CSV columns: {', '.join(sorted(missing_columns))}"
+        )
+
+    rows_total = rows_inserted = errors = 0
+    errors_details = []
+    provider_ids = set()
+    # The next chunk is parsed in a worker thread while the current one is written.
+    next_chunk = asyncio.ensure_future(_read_chunk(reader, rows_read=0))
+    try:
+        while records := await next_chunk:
+            rows_total += len(records)
+            next_chunk = asyncio.ensure_future(
+                _read_chunk(reader, rows_read=rows_total)
+            )
+
+            chunk_errors = []
+            rows = _validate_records(records=records, errors_details=chunk_errors)
+            rows = await filter_known_providers(
+                db=db,
+                rows=rows,
+                errors_details=chunk_errors,
+                provider_ids=provider_ids,
+                with_row_numbers=True,
+            )
+            chunk_inserted = await insert_product_rows(
+                db=db, rows=rows, errors_details=chunk_errors, with_row_numbers=True
+            )
+            rows_inserted += chunk_inserted
+            errors += len(records) - chunk_inserted
+            # Only the first errors are detailed so that a broken file stays cheap to report.
+            room = settings.product_import_max_error_details - len(errors_details)
+            errors_details.extend(detail for _, detail in sorted(chunk_errors)[:room])
+    finally:
+        # A failed chunk leaves the prefetched read behind.
+        next_chunk.cancel()
+
+    if not rows_total:
+        raise BadRequestException("The file does not contain any product")
+    logger.info(f"Imported [{rows_inserted}] of [{rows_total}] products from a file")
+
+    return ProductCreateBulkResponse(
+        success=errors == 0,
+        rows_total=rows_total,
+        rows_inserted=rows_inserted,
+        errors=errors,
+        errors_details=errors_details,
+    )
+
+
+async def _read_chunk(reader: csv.DictReader, rows_read: int) -> list[tuple[int, dict]]:
+    return await _read(
+        lambda: list(
+            enumerate(
+                islice(reader, settings.product_import_batch_size),
+                start=rows_read + 1,
+            )
+        ),
+        rows_read=rows_read,
+    )
+
+
+async def _read(read, rows_read: int):
+    try:
+        return await asyncio.to_thread(read)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise BadRequestException(
+            f"Invalid CSV file after row {rows_read}, "
+            f"the previous rows were imported: {e}"
+            if rows_read
+            else f"Invalid CSV file: {e}"
+        )
+
+
+def _validate_records(
+    *, records: list[tuple[int, dict]], errors_details: list[tuple[int, str]]
+) -> list[tuple[int, ProductCreateRequest]]:
+    rows = []
+    for number, record in records:
+        values = {
+            column: record.get(column) or None for column in PRODUCT_IMPORT_COLUMNS
+        }
+        try:
+            rows.append((number, ProductCreateRequest(**values)))
+        except ValidationError as e:
+            errors_details.append(
+                product_error(
+                    number,
+                    values["name"],
+                    _validation_message(e),
+                    with_row_numbers=True,
+                )
+            )
+
+    return rows
+
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        for detail in error.errors()
+    )
@@ -0,0 +1,63 @@
+from sqlalchemy import String, cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.db_models import Order, OrderProduct, Product, ProductRanking
+
+
+async def record_order_rankings(
+    *, db: AsyncSession, order: Order, order_lines: list[tuple[Product, int]]
+) -> None:
+    """Adds the order to its client's ranking and to the global one."""
+    statement = insert(ProductRanking).values(
+        [
+            {
+                "client_id": client_id,
+                "product_id": product.id,
+                "units": quantity,
+                "last_purchase_at": order.created_at,
+            }
+            for product, quantity in order_lines
+            for client_id in (order.client_id, None)
+        ]
+    )
+    # The products are already locked by the order, so concurrent orders for the
+    # same product wait there rather than on these rows.
+    await db.execute(
+        statement.on_conflict_do_update(
+            constraint="product_ranking_client_product_constraint",
+            set_={
+                "units": ProductRanking.units + statement.excluded.units,
+                "last_purchase_at": func.greatest(
+                    ProductRanking.last_purchase_at, statement.excluded.last_purchase_at
+                ),
+            },
+        )
+    )
+
+
+async def rebuild_product_rankings(*, db: AsyncSession) -> int:
+    source = union_all(
+        *(
+            select(
+                cast(func.gen_random_uuid(), String),
+                client_id,
+                OrderProduct.product_id,
+                func.sum(OrderProduct.quantity),
+                func.max(Order.created_at),
+            )
+            .join(OrderProduct, OrderProduct.order_id == Order.id)
+            .group_by(client_id, OrderProduct.product_id)
+            for client_id in (Order.client_id, literal(None, String))
+        )
+    )
+
+    await db.execute(delete(ProductRanking))
+    await db.execute(
+        insert(ProductRanking).from_select(
+            ["id", "client_id", "product_id", "units", "last_purchase_at"], source
+        )
+    )
+    await db.commit()
+
+    return await db.scalar(select(func.count(ProductRanking.id)))
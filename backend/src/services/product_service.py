@@ -1,27 +1,38 @@
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from collections import defaultdict
 
+from sqlalchemy import desc, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from src.core.config import settings
 from src.core.logging_config import logger
+from src.db.pagination import Page, paginate
 from src.errors.errors import NotFoundException, UnprocessableEntityException
-from src.models.db_models import Order, OrderProduct, Product, User
+from src.models.db_models import (
+    OrderProduct,
+    Product,
+    ProductNeighbor,
+    ProductRanking,
+    Provider,
+)
 from src.models.enums.user_role import UserRole
 from src.schemas.product_schema import (
     ProductCreateBulkRequest,
     ProductCreateBulkResponse,
     ProductCreateRequest,
 )
-from src.services.provider_service import get_provider_by_id
+from src.services.catalog_cache_service import mark_catalog_changed
+from src.services.principal_cache_service import Principal
+from src.services.product_similarity_service import blend_recommendations
+from src.services.provider_service import provider_exists
 from src.services.seller_service import get_institutional_client_for_seller
 from src.services.user_service import get_user_by_id
 
 
-def create_product(
-    *, db: Session, product_create_request: ProductCreateRequest
+async def create_product(
+    *, db: AsyncSession, product_create_request: ProductCreateRequest
 ) -> Product:
-    existing_provider = get_provider_by_id(
-        db=db, provider_id=product_create_request.provider_id
-    )
-    if not existing_provider:
+    if not await provider_exists(db=db, provider_id=product_create_request.provider_id):
         raise UnprocessableEntityException("Provider with the given ID does not exist")
 
     product = Product(
@@ -37,8 +48,10 @@ def create_product(
     )
 
     db.add(product)
-    db.commit()
-    db.refresh(product)
+    await db.commit()
+    await db.refresh(
+        product, attribute_names=["provider", "selling_plans", "order_products"]
+    )
     logger.info(
         f"Product created successfully with id [{product.id}] and name [{product.name}]"
     )
@@ -46,90 +59,270 @@ def create_product(
     return product
 
 
-def create_products_bulk(
-    *, db: Session, product_create_bulk_request: ProductCreateBulkRequest
+async def create_products_bulk(
+    *, db: AsyncSession, product_create_bulk_request: ProductCreateBulkRequest
 ) -> ProductCreateBulkResponse:
-    rows_total = len(product_create_bulk_request.products)
-    rows_inserted = 0
+    products = product_create_bulk_request.products
     errors_details = []
 
-    for product in product_create_bulk_request.products:
-        try:
-            create_product(db=db, product_create_request=product)
-            rows_inserted += 1
-        except UnprocessableEntityException as e:
-            errors_details.append(f"Error for product '{product.name}': {str(e)}")
-        except Exception as e:
-            errors_details.append(
-                f"Unexpected error for product '{product.name}': {str(e)}"
-            )
+    rows = await filter_known_providers(
+        db=db, rows=list(enumerate(products)), errors_details=errors_details
+    )
+    rows_inserted = await insert_product_rows(
+        db=db, rows=rows, errors_details=errors_details
+    )
 
-    errors = rows_total - rows_inserted
+    errors = len(products) - rows_inserted
+    logger.info(f"Imported [{rows_inserted}] of [{len(products)}] products")
 
     return ProductCreateBulkResponse(
         success=errors == 0,
-        rows_total=rows_total,
+        rows_total=len(products),
         rows_inserted=rows_inserted,
         errors=errors,
-        errors_details=errors_details,
+        errors_details=[detail for _, detail in sorted(errors_details)],
     )
 
 
-def get_products(
-    *, db: Session, current_user: User, limit: int | None = None
-) -> list[Product]:
-    query = db.query(Product)
+async def filter_known_providers(
+    *,
+    db: AsyncSession,
+    rows: list[tuple[int, ProductCreateRequest]],
+    errors_details: list[tuple[int, str]],
+    provider_ids: set[str] | None = None,
+    with_row_numbers: bool = False,
+) -> list[tuple[int, ProductCreateRequest]]:
+    """Drops the rows whose provider does not exist, checking them with one query."""
+    provider_ids = set() if provider_ids is None else provider_ids
+    unknown_provider_ids = {product.provider_id for _, product in rows} - provider_ids
+    if unknown_provider_ids:
+        provider_ids.update(
+            await db.scalars(
+                select(Provider.id).filter(Provider.id.in_(unknown_provider_ids))
+            )
+        )
+
+    known_rows = []
+    for number, product in rows:
+        if product.provider_id in provider_ids:
+            known_rows.append((number, product))
+        else:
+            errors_details.append(
+                product_error(
+                    number,
+                    product.name,
+                    "Provider with the given ID does not exist",
+                    with_row_numbers=with_row_numbers,
+                )
+            )
+
+    return known_rows
+
+
+async def insert_product_rows(
+    *,
+    db: AsyncSession,
+    rows: list[tuple[int, ProductCreateRequest]],
+    errors_details: list[tuple[int, str]],
+    with_row_numbers: bool = False,
+) -> int:
+    """Inserts the rows in batches, isolating the failing rows of a batch."""
+    rows_inserted = 0
+    for start in range(0, len(rows), settings.product_import_batch_size):
+        stop = start + settings.product_import_batch_size
+        batch = rows[start:stop]
+        try:
+            await _insert_products(db=db, products=[product for _, product in batch])
+            await db.commit()
+            rows_inserted += len(batch)
+            continue
+        except Exception as e:
+            await db.rollback()
+            logger.warning(f"Product import batch failed, retrying row by row: {e}")
+
+        for number, product in batch:
+            try:
+                async with db.begin_nested():
+                    await _insert_products(db=db, products=[product])
+                rows_inserted += 1
+            except Exception as e:
+                errors_details.append(
+                    product_error(
+                        number,
+                        product.name,
+                        str(e.__cause__ or e).splitlines()[0],
+                        unexpected=True,
+                        with_row_numbers=with_row_numbers,
+                    )
+                )
+        await db.commit()
+
+    return rows_inserted
+
+
+def product_error(
+    number: int,
+    name: str | None,
+    message: str,
+    *,
+    unexpected: bool = False,
+    with_row_numbers: bool = False,
+) -> tuple[int, str]:
+    error = "Unexpected error" if unexpected else "Error"
+    row = f" (row {number})" if with_row_numbers else ""
+
+    return number, f"{error} for product '{name}'{row}: {message}"
+
+
+async def _insert_products(
+    *, db: AsyncSession, products: list[ProductCreateRequest]
+) -> None:
+    mark_catalog_changed(db)
+    await db.execute(
+        insert(Product),
+        [
+            {
+                "name": product.name,
+                "details": product.details,
+                "store": product.store,
+                "batch": product.batch,
+                "image_url": product.image_url,
+                "due_date": product.due_date,
+                "stock": product.stock,
+                "price_per_unit": product.price_per_unit,
+                "provider_id": product.provider_id,
+            }
+            for product in products
+        ],
+    )
+
+
+async def get_products(
+    *,
+    db: AsyncSession,
+    current_user: Principal,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Product]:
+    query = select(Product).options(raiseload("*"))
     if current_user.role != UserRole.ADMIN:
         query = query.filter(Product.stock > 0)
-    query = query.order_by(Product.name)
-    if limit:
-        query = query.limit(limit)
 
-    return query.all()  # type: ignore
+    return await paginate(
+        db=db,
+        query=query,
+        keys=(Product.name, Product.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+async def get_product_by_id(*, db: AsyncSession, product_id: str) -> Product | None:
+    return await db.scalar(
+        select(Product)
+        .filter_by(id=product_id)
+        .options(
+            joinedload(Product.provider),
+            selectinload(Product.selling_plans),
+            selectinload(Product.order_products).joinedload(OrderProduct.order),
+            raiseload("*"),
+        )
+    )
 
 
-def get_product_by_id(*, db: Session, product_id: str) -> Product | None:
-    return db.query(Product).filter_by(id=product_id).first()
+async def _get_ranked_products(
+    *, db: AsyncSession, limit: int, client_id: str | None = None
+) -> list[Product]:
+    return list(
+        await db.scalars(
+            select(Product)
+            .join(ProductRanking, ProductRanking.product_id == Product.id)
+            .filter(ProductRanking.client_id == client_id, Product.stock > 0)
+            .order_by(
+                desc(ProductRanking.units),
+                desc(ProductRanking.last_purchase_at),
+                Product.id,
+            )
+            .limit(limit)
+            .options(raiseload("*"))
+        )
+    )
 
 
-def _get_ranked_products(
-    *, db: Session, limit: int, client_id: str | None = None
+async def _get_blended_products(
+    *, db: AsyncSession, limit: int, client_id: str
 ) -> list[Product]:
-    query = (
-        db.query(
-            Product,
-            func.sum(OrderProduct.quantity).label("total_quantity"),
-            func.max(Order.created_at).label("last_purchase_date"),
+    history = (
+        select(ProductRanking.product_id, ProductRanking.units)
+        .filter(ProductRanking.client_id == client_id)
+        .order_by(
+            desc(ProductRanking.units),
+            desc(ProductRanking.last_purchase_at),
+            ProductRanking.product_id,
+        )
+        .limit(settings.recommendation_history_size)
+        .subquery()
+    )
+    rows = (
+        await db.execute(
+            select(
+                history.c.product_id,
+                history.c.units,
+                ProductNeighbor.neighbor_id,
+                ProductNeighbor.score,
+            )
+            .outerjoin(
+                ProductNeighbor, ProductNeighbor.product_id == history.c.product_id
+            )
+            .order_by(desc(history.c.units), history.c.product_id)
         )
-        .join(OrderProduct, Product.id == OrderProduct.product_id)
-        .join(Order, Order.id == OrderProduct.order_id)
-        .filter(Product.stock > 0)
-        .group_by(Product.id)
-        .order_by(desc("total_quantity"), desc("last_purchase_date"))
+    ).all()
+    neighbors = defaultdict(list)
+    for product_id, _, neighbor_id, score in rows:
+        if neighbor_id:
+            neighbors[product_id].append((neighbor_id, score))
+    product_ids = blend_recommendations(
+        history=list(
+            dict.fromkeys((product_id, units) for product_id, units, *_ in rows)
+        ),
+        neighbors=neighbors,
     )
-    if client_id:
-        query = query.filter(Order.client_id == client_id)
-    ranked_products = query.limit(limit).all()
+    if not product_ids:
+        return []
 
-    return [row[0] for row in ranked_products]
+    products = {
+        product.id: product
+        for product in await db.scalars(
+            select(Product)
+            .filter(Product.id.in_(product_ids), Product.stock > 0)
+            .options(raiseload("*"))
+        )
+    }
+
+    return [products[id_] for id_ in product_ids if id_ in products][:limit]
 
 
-def get_recommended_products(
-    *, db: Session, current_user: User, client_id: str, limit: int
+async def get_recommended_products(
+    *, db: AsyncSession, current_user: Principal, client_id: str, limit: int
 ) -> list[Product]:
     client = (
-        get_institutional_client_for_seller(
+        await get_institutional_client_for_seller(
             db=db, seller_id=current_user.id, client_id=client_id
         )
         if current_user.role == UserRole.COMMERCIAL
-        else get_user_by_id(db=db, user_id=client_id)
+        else await get_user_by_id(db=db, user_id=client_id)
     )
     if not client:
         raise NotFoundException("Client not found")
-    products = _get_ranked_products(db=db, limit=limit, client_id=client_id)
+    products = await _get_blended_products(db=db, limit=limit, client_id=client_id)
     if not products:
-        products = _get_ranked_products(db=db, limit=limit)
+        products = await _get_ranked_products(db=db, limit=limit)
     if not products:
-        products = get_products(db=db, current_user=current_user, limit=limit)
+        page = await get_products(
+            db=db, current_user=current_user, limit=limit, include_total=False
+        )
+        products = page.items
 
     return products
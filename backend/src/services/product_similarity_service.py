@@ -0,0 +1,154 @@
+import asyncio
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config import settings
+from src.models.db_models import OrderProduct, ProductNeighbor
+
+# Pairs are counted a slice of baskets at a time, so one huge basket history
+# does not have to expand into every product pair at once.
+_PAIRS_PER_CHUNK = 2_000_000
+
+
+def build_product_neighbors(
+    *, order_ids: list[str], product_ids: list[str], top_k: int
+) -> dict[str, list[tuple[str, float]]]:
+    """
+    Finds the top_k products bought together with each product.
+
+    Baskets are binary vectors over the orders, so the cosine similarity of two
+    products is the number of shared orders over the root of both order counts.
+    """
+    if not order_ids:
+        return {}
+
+    _, orders = np.unique(np.asarray(order_ids), return_inverse=True)
+    product_codes, products = np.unique(np.asarray(product_ids), return_inverse=True)
+    lines = np.unique(np.stack([orders.ravel(), products.ravel()], axis=1), axis=0)
+    orders, products = lines[:, 0], lines[:, 1]
+    products_count = len(product_codes)
+
+    keys, co_counts = _count_pairs(
+        orders=orders, products=products, products_count=products_count
+    )
+    if not len(keys):
+        return {}
+    left, right = np.divmod(keys, products_count)
+    orders_per_product = np.bincount(products, minlength=products_count)
+    scores = co_counts / np.sqrt(orders_per_product[left] * orders_per_product[right])
+
+    # Best neighbours first within each product, ties broken by product code.
+    ranking = np.lexsort((right, -scores, left))
+    left, right, scores = left[ranking], right[ranking], scores[ranking]
+    positions = np.arange(len(left)) - np.searchsorted(left, left, side="left")
+    kept = positions < top_k
+
+    neighbors = defaultdict(list)
+    for product, neighbor, score in zip(
+        product_codes[left[kept]], product_codes[right[kept]], scores[kept]
+    ):
+        neighbors[str(product)].append((str(neighbor), float(score)))
+
+    return dict(neighbors)
+
+
+def _count_pairs(
+    *, orders: np.ndarray, products: np.ndarray, products_count: int
+) -> tuple[np.ndarray, np.ndarray]:
+    starts = np.searchsorted(orders, orders, side="left")
+    sizes = np.searchsorted(orders, orders, side="right") - starts
+    chunk_keys, chunk_counts = [], []
+    first_line = 0
+    while first_line < len(orders):
+        # Chunks end on a basket boundary, so every pair lands in a single chunk.
+        last_line = int(
+            np.searchsorted(np.cumsum(sizes[first_line:]), _PAIRS_PER_CHUNK)
+        )
+        last_line = max(last_line, 1) + first_line
+        last_line = int(np.searchsorted(orders, orders[last_line - 1], side="right"))
+        chunk_sizes = sizes[first_line:last_line]
+
+        left = np.repeat(np.arange(first_line, last_line), chunk_sizes)
+        offsets = np.arange(len(left)) - np.repeat(
+            np.cumsum(chunk_sizes) - chunk_sizes, chunk_sizes
+        )
+        right = starts[left] + offsets
+        distinct = products[left] != products[right]
+        keys, counts = np.unique(
+            products[left[distinct]].astype(np.int64) * products_count
+            + products[right[distinct]],
+            return_counts=True,
+        )
+        chunk_keys.append(keys)
+        chunk_counts.append(counts)
+        first_line = last_line
+
+    keys, inverse = np.unique(np.concatenate(chunk_keys), return_inverse=True)
+
+    return keys, np.bincount(inverse, weights=np.concatenate(chunk_counts))
+
+
+def blend_recommendations(
+    *,
+    history: list[tuple[str, int]],
+    neighbors: dict[str, list[tuple[str, float]]],
+) -> list[str]:
+    """
+    Ranks the client's products together with their co-purchased neighbours.
+
+    Each product in the history scores its share of the client's top units, and
+    each product the client has not bought yet adds up those shares scaled by
+    its similarity to them.
+    """
+    if not history:
+        return []
+
+    top_units = max(units for _, units in history)
+    scores = {product_id: units / top_units for product_id, units in history}
+    neighbor_scores = defaultdict(float)
+    for product_id, units in history:
+        for neighbor_id, similarity in neighbors.get(product_id, []):
+            if neighbor_id not in scores:
+                neighbor_scores[neighbor_id] += units / top_units * similarity
+    scores.update(neighbor_scores)
+
+    # Ties keep the history order, then the neighbours follow by product id.
+    positions = {
+        product_id: position for position, (product_id, _) in enumerate(history)
+    }
+
+    return sorted(
+        scores,
+        key=lambda product_id: (
+            -scores[product_id],
+            positions.get(product_id, len(history)),
+            product_id,
+        ),
+    )
+
+
+async def rebuild_product_neighbors(*, db: AsyncSession) -> int:
+    rows = (
+        await db.execute(select(OrderProduct.order_id, OrderProduct.product_id))
+    ).all()
+    neighbors = await asyncio.to_thread(
+        build_product_neighbors,
+        order_ids=[order_id for order_id, _ in rows],
+        product_ids=[product_id for _, product_id in rows],
+        top_k=settings.recommendation_neighbors_top_k,
+    )
+
+    await db.execute(delete(ProductNeighbor))
+    values = [
+        {"product_id": product_id, "neighbor_id": neighbor_id, "score": score}
+        for product_id, product_neighbors in neighbors.items()
+        for neighbor_id, score in product_neighbors
+    ]
+    if values:
+        await db.execute(insert(ProductNeighbor), values)
+    await db.commit()
+
+    return await db.scalar(select(func.count(ProductNeighbor.id)))
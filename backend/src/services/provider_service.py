@@ -1,17 +1,20 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.core.logging_config import logger
+from src.db.pagination import Page, paginate
 from src.errors.errors import ConflictException
 from src.models.db_models import Provider
 from src.schemas.provider_schema import ProviderCreateRequest
 
 
-def create_provider(
-    *, db: Session, provider_create_request: ProviderCreateRequest
+async def create_provider(
+    *, db: AsyncSession, provider_create_request: ProviderCreateRequest
 ) -> Provider:
-    existing_provider = get_provider_by_email(
+    existing_provider = await get_provider_by_email(
         db=db, email=provider_create_request.email
-    ) or get_provider_by_rit(db=db, rit=provider_create_request.rit)
+    ) or await get_provider_by_rit(db=db, rit=provider_create_request.rit)
     if existing_provider:
         raise ConflictException("Provider with this email or RIT already exists")
 
@@ -26,8 +29,8 @@ def create_provider(
     )
 
     db.add(provider)
-    db.commit()
-    db.refresh(provider)
+    await db.commit()
+    await db.refresh(provider, attribute_names=["products"])
     logger.info(
         f"Provider created successfully with id [{provider.id}] and email [{provider.email}]"
     )
@@ -35,17 +38,38 @@ def create_provider(
     return provider
 
 
-def get_providers(*, db: Session) -> list[Provider]:
-    return db.query(Provider).all()  # type: ignore
+async def get_providers(
+    *,
+    db: AsyncSession,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Provider]:
+    return await paginate(
+        db=db,
+        query=select(Provider).options(raiseload("*")),
+        keys=(Provider.name, Provider.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+async def get_provider_by_id(*, db: AsyncSession, provider_id: str) -> Provider | None:
+    return await db.scalar(
+        select(Provider)
+        .filter_by(id=provider_id)
+        .options(selectinload(Provider.products), raiseload("*"))
+    )
 
 
-def get_provider_by_id(*, db: Session, provider_id: str) -> Provider | None:
-    return db.query(Provider).filter_by(id=provider_id).first()
+async def provider_exists(*, db: AsyncSession, provider_id: str) -> bool:
+    return await db.get(Provider, provider_id) is not None
 
 
-def get_provider_by_email(*, db: Session, email: str) -> Provider | None:
-    return db.query(Provider).filter_by(email=email).first()
+async def get_provider_by_email(*, db: AsyncSession, email: str) -> Provider | None:
+    return await db.scalar(select(Provider).filter_by(email=email))
 
 
-def get_provider_by_rit(*, db: Session, rit: str) -> Provider | None:
-    return db.query(Provider).filter_by(rit=rit).first()
+async def get_provider_by_rit(*, db: AsyncSession, rit: str) -> Provider | None:
+    return await db.scalar(select(Provider).filter_by(rit=rit))
@@ -1,27 +1,185 @@
+import csv
+import io
+import json
 from datetime import datetime
+from typing import AsyncIterator
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
-from src.models.db_models import Order
+from src.db.database import async_session_scope
+from src.db.pagination import Page, paginate
+from src.models.db_models import Order, OrderProduct, Product, User, Zone
 from src.models.enums.order_status import OrderStatus
+from src.models.enums.report_format import ReportFormat
 
+ORDERS_REPORT_EXPORT_COLUMNS = (
+    "order_id",
+    "created_at",
+    "delivery_date",
+    "status",
+    "comments",
+    "seller_id",
+    "seller_name",
+    "zone",
+    "product_id",
+    "product_name",
+    "quantity",
+    "price_per_unit",
+    "line_total",
+)
+_EXPORT_BATCH_SIZE = 1000
 
-def get_orders_report(
+
+async def get_orders_report(
+    *,
+    db: AsyncSession,
+    seller_id: str | None = None,
+    order_status: OrderStatus | None = None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Order]:
+    query = (
+        select(Order)
+        .filter(Order.seller_id.isnot(None))
+        .options(
+            joinedload(Order.seller).joinedload(User.zone),
+            selectinload(Order.order_products).joinedload(OrderProduct.product),
+            raiseload("*"),
+        )
+    )
+    query = _filter_orders_report(
+        query=query,
+        seller_id=seller_id,
+        order_status=order_status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    return await paginate(
+        db=db,
+        query=query,
+        keys=(Order.created_at, Order.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+async def export_orders_report(
     *,
-    db: Session,
+    report_format: ReportFormat,
     seller_id: str | None = None,
     order_status: OrderStatus | None = None,
     start_date: datetime | None,
-    end_date: datetime | None
-) -> list[Order]:
-    query = db.query(Order).filter(Order.seller_id.isnot(None))
+    end_date: datetime | None,
+) -> AsyncIterator[str]:
+    query = (
+        select(
+            Order.id,
+            Order.created_at,
+            Order.delivery_date,
+            Order.status,
+            Order.comments,
+            User.id,
+            User.full_name,
+            Zone.description,
+            Product.id,
+            Product.name,
+            OrderProduct.quantity,
+            Product.price_per_unit,
+        )
+        .join(User, User.id == Order.seller_id)
+        .outerjoin(Zone, Zone.id == User.zone_id)
+        .join(OrderProduct, OrderProduct.order_id == Order.id)
+        .join(Product, Product.id == OrderProduct.product_id)
+        .order_by(Order.created_at, Order.id, Product.id)
+        .execution_options(yield_per=_EXPORT_BATCH_SIZE)
+    )
+    query = _filter_orders_report(
+        query=query,
+        seller_id=seller_id,
+        order_status=order_status,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    if report_format == ReportFormat.CSV:
+        yield _to_csv([ORDERS_REPORT_EXPORT_COLUMNS])
+    # The export owns its session because the request-scoped one may already be
+    # closed while the streaming response is still being consumed.
+    async with async_session_scope() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            records = [_to_export_record(row) for row in rows]
+            if report_format == ReportFormat.CSV:
+                yield _to_csv(
+                    [record[column] for column in ORDERS_REPORT_EXPORT_COLUMNS]
+                    for record in records
+                )
+            else:
+                yield "".join(f"{json.dumps(record)}\n" for record in records)
+
+
+def _filter_orders_report(
+    *,
+    query: Select,
+    seller_id: str | None,
+    order_status: OrderStatus | None,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> Select:
     if seller_id:
-        query = query.filter_by(seller_id=seller_id)
+        query = query.filter(Order.seller_id == seller_id)
     if order_status:
-        query = query.filter_by(status=order_status.name)
+        query = query.filter(Order.status == order_status)
     if start_date:
         query = query.filter(Order.created_at >= start_date)
     if end_date:
         query = query.filter(Order.created_at <= end_date)
 
-    return query.all()  # type: ignore
+    return query
+
+
+def _to_export_record(row: Row) -> dict:
+    (
+        order_id,
+        created_at,
+        delivery_date,
+        order_status,
+        comments,
+        seller_id,
+        seller_name,
+        zone,
+        product_id,
+        product_name,
+        quantity,
+        price_per_unit,
+    ) = row
+
+    return {
+        "order_id": order_id,
+        "created_at": created_at.isoformat(),
+        "delivery_date": delivery_date.isoformat(),
+        "status": order_status.value,
+        "comments": comments,
+        "seller_id": seller_id,
+        "seller_name": seller_name,
+        "zone": zone,
+        "product_id": product_id,
+        "product_name": product_name,
+        "quantity": quantity,
+        "price_per_unit": price_per_unit,
+        "line_total": round(quantity * price_per_unit, 2),
+    }
+
+
+def _to_csv(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+
+    return buffer.getvalue()
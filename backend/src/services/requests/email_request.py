@@ -1,8 +1,9 @@
 from typing import Any, Dict
 
-import pystache
 from pydantic import BaseModel, EmailStr
 
+from src.services.email_template_service import render_template
+
 
 class EmailRequest(BaseModel):
     email_receiver: EmailStr
@@ -12,12 +13,12 @@ class EmailRequest(BaseModel):
     @classmethod
     def from_template(
         cls,
-        html_template: str,
+        template_name: str,
         email_receiver: str,
         email_subject: str,
         template_values: Dict[str, Any],
     ) -> "EmailRequest":
-        rendered_content = pystache.render(html_template, template_values)
+        rendered_content = render_template(template_name, template_values)
         return cls(
             email_receiver=email_receiver,
             email_subject=email_subject,
@@ -0,0 +1,288 @@
+from dataclasses import dataclass
+from typing import Hashable
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0088
+_OR_OPT_MAX_SEGMENT = 3
+_EPSILON = 1e-9
+# Savings are quadratic in the number of stops, so larger order sets are split
+# into angular sectors around the depot and solved independently.
+_SWEEP_CLUSTER_SIZE = 250
+
+
+@dataclass
+class OptimizedTour:
+    stop_sequence: list[int]
+    distance_km: float
+
+
+@dataclass
+class VehiclePlan:
+    tours: list[OptimizedTour]
+    unassigned: list[int]
+
+
+def haversine_matrix(coordinates: np.ndarray) -> np.ndarray:
+    """Pairwise great-circle distances in km for an (n, 2) array of lat/lng."""
+    radians = np.radians(coordinates)
+    latitudes = radians[:, 0][:, np.newaxis]
+    longitudes = radians[:, 1][:, np.newaxis]
+    a = (
+        np.sin((latitudes - latitudes.T) / 2) ** 2
+        + np.cos(latitudes)
+        * np.cos(latitudes.T)
+        * np.sin((longitudes - longitudes.T) / 2) ** 2
+    )
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def optimize_stop_sequence(
+    *,
+    stops: list[tuple[float, float]],
+    depot: tuple[float, float] | None = None,
+) -> OptimizedTour:
+    """
+    Orders the stops with nearest neighbour followed by 2-opt and Or-opt passes.
+
+    With a depot the tour starts and ends there; without one it is an open path
+    and the solver picks the best starting stop.
+    """
+    if not stops:
+        return OptimizedTour(stop_sequence=[], distance_km=0.0)
+
+    if depot is not None:
+        distances = haversine_matrix(np.array([depot, *stops], dtype=float))
+    else:
+        # A virtual depot at zero distance from every stop turns the open path
+        # into a closed tour, so the same improvement moves apply.
+        distances = np.zeros((len(stops) + 1, len(stops) + 1))
+        distances[1:, 1:] = haversine_matrix(np.array(stops, dtype=float))
+
+    tour = _nearest_neighbour_tour(distances)
+    improved = True
+    while improved:
+        improved = _two_opt(tour=tour, distances=distances)
+        improved = _or_opt(tour=tour, distances=distances) or improved
+
+    return OptimizedTour(
+        stop_sequence=[node - 1 for node in tour[1:]],
+        distance_km=tour_distance(tour=tour, distances=distances),
+    )
+
+
+def tour_distance(*, tour: list[int], distances: np.ndarray) -> float:
+    return float(distances[tour, np.roll(tour, -1)].sum())
+
+
+def _nearest_neighbour_tour(distances: np.ndarray) -> list[int]:
+    visited = np.zeros(len(distances), dtype=bool)
+    visited[0] = True
+    tour = [0]
+    for _ in range(len(distances) - 1):
+        candidates = np.where(visited, np.inf, distances[tour[-1]])
+        next_node = int(np.argmin(candidates))
+        visited[next_node] = True
+        tour.append(next_node)
+
+    return tour
+
+
+def _two_opt(*, tour: list[int], distances: np.ndarray) -> bool:
+    improved_any = False
+    improved = True
+    while improved:
+        improved = False
+        nodes = np.array(tour)
+        successors = np.roll(nodes, -1)
+        for i in range(1, len(tour) - 1):
+            # Reversing tour[i..j] swaps edges (i-1, i) and (j, j+1).
+            j = np.arange(i + 1, len(tour))
+            deltas = (
+                distances[nodes[i - 1], nodes[j]]
+                + distances[nodes[i], successors[j]]
+                - distances[nodes[i - 1], nodes[i]]
+                - distances[nodes[j], successors[j]]
+            )
+            best = int(np.argmin(deltas))
+            if deltas[best] < -_EPSILON:
+                stop = int(j[best]) + 1
+                tour[i:stop] = tour[i:stop][::-1]
+                improved = improved_any = True
+                break
+
+    return improved_any
+
+
+def _or_opt(*, tour: list[int], distances: np.ndarray) -> bool:
+    improved_any = False
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, _OR_OPT_MAX_SEGMENT + 1):
+            for start in range(1, len(tour) - length + 1):
+                if _relocate_segment(
+                    tour=tour, distances=distances, start=start, length=length
+                ):
+                    improved = improved_any = True
+                    break
+            if improved:
+                break
+
+    return improved_any
+
+
+def _relocate_segment(
+    *, tour: list[int], distances: np.ndarray, start: int, length: int
+) -> bool:
+    stop = start + length
+    previous, following = tour[start - 1], tour[stop % len(tour)]
+    first, last = tour[start], tour[stop - 1]
+    removal_gain = (
+        distances[previous, first]
+        + distances[last, following]
+        - distances[previous, following]
+    )
+    remaining = tour[:start] + tour[stop:]
+    for position in range(len(remaining)):
+        a, b = remaining[position], remaining[(position + 1) % len(remaining)]
+        # The segment can be inserted as is or reversed.
+        forward = distances[a, first] + distances[last, b] - distances[a, b]
+        backward = distances[a, last] + distances[first, b] - distances[a, b]
+        if min(forward, backward) < removal_gain - _EPSILON:
+            segment = tour[start:stop]
+            if backward < forward:
+                segment = segment[::-1]
+            cut = position + 1
+            tour[:] = remaining[:cut] + segment + remaining[cut:]
+            return True
+
+    return False
+
+
+def plan_vehicle_routes(
+    *,
+    stops: list[tuple[float, float]],
+    demands: list[int],
+    depot: tuple[float, float] | None,
+    vehicle_count: int,
+    vehicle_capacity: int,
+    max_stops: int | None = None,
+    groups: list[Hashable] | None = None,
+) -> VehiclePlan:
+    """
+    Splits the stops across vehicles with sweep clustering and Clarke-Wright
+    savings, then sequences each vehicle's stops.
+
+    Stops in different groups, such as orders due on different dates, never
+    share a vehicle. Stops that exceed the capacity on their own, or that do
+    not fit in the available vehicles, are reported as unassigned.
+    """
+    coordinates = np.array(stops, dtype=float).reshape(-1, 2)
+    if depot is None and len(coordinates):
+        depot = tuple(coordinates.mean(axis=0))
+    demands_array = np.array(demands, dtype=int)
+    max_stops = max_stops or len(stops)
+    labels = {group: label for label, group in enumerate(dict.fromkeys(groups or []))}
+    group_array = np.array(
+        [labels[group] for group in groups] if groups else [0] * len(stops), dtype=int
+    )
+
+    fitting = np.flatnonzero(demands_array <= vehicle_capacity)
+    routes = []
+    for label in np.unique(group_array[fitting]):
+        members = fitting[group_array[fitting] == label]
+        for cluster in _sweep_clusters(coordinates=coordinates[members], depot=depot):
+            indices = members[cluster]
+            routes.extend(
+                [indices[stop] for stop in route]
+                for route in _clarke_wright(
+                    coordinates=coordinates[indices],
+                    demands=demands_array[indices],
+                    depot=depot,
+                    vehicle_capacity=vehicle_capacity,
+                    max_stops=max_stops,
+                )
+            )
+
+    routes.sort(key=lambda route: int(demands_array[route].sum()), reverse=True)
+    tours = []
+    for route in routes[:vehicle_count]:
+        tour = optimize_stop_sequence(
+            stops=[tuple(coordinates[index]) for index in route], depot=depot
+        )
+        tours.append(
+            OptimizedTour(
+                stop_sequence=[int(route[index]) for index in tour.stop_sequence],
+                distance_km=tour.distance_km,
+            )
+        )
+    assigned = {index for tour in tours for index in tour.stop_sequence}
+
+    return VehiclePlan(
+        tours=tours,
+        unassigned=[index for index in range(len(stops)) if index not in assigned],
+    )
+
+
+def _sweep_clusters(
+    *, coordinates: np.ndarray, depot: tuple[float, float] | None
+) -> list[np.ndarray]:
+    if not len(coordinates):
+        return []
+
+    angles = np.arctan2(
+        coordinates[:, 0] - depot[0], coordinates[:, 1] - depot[1]  # type: ignore
+    )
+    order = np.argsort(angles, kind="stable")
+    cluster_count = -(-len(order) // _SWEEP_CLUSTER_SIZE)
+
+    return np.array_split(order, cluster_count)
+
+
+def _clarke_wright(
+    *,
+    coordinates: np.ndarray,
+    demands: np.ndarray,
+    depot: tuple[float, float],
+    vehicle_capacity: int,
+    max_stops: int,
+) -> list[list[int]]:
+    distances = haversine_matrix(np.vstack([depot, coordinates]))
+    from_depot = distances[0, 1:]
+    first, second = np.triu_indices(len(coordinates), k=1)
+    savings = from_depot[first] + from_depot[second] - distances[first + 1, second + 1]
+    ranked = np.argsort(-savings, kind="stable")
+
+    # Every stop starts on its own route; routes are merged end to end while the
+    # merged route still fits the vehicle. Non-positive savings are merged too
+    # because the fleet is limited and fewer routes leave fewer orders behind.
+    routes: dict[int, list[int]] = {stop: [stop] for stop in range(len(coordinates))}
+    loads = {stop: int(demands[stop]) for stop in range(len(coordinates))}
+    route_of = list(range(len(coordinates)))
+    for i, j in zip(first[ranked].tolist(), second[ranked].tolist()):
+        route_i, route_j = route_of[i], route_of[j]
+        if route_i == route_j:
+            continue
+        left, right = routes[route_i], routes[route_j]
+        if (
+            loads[route_i] + loads[route_j] > vehicle_capacity
+            or len(left) + len(right) > max_stops
+        ):
+            continue
+        if left[-1] != i:
+            if left[0] != i:
+                continue
+            left.reverse()
+        if right[0] != j:
+            if right[-1] != j:
+                continue
+            right.reverse()
+
+        left.extend(right)
+        loads[route_i] += loads.pop(route_j)
+        for stop in routes.pop(route_j):
+            route_of[stop] = route_i
+
+    return list(routes.values())
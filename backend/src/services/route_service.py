@@ -1,50 +1,196 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+import asyncio
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from src.db.pagination import Page, paginate
 from src.errors.errors import BadRequestException, NotFoundException
-from src.models.db_models import Order, Route
-from src.schemas.route_schema import RouteCreateRequest
-from src.services.distribution_center_service import get_distribution_center_by_id
+from src.models.db_models import (
+    DistributionCenter,
+    Geolocation,
+    Order,
+    OrderProduct,
+    Route,
+    User,
+)
+from src.models.enums.order_status import OrderStatus
+from src.schemas.route_schema import (
+    ProposedRoute,
+    RouteCreateRequest,
+    RoutePlanRequest,
+    RoutePlanResponse,
+)
+from src.services.route_optimization_service import (
+    optimize_stop_sequence,
+    plan_vehicle_routes,
+)
 
 
-def create_route(
+async def create_route(
     *,
-    db: Session,
+    db: AsyncSession,
     route_create_request: RouteCreateRequest,
 ) -> Route | None:
-    _validate_route_request(db=db, route_create_request=route_create_request)
-    min_delivery_date = (
-        db.query(func.min(Order.delivery_date))
-        .filter(Order.id.in_(route_create_request.order_ids))
-        .scalar()
+    orders, distribution_center = await _validate_route_request(
+        db=db, route_create_request=route_create_request
+    )
+    min_delivery_date = await db.scalar(
+        select(func.min(Order.delivery_date)).filter(
+            Order.id.in_(route_create_request.order_ids)
+        )
+    )
+    estimated_distance_km = await _sequence_stops(
+        orders=orders, distribution_center=distribution_center
     )
-    orders = db.query(Order).filter(Order.id.in_(route_create_request.order_ids)).all()
     route = Route(
         name=route_create_request.name,
         vehicle_plate=route_create_request.vehicle_plate,
         restrictions=route_create_request.restrictions,
         delivery_deadline=min_delivery_date,
+        estimated_distance_km=estimated_distance_km,
         distribution_center_id=route_create_request.distribution_center_id,
         orders=orders,  # type: ignore
     )
     db.add(route)
-    db.commit()
-    db.refresh(route)
+    await db.commit()
+
+    return await get_route_by_id(db=db, route_id=route.id)
+
+
+async def get_routes(
+    *,
+    db: AsyncSession,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Route]:
+    return await paginate(
+        db=db,
+        query=select(Route).options(
+            joinedload(Route.distribution_center), raiseload("*")
+        ),
+        keys=(Route.created_at, Route.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
+
+
+async def get_route_by_id(*, db: AsyncSession, route_id: str) -> Route | None:
+    return await db.scalar(
+        select(Route)
+        .filter(Route.id == route_id)
+        .options(
+            joinedload(Route.distribution_center),
+            selectinload(Route.orders)
+            .joinedload(Order.client)
+            .joinedload(User.geolocation),
+            raiseload("*"),
+        )
+        .execution_options(populate_existing=True)
+    )
+
+
+async def plan_routes(
+    *, db: AsyncSession, route_plan_request: RoutePlanRequest
+) -> RoutePlanResponse:
+    distribution_center = await db.get(
+        DistributionCenter, route_plan_request.distribution_center_id
+    )
+    if not distribution_center:
+        raise NotFoundException("Distribution center not found")
 
-    return route
+    pending_orders = (
+        await db.execute(
+            select(
+                Order.id,
+                Order.delivery_date,
+                Geolocation.latitude,
+                Geolocation.longitude,
+                func.sum(OrderProduct.quantity).label("units"),
+            )
+            .join(User, User.id == Order.client_id)
+            .outerjoin(Geolocation, Geolocation.id == User.geolocation_id)
+            .join(OrderProduct, OrderProduct.order_id == Order.id)
+            .filter(
+                Order.distribution_center_id == distribution_center.id,
+                Order.route_id.is_(None),
+                Order.status.in_([OrderStatus.RECEIVED, OrderStatus.PREPARING]),
+                Order.delivery_date <= route_plan_request.delivery_date,
+            )
+            .group_by(Order.id, Geolocation.id)
+            .order_by(Order.delivery_date, Order.id)
+        )
+    ).all()
+    located_orders = [order for order in pending_orders if order.latitude is not None]
+    depot = (
+        (distribution_center.latitude, distribution_center.longitude)
+        if distribution_center.latitude is not None
+        and distribution_center.longitude is not None
+        else None
+    )
+    plan = await asyncio.to_thread(
+        plan_vehicle_routes,
+        stops=[(order.latitude, order.longitude) for order in located_orders],
+        demands=[order.units for order in located_orders],
+        depot=depot,
+        vehicle_count=route_plan_request.vehicle_count,
+        vehicle_capacity=route_plan_request.vehicle_capacity,
+        max_stops=route_plan_request.max_stops,
+        groups=[order.delivery_date for order in located_orders],
+    )
 
+    return RoutePlanResponse(
+        routes=[
+            ProposedRoute(
+                delivery_deadline=min(
+                    located_orders[index].delivery_date for index in tour.stop_sequence
+                ),
+                total_units=sum(
+                    located_orders[index].units for index in tour.stop_sequence
+                ),
+                estimated_distance_km=round(tour.distance_km, 3),
+                order_ids=[located_orders[index].id for index in tour.stop_sequence],
+            )
+            for tour in plan.tours
+        ],
+        unassigned_order_ids=[located_orders[index].id for index in plan.unassigned]
+        + [order.id for order in pending_orders if order.latitude is None],
+    )
 
-def get_routes(*, db: Session) -> list[Route]:
-    return db.query(Route).all()  # type: ignore
 
+async def _sequence_stops(
+    *, orders: list[Order], distribution_center: DistributionCenter
+) -> float | None:
+    located_orders = [order for order in orders if order.client.geolocation]
+    depot = (
+        (distribution_center.latitude, distribution_center.longitude)
+        if distribution_center.latitude is not None
+        and distribution_center.longitude is not None
+        else None
+    )
+    tour = await asyncio.to_thread(
+        optimize_stop_sequence,
+        stops=[
+            (order.client.geolocation.latitude, order.client.geolocation.longitude)
+            for order in located_orders
+        ],
+        depot=depot,
+    )
+    # Stops without coordinates cannot be placed, so they go last.
+    sequenced_orders = [located_orders[index] for index in tour.stop_sequence] + [
+        order for order in orders if not order.client.geolocation
+    ]
+    for position, order in enumerate(sequenced_orders, start=1):
+        order.stop_sequence = position
 
-def get_route_by_id(*, db: Session, route_id: str) -> Route | None:
-    return db.query(Route).filter(Route.id == route_id).first()
+    return round(tour.distance_km, 3) if located_orders else None
 
 
-def _validate_route_request(
-    *, db: Session, route_create_request: RouteCreateRequest
-) -> None:
+async def _validate_route_request(
+    *, db: AsyncSession, route_create_request: RouteCreateRequest
+) -> tuple[list[Order], DistributionCenter]:
     duplicated_ids = set(
         x
         for x in route_create_request.order_ids
@@ -55,14 +201,20 @@ def _validate_route_request(
             f"Duplicated order IDs in route: {', '.join(duplicated_ids)}"
         )
 
-    orders = db.query(Order).filter(Order.id.in_(route_create_request.order_ids)).all()
+    orders = list(
+        await db.scalars(
+            select(Order)
+            .filter(Order.id.in_(route_create_request.order_ids))
+            .options(joinedload(Order.client).joinedload(User.geolocation))
+        )
+    )
     existing_order_ids = {order.id for order in orders}
     missing_order_ids = set(route_create_request.order_ids) - existing_order_ids  # noqa
     if missing_order_ids:
         raise NotFoundException(f"Orders not found: {', '.join(missing_order_ids)}")
 
-    distribution_center = get_distribution_center_by_id(
-        db=db, distribution_center_id=route_create_request.distribution_center_id
+    distribution_center = await db.get(
+        DistributionCenter, route_create_request.distribution_center_id
     )
     if not distribution_center:
         raise NotFoundException("Distribution center not found")
@@ -72,3 +224,5 @@ def _validate_route_request(
             raise BadRequestException(
                 f"Order ID {order.id} does not belong to the specified distribution center"
             )
+
+    return orders, distribution_center
@@ -0,0 +1,159 @@
+from datetime import date, timezone
+
+from sqlalchemy import Date, String, cast, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.db_models import Order, OrderProduct, Product, SalesDailyRollup, User
+from src.models.enums.order_status import OrderStatus
+from src.models.enums.sales_dimension import SalesDimension
+
+# Orders hold the lock shared until they commit, so they never wait on each other,
+# while a rebuild holds it exclusively and cannot miss or double count one.
+_SALES_ROLLUP_LOCK_ID = 4502
+_DIMENSION_COLUMNS = {
+    SalesDimension.DAY: SalesDailyRollup.day,
+    SalesDimension.SELLER: SalesDailyRollup.seller_id,
+    SalesDimension.PRODUCT: SalesDailyRollup.product_id,
+    SalesDimension.ZONE: SalesDailyRollup.zone_id,
+    SalesDimension.STATUS: SalesDailyRollup.status,
+}
+
+
+async def record_order_sales(
+    *,
+    db: AsyncSession,
+    order: Order,
+    zone_id: str | None,
+    order_lines: list[tuple[Product, int]],
+) -> None:
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock_shared(:lock_id)"),
+        {"lock_id": _SALES_ROLLUP_LOCK_ID},
+    )
+    day = order.created_at.astimezone(timezone.utc).date()
+    statement = insert(SalesDailyRollup).values(
+        [
+            {
+                "day": day,
+                "seller_id": order.seller_id,
+                "product_id": product.id,
+                "zone_id": zone_id,
+                "status": order.status,
+                "units": quantity,
+                "revenue": quantity * product.price_per_unit,
+                "order_lines": 1,
+            }
+            for product, quantity in order_lines
+        ]
+    )
+    await db.execute(
+        statement.on_conflict_do_update(
+            constraint="sales_daily_rollup_bucket_constraint",
+            set_={
+                "units": SalesDailyRollup.units + statement.excluded.units,
+                "revenue": SalesDailyRollup.revenue + statement.excluded.revenue,
+                "order_lines": SalesDailyRollup.order_lines
+                + statement.excluded.order_lines,
+            },
+        )
+    )
+
+
+async def rebuild_sales_rollups(*, db: AsyncSession) -> int:
+    day = cast(func.timezone("UTC", Order.created_at), Date)
+    source = (
+        select(
+            cast(func.gen_random_uuid(), String),
+            day,
+            Order.seller_id,
+            OrderProduct.product_id,
+            User.zone_id,
+            Order.status,
+            func.sum(OrderProduct.quantity),
+            func.sum(OrderProduct.quantity * Product.price_per_unit),
+            func.count(OrderProduct.id),
+        )
+        .join(OrderProduct, OrderProduct.order_id == Order.id)
+        .join(Product, Product.id == OrderProduct.product_id)
+        .outerjoin(User, User.id == Order.seller_id)
+        .group_by(
+            day, Order.seller_id, OrderProduct.product_id, User.zone_id, Order.status
+        )
+    )
+
+    await db.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"),
+        {"lock_id": _SALES_ROLLUP_LOCK_ID},
+    )
+    await db.execute(delete(SalesDailyRollup))
+    await db.execute(
+        insert(SalesDailyRollup).from_select(
+            [
+                "id",
+                "day",
+                "seller_id",
+                "product_id",
+                "zone_id",
+                "status",
+                "units",
+                "revenue",
+                "order_lines",
+            ],
+            source,
+        )
+    )
+    await db.commit()
+
+    return await db.scalar(select(func.count(SalesDailyRollup.id)))
+
+
+async def get_sales_report(
+    *,
+    db: AsyncSession,
+    group_by: list[SalesDimension],
+    start_day: date | None = None,
+    end_day: date | None = None,
+    seller_id: str | None = None,
+    product_id: str | None = None,
+    zone_id: str | None = None,
+    order_status: OrderStatus | None = None,
+) -> list[dict]:
+    columns = [_DIMENSION_COLUMNS[dimension] for dimension in dict.fromkeys(group_by)]
+    query = select(
+        *columns,
+        func.coalesce(func.sum(SalesDailyRollup.units), 0).label("units"),
+        func.coalesce(func.sum(SalesDailyRollup.revenue), 0).label("revenue"),
+        func.coalesce(func.sum(SalesDailyRollup.order_lines), 0).label("order_lines"),
+    )
+    if start_day:
+        query = query.filter(SalesDailyRollup.day >= start_day)
+    if end_day:
+        query = query.filter(SalesDailyRollup.day <= end_day)
+    if seller_id:
+        query = query.filter(SalesDailyRollup.seller_id == seller_id)
+    if product_id:
+        query = query.filter(SalesDailyRollup.product_id == product_id)
+    if zone_id:
+        query = query.filter(SalesDailyRollup.zone_id == zone_id)
+    if order_status:
+        query = query.filter(SalesDailyRollup.status == order_status)
+    if columns:
+        query = query.group_by(*columns).order_by(*columns)
+
+    return [dict(row._mapping) for row in await db.execute(query)]
+
+
+async def get_seller_sales_totals(
+    *, db: AsyncSession, seller_id: str
+) -> tuple[int, float]:
+    units, revenue = (
+        await db.execute(
+            select(
+                func.coalesce(func.sum(SalesDailyRollup.units), 0),
+                func.coalesce(func.sum(SalesDailyRollup.revenue), 0),
+            ).filter(SalesDailyRollup.seller_id == seller_id)
+        )
+    ).one()
+
+    return int(units), float(revenue)
@@ -1,31 +1,35 @@
 import random
 import string
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 from src.core.config import settings
 from src.core.logging_config import logger
-from src.core.security import hash_password
-from src.core.utils import get_template_path
+from src.core.security import hash_password_async
+from src.db.pagination import Page, paginate
 from src.errors.errors import ConflictException, UnprocessableEntityException
-from src.models.db_models import User
+from src.models.db_models import Order, User, Zone
 from src.models.enums.user_role import UserRole
-from src.schemas.seller_schema import SellerCreateRequest
-from src.services.email_service import send_email
+from src.schemas.seller_schema import SellerCreateRequest, SellerSummaryResponse
+from src.services.email_outbox_service import enqueue_email, notify_email_worker
+from src.services.principal_cache_service import Principal
 from src.services.requests.email_request import EmailRequest
+from src.services.sales_rollup_service import get_seller_sales_totals
 from src.services.user_service import get_user_by_doi, get_user_by_email
-from src.services.zone_service import get_zone_by_id
 
 
-def create_seller(*, db: Session, seller_create_request: SellerCreateRequest) -> User:
-    existing_user = get_user_by_email(
+async def create_seller(
+    *, db: AsyncSession, seller_create_request: SellerCreateRequest
+) -> User:
+    existing_user = await get_user_by_email(
         db=db, email=seller_create_request.email
-    ) or get_user_by_doi(db=db, doi=seller_create_request.doi)
+    ) or await get_user_by_doi(db=db, doi=seller_create_request.doi)
     if existing_user:
         raise ConflictException("Seller with this email or DOI already exists")
 
-    existing_zone = get_zone_by_id(db=db, zone_id=seller_create_request.zone_id)
+    existing_zone = await db.get(Zone, seller_create_request.zone_id)
     if not existing_zone:
         raise UnprocessableEntityException("Zone with the given ID does not exist")
 
@@ -33,53 +37,112 @@ def create_seller(*, db: Session, seller_create_request: SellerCreateRequest) ->
     user = User(
         full_name=seller_create_request.full_name,
         email=seller_create_request.email,
-        hashed_password=hash_password(temporary_password),
+        hashed_password=await hash_password_async(temporary_password),
         phone=seller_create_request.phone,
         role=UserRole.COMMERCIAL,
         doi=seller_create_request.doi,
         zone_id=seller_create_request.zone_id,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await _queue_temporary_password_email(
+        db=db, user=user, temporary_password=temporary_password
+    )
+    await db.commit()
+    notify_email_worker()
+    await db.refresh(
+        user, attribute_names=["zone", "clients", "selling_plans", "managed_orders"]
+    )
     logger.info(
         f"Seller (UserRole.COMMERCIAL) created successfully with id [{user.id}] and email [{user.email}]"
     )
-    _send_temporary_password_email(user=user, temporary_password=temporary_password)
 
     return user
 
 
-def get_sellers(*, db: Session) -> list[User]:
-    return db.query(User).filter_by(role=UserRole.COMMERCIAL).all()  # type: ignore
+async def get_sellers(
+    *,
+    db: AsyncSession,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[User]:
+    query = (
+        select(User)
+        .filter_by(role=UserRole.COMMERCIAL)
+        .options(joinedload(User.zone), raiseload("*"))
+    )
+
+    return await paginate(
+        db=db,
+        query=query,
+        keys=(User.created_at, User.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
-def get_seller_by_id(*, db: Session, seller_id: str) -> User | None:
-    return db.query(User).filter_by(id=seller_id, role=UserRole.COMMERCIAL).first()
+async def get_seller_by_id(*, db: AsyncSession, seller_id: str) -> User | None:
+    return await db.scalar(
+        select(User)
+        .filter_by(id=seller_id, role=UserRole.COMMERCIAL)
+        .options(
+            joinedload(User.zone),
+            selectinload(User.clients),
+            selectinload(User.selling_plans),
+            selectinload(User.managed_orders),
+            raiseload("*"),
+        )
+    )
 
 
-def get_random_seller(*, db: Session) -> User | None:
-    return (
-        db.query(User)
-        .filter_by(role=UserRole.COMMERCIAL)
-        .order_by(func.random())
-        .first()
+async def seller_exists(*, db: AsyncSession, seller_id: str) -> bool:
+    seller_count = await db.scalar(
+        select(func.count(User.id)).filter_by(id=seller_id, role=UserRole.COMMERCIAL)
     )
 
+    return seller_count > 0
+
+
+async def summarize_seller(
+    *, db: AsyncSession, seller: Principal
+) -> SellerSummaryResponse:
+    clients_count = await db.scalar(
+        select(func.count(User.id)).filter_by(seller_id=seller.id)
+    )
+    orders_count = await db.scalar(
+        select(func.count(Order.id)).filter_by(seller_id=seller.id)
+    )
+    units_sold, revenue = await get_seller_sales_totals(db=db, seller_id=seller.id)
+    zone = await db.get(Zone, seller.zone_id) if seller.zone_id else None
+
+    return SellerSummaryResponse(
+        id=seller.id,
+        clients_count=clients_count,
+        orders_count=orders_count,
+        units_sold=units_sold,
+        revenue=revenue,
+        zone=zone.description,
+    )
+
+
+async def get_random_seller(*, db: AsyncSession) -> User | None:
+    return await db.scalar(
+        select(User).filter_by(role=UserRole.COMMERCIAL).order_by(func.random())
+    )
 
-def get_clients_by_seller_id(*, db: Session, seller_id: str) -> list[User]:
-    seller = get_seller_by_id(db=db, seller_id=seller_id)
 
-    return seller.clients
+async def get_clients_by_seller_id(*, db: AsyncSession, seller_id: str) -> list[User]:
+    return list(await db.scalars(select(User).filter_by(seller_id=seller_id)))
 
 
-def get_institutional_client_for_seller(
-    *, db: Session, seller_id: str, client_id: str
+async def get_institutional_client_for_seller(
+    *, db: AsyncSession, seller_id: str, client_id: str
 ) -> User | None:
-    return (
-        db.query(User)
-        .filter_by(id=client_id, role=UserRole.INSTITUTIONAL, seller_id=seller_id)
-        .first()
+    return await db.scalar(
+        select(User).filter_by(
+            id=client_id, role=UserRole.INSTITUTIONAL, seller_id=seller_id
+        )
     )
 
 
@@ -92,12 +155,11 @@ def _generate_temporary_password() -> str:
     return temporary_password
 
 
-def _send_temporary_password_email(user: User, temporary_password: str) -> None:
-    html_template = open(
-        get_template_path("temporary_password_template.html"), encoding="utf-8"
-    ).read()
+async def _queue_temporary_password_email(
+    *, db: AsyncSession, user: User, temporary_password: str
+) -> None:
     email_request = EmailRequest.from_template(
-        html_template=html_template,
+        template_name="temporary_password_template.html",
         email_receiver=user.email,
         email_subject="¡Bienvenido a MediSupply! - Tu contraseña temporal",
         template_values={
@@ -107,4 +169,4 @@ def _send_temporary_password_email(user: User, temporary_password: str) -> None:
             "login_url": settings.login_url,
         },
     )
-    send_email(email_request)
+    await enqueue_email(db=db, email_request=email_request)
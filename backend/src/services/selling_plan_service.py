@@ -1,18 +1,26 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 
 from src.core.logging_config import logger
+from src.db.pagination import Page, paginate
 from src.errors.errors import ConflictException, UnprocessableEntityException
-from src.models.db_models import SellingPlan
+from src.models.db_models import Product, SellingPlan, Zone
 from src.schemas.selling_plan_schema import SellingPlanCreateRequest
-from src.services.product_service import get_product_by_id
-from src.services.seller_service import get_seller_by_id
-from src.services.zone_service import get_zone_by_id
+from src.services.seller_service import seller_exists
 
+_SELLING_PLAN_DETAIL_OPTIONS = (
+    joinedload(SellingPlan.product),
+    joinedload(SellingPlan.zone),
+    joinedload(SellingPlan.seller),
+    raiseload("*"),
+)
 
-def create_selling_plan(
-    *, db: Session, selling_plan_create_request: SellingPlanCreateRequest
+
+async def create_selling_plan(
+    *, db: AsyncSession, selling_plan_create_request: SellingPlanCreateRequest
 ) -> SellingPlan:
-    _validate_selling_plan_request(
+    await _validate_selling_plan_request(
         db=db, selling_plan_create_request=selling_plan_create_request
     )
 
@@ -25,51 +33,63 @@ def create_selling_plan(
     )
 
     db.add(selling_plan)
-    db.commit()
-    db.refresh(selling_plan)
+    await db.commit()
+    await db.refresh(selling_plan, attribute_names=["product", "zone", "seller"])
     logger.info(f"SellingPlan created successfully with ID: {selling_plan.id}")
 
     return selling_plan
 
 
-def get_selling_plans(*, db: Session) -> list[SellingPlan]:
-    return db.query(SellingPlan).all()  # type: ignore
+async def get_selling_plans(
+    *,
+    db: AsyncSession,
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[SellingPlan]:
+    return await paginate(
+        db=db,
+        query=select(SellingPlan).options(*_SELLING_PLAN_DETAIL_OPTIONS),
+        keys=(SellingPlan.created_at, SellingPlan.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
-def get_selling_plan_by_id(*, db: Session, selling_plan_id: str) -> SellingPlan | None:
-    return db.query(SellingPlan).filter_by(id=selling_plan_id).first()
+async def get_selling_plan_by_id(
+    *, db: AsyncSession, selling_plan_id: str
+) -> SellingPlan | None:
+    return await db.scalar(
+        select(SellingPlan)
+        .filter_by(id=selling_plan_id)
+        .options(*_SELLING_PLAN_DETAIL_OPTIONS)
+    )
 
 
-def _validate_selling_plan_request(
-    *, db: Session, selling_plan_create_request: SellingPlanCreateRequest
+async def _validate_selling_plan_request(
+    *, db: AsyncSession, selling_plan_create_request: SellingPlanCreateRequest
 ) -> None:
-    existing_selling_plan = (
-        db.query(SellingPlan)
-        .filter_by(
+    existing_selling_plan = await db.scalar(
+        select(SellingPlan).filter_by(
             period=selling_plan_create_request.period,
             product_id=selling_plan_create_request.product_id,
             zone_id=selling_plan_create_request.zone_id,
             seller_id=selling_plan_create_request.seller_id,
         )
-        .first()
     )
     if existing_selling_plan:
         raise ConflictException(
             "A selling plan with the same period, product, zone, and seller already exists"
         )
 
-    existing_product = get_product_by_id(
-        db=db, product_id=selling_plan_create_request.product_id
-    )
+    existing_product = await db.get(Product, selling_plan_create_request.product_id)
     if not existing_product:
         raise UnprocessableEntityException("Product with the given ID does not exist")
 
-    existing_zone = get_zone_by_id(db=db, zone_id=selling_plan_create_request.zone_id)
+    existing_zone = await db.get(Zone, selling_plan_create_request.zone_id)
     if not existing_zone:
         raise UnprocessableEntityException("Zone with the given ID does not exist")
 
-    existing_seller = get_seller_by_id(
-        db=db, seller_id=selling_plan_create_request.seller_id
-    )
-    if not existing_seller:
+    if not await seller_exists(db=db, seller_id=selling_plan_create_request.seller_id):
         raise UnprocessableEntityException("Seller with the given ID does not exist")
@@ -1,7 +1,8 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.logging_config import logger
-from src.core.security import hash_password
+from src.core.security import hash_password_async
 from src.errors.errors import ConflictException
 from src.models.db_models import User
 from src.models.enums.user_role import UserRole
@@ -9,44 +10,49 @@ from src.schemas.user_schema import UserCreateRequest
 from src.services.geolocation_service import create_geolocation
 
 
-def get_user_by_email(*, db: Session, email: str) -> User | None:
-    return db.query(User).filter_by(email=email).first()
+async def get_user_by_email(*, db: AsyncSession, email: str) -> User | None:
+    return await db.scalar(select(User).filter_by(email=email))
 
 
-def get_user_by_doi(*, db: Session, doi: str) -> User | None:
-    return db.query(User).filter_by(doi=doi).first()
+async def get_user_by_doi(*, db: AsyncSession, doi: str) -> User | None:
+    return await db.scalar(select(User).filter_by(doi=doi))
 
 
-def get_user_by_id(*, db: Session, user_id: str) -> User | None:
-    return db.query(User).filter_by(id=user_id, role=UserRole.INSTITUTIONAL).first()
+async def get_user_by_id(*, db: AsyncSession, user_id: str) -> User | None:
+    return await db.scalar(
+        select(User).filter_by(id=user_id, role=UserRole.INSTITUTIONAL)
+    )
 
 
-def create_user(*, db: Session, user_create_request: UserCreateRequest) -> User:
+async def create_user(
+    *, db: AsyncSession, user_create_request: UserCreateRequest
+) -> User:
     from src.services.seller_service import (
         get_random_seller,
     )  # Imported here to avoid circular dependency
 
-    existing_user = get_user_by_email(
+    existing_user = await get_user_by_email(
         db=db, email=user_create_request.email
-    ) or get_user_by_doi(db=db, doi=user_create_request.doi)
+    ) or await get_user_by_doi(db=db, doi=user_create_request.doi)
     if existing_user:
         raise ConflictException("User with this email or DOI already exists")
 
-    geolocation = create_geolocation(db=db, address=user_create_request.address)
+    geolocation = await create_geolocation(db=db, address=user_create_request.address)
+    seller = await get_random_seller(db=db)
     user = User(
         full_name=user_create_request.full_name,
         email=user_create_request.email,
-        hashed_password=hash_password(user_create_request.password),
+        hashed_password=await hash_password_async(user_create_request.password),
         phone=user_create_request.phone,
         role=UserRole.INSTITUTIONAL,
         doi=user_create_request.doi,
         address=user_create_request.address,
-        seller_id=get_random_seller(db=db).id,
+        seller_id=seller.id,
         geolocation_id=geolocation.id,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user, attribute_names=["seller", "orders"])
     logger.info(
         f"User created successfully with id [{user.id}] and email [{user.email}]"
     )
@@ -2,9 +2,12 @@ from datetime import date, datetime, timezone
 
 from fastapi import UploadFile
 from google.cloud import storage
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 
 from src.core.logging_config import logger
+from src.db.pagination import Page, paginate
 from src.errors.errors import ApiError, BadRequestException, NotFoundException
 from src.models.db_models import User, Visit
 from src.models.enums.user_role import UserRole
@@ -14,45 +17,56 @@ from src.services.geolocation_service import (
     create_geolocation,
     create_geolocation_with_coordinates,
 )
+from src.services.principal_cache_service import Principal
 from src.services.storage_service import upload_to_gcs
 
+_VISIT_DETAIL_OPTIONS = (
+    joinedload(Visit.expected_geolocation),
+    joinedload(Visit.report_geolocation),
+    joinedload(Visit.client),
+    joinedload(Visit.seller),
+    raiseload("*"),
+)
+
 
-def create_visit(
+async def create_visit(
     *,
-    db: Session,
+    db: AsyncSession,
     visit_create_request: VisitCreateRequest,
-    current_user: User,
+    current_user: Principal,
 ) -> Visit:
     if visit_create_request.expected_date < date.today():
         raise BadRequestException("Expected date cannot be in the past")
 
-    geolocation = (
-        create_geolocation(db=db, address=visit_create_request.address)
+    expected_geolocation_id = (
+        (await create_geolocation(db=db, address=visit_create_request.address)).id
         if visit_create_request.address
-        else current_user.geolocation
+        else await db.scalar(select(User.geolocation_id).filter_by(id=current_user.id))
     )
     visit = Visit(
         expected_date=visit_create_request.expected_date,
-        expected_geolocation_id=geolocation.id,
+        expected_geolocation_id=expected_geolocation_id,
         client_id=current_user.id,
         seller_id=current_user.seller_id,
     )
 
     db.add(visit)
-    db.commit()
-    db.refresh(visit)
+    await db.commit()
 
-    return visit
+    return await _get_visit_details(db=db, visit_id=visit.id)
 
 
-def get_visits(
+async def get_visits(
     *,
-    db: Session,
-    current_user: User,
+    db: AsyncSession,
+    current_user: Principal,
     expected_date: date | None = None,
     visit_status: VisitStatus | None = None,
-) -> list[Visit]:
-    query = db.query(Visit)
+    limit: int | None = None,
+    cursor: str | None = None,
+    include_total: bool = True,
+) -> Page[Visit]:
+    query = select(Visit).options(*_VISIT_DETAIL_OPTIONS)
     if current_user.role == UserRole.COMMERCIAL:
         query = query.filter_by(seller_id=current_user.id)
     else:
@@ -62,29 +76,38 @@ def get_visits(
     if visit_status:
         query = query.filter_by(status=visit_status)
 
-    return query.all()  # type: ignore
+    return await paginate(
+        db=db,
+        query=query,
+        keys=(Visit.created_at, Visit.id),
+        limit=limit,
+        cursor=cursor,
+        include_total=include_total,
+    )
 
 
-def get_visit_by_id(*, db: Session, current_user: User, visit_id: str) -> Visit | None:
-    query = db.query(Visit).filter_by(id=visit_id)
+async def get_visit_by_id(
+    *, db: AsyncSession, current_user: Principal, visit_id: str
+) -> Visit | None:
+    query = select(Visit).filter_by(id=visit_id).options(*_VISIT_DETAIL_OPTIONS)
     if current_user.role == UserRole.COMMERCIAL:
         query = query.filter_by(seller_id=current_user.id)
     else:
         query = query.filter_by(client_id=current_user.id)
 
-    return query.first()
+    return await db.scalar(query)
 
 
-def report_visit(
+async def report_visit(
     *,
-    db: Session,
+    db: AsyncSession,
     visit_report_request: VisitReportRequest,
-    current_user: User,
+    current_user: Principal,
     storage_client: storage.Client,
     visual_evidence: UploadFile | None = None,
 ) -> Visit:
     try:
-        visit = get_visit_by_id(
+        visit = await get_visit_by_id(
             db=db, current_user=current_user, visit_id=visit_report_request.visit_id
         )
         if not visit:
@@ -96,7 +119,7 @@ def report_visit(
             raise BadRequestException("Visit date cannot be before expected date")
         _validate_visual_evidence(visual_evidence=visual_evidence)
 
-        geolocation = create_geolocation_with_coordinates(
+        geolocation = await create_geolocation_with_coordinates(
             db=db,
             latitude=visit_report_request.latitude,
             longitude=visit_report_request.longitude,
@@ -113,10 +136,9 @@ def report_visit(
             )
             visit.visual_evidence_path = file_path
 
-        db.commit()
-        db.refresh(visit)
+        await db.commit()
 
-        return visit
+        return await _get_visit_details(db=db, visit_id=visit.id)
 
     except ApiError:
         raise
@@ -125,6 +147,15 @@ def report_visit(
         raise ApiError("An error occurred while reporting the visit")
 
 
+async def _get_visit_details(*, db: AsyncSession, visit_id: str) -> Visit:
+    return await db.scalar(
+        select(Visit)
+        .filter_by(id=visit_id)
+        .options(*_VISIT_DETAIL_OPTIONS)
+        .execution_options(populate_existing=True)
+    )
+
+
 def _validate_visual_evidence(visual_evidence: UploadFile | None = None) -> None:
     if not visual_evidence:
         return
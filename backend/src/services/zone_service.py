@@ -1,11 +1,21 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
 
 from src.models.db_models import Zone
 
 
-def get_zones(*, db: Session) -> list[Zone]:
-    return db.query(Zone).all()  # type: ignore
+async def get_zones(*, db: AsyncSession) -> list[Zone]:
+    return list(await db.scalars(select(Zone).options(raiseload("*"))))
 
 
-def get_zone_by_id(*, db: Session, zone_id: str) -> Zone | None:
-    return db.query(Zone).filter_by(id=zone_id).first()
+async def get_zone_by_id(*, db: AsyncSession, zone_id: str) -> Zone | None:
+    return await db.scalar(
+        select(Zone)
+        .filter_by(id=zone_id)
+        .options(
+            selectinload(Zone.sellers),
+            selectinload(Zone.selling_plans),
+            raiseload("*"),
+        )
+    )
@@ -1,7 +1,7 @@
 import pytest
 from fastapi.testclient import TestClient
 
-from src.core.security import create_access_token
+from src.core.security import create_access_token, get_principal_claims
 from src.models.db_models import (
     DistributionCenter,
     Order,
@@ -52,17 +52,12 @@ class BaseTest:
         )
         admin_user = next(user for user in self.users if user.role == UserRole.ADMIN)
         self.institutional_token = create_access_token(
-            data={
-                "sub": str(institutional_user.id),
-                "role": institutional_user.role.value,
-            }
+            data=get_principal_claims(institutional_user)
         )
         self.commercial_token = create_access_token(
-            data={"sub": str(commercial_user.id), "role": commercial_user.role.value}
-        )
-        self.admin_token = create_access_token(
-            data={"sub": str(admin_user.id), "role": admin_user.role.value}
+            data=get_principal_claims(commercial_user)
         )
+        self.admin_token = create_access_token(data=get_principal_claims(admin_user))
 
     def _set_up_test_data(self, setup_teardown_db):
         self.users = setup_teardown_db["users"]
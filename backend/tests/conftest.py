@@ -1,16 +1,18 @@
-from typing import Any, Generator
+import asyncio
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Generator
 from unittest.mock import MagicMock
 
 import pytest
 from dotenv import find_dotenv, load_dotenv
 from fastapi.testclient import TestClient
 from google.cloud import storage
-from sqlalchemy import create_engine, func
+from sqlalchemy import Engine, create_engine, event, func
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.logging_config import logger
 from src.core.security import hash_password
-from src.db.database import Base
+from src.db.database import Base, async_session_scope
 from src.dependencies.gcp_dependency import StorageClientSingleton
 from src.models.db_models import (
     DistributionCenter,
@@ -25,6 +27,13 @@ from src.models.db_models import (
 )
 from src.models.enums.user_role import UserRole
 from src.models.enums.visit_status import VisitStatus
+from src.services.catalog_cache_service import invalidate_catalog
+from src.services.email_outbox_service import deliver_pending_emails
+from src.services.email_service import LocalMailer, set_mailer
+from src.services.geocoding_cache_service import clear_geocoding_cache
+from src.services.permission_service import init_permission_index
+from src.services.principal_cache_service import clear_principal_cache
+from src.services.requests.email_request import EmailRequest
 from tests.containers.postgres_test_container import PostgresTestContainer
 
 
@@ -50,6 +59,8 @@ def test_client(
     logger.info("Configuring test client...")
     from src.main import app
 
+    # TestClient is used without its context manager, so startup does not run.
+    init_permission_index(app.routes)
     app.dependency_overrides[StorageClientSingleton] = (
         _override_storage_client_singleton
     )
@@ -58,6 +69,68 @@ def test_client(
     yield client
 
 
+@pytest.fixture
+def query_budget() -> Callable[[int], ContextManager[list[str]]]:
+    @contextmanager
+    def _query_budget(max_queries: int) -> Generator[list[str], None, None]:
+        statements = []
+
+        def _record_statement(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _record_statement)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", _record_statement)
+        assert len(statements) <= max_queries, (
+            f"Expected at most {max_queries} queries, got {len(statements)}:\n"
+            + "\n".join(statements)
+        )
+
+    return _query_budget
+
+
+@pytest.fixture
+def deliver_emails() -> Generator[Callable[[], list[EmailRequest]], None, None]:
+    """Runs the outbox worker once and returns every email delivered so far."""
+    mailer = LocalMailer()
+    set_mailer(mailer)
+
+    async def _deliver() -> None:
+        async with async_session_scope() as db:
+            while await deliver_pending_emails(db=db, limit=50):
+                pass
+
+    def _deliver_emails() -> list[EmailRequest]:
+        asyncio.run(_deliver())
+        return mailer.sent
+
+    yield _deliver_emails
+    set_mailer(None)
+
+
+@pytest.fixture(autouse=True)
+def reset_geocoding_cache() -> Generator[None, None, None]:
+    clear_geocoding_cache()
+    yield
+    clear_geocoding_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_principal_cache() -> Generator[None, None, None]:
+    clear_principal_cache()
+    yield
+    clear_principal_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_catalog_cache() -> Generator[None, None, None]:
+    invalidate_catalog()
+    yield
+    invalidate_catalog()
+
+
 @pytest.fixture(autouse=True)
 def setup_teardown_db(
     postgres_container: PostgresTestContainer,
@@ -242,6 +315,8 @@ def _populate_distribution_centers(db: Session) -> list[DistributionCenter]:
             address="123 Main St",
             city="City One",
             country="Country One",
+            latitude=4.6534,
+            longitude=-74.0836,
         ),
         DistributionCenter(
             name="Distribution Center Two",
@@ -9,6 +9,7 @@ class PostgresTestContainer:
 
     def __init__(self):
         self.postgres_container = PostgresContainer(
+            image="postgres:16-alpine",
             username=settings.postgres_user,
             password=settings.postgres_password,
             dbname=settings.postgres_db,
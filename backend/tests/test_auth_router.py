@@ -1,6 +1,24 @@
+import asyncio
 from unittest.mock import patch
 
+import jwt
+import pytest
+from sqlalchemy import select
+
 from src.core.config import settings
+from src.core.security import PRINCIPAL_CLAIMS
+from src.db.database import async_session_scope
+from src.models.db_models import Geolocation, User
+from src.models.enums.user_role import UserRole
+from src.services import permission_service
+from src.services.geocoding_cache_service import (
+    cache_address,
+    clear_geocoding_cache,
+    get_cached_address,
+    get_geocoding_cache_stats,
+)
+from src.services.geocoding_service import LocalGeocoder, get_geocoder
+from src.services.otp_service import purge_spent_otps
 from tests import mocks
 from tests.base_test import BaseTest
 
@@ -79,6 +97,111 @@ class TestAuthRouter(BaseTest):
         assert "created_at" in json_response
         mock_get_validated_address.assert_called_once()
 
+    @patch(
+        "src.services.geolocation_service.get_validated_address",
+        return_value=mocks.VALIDATED_ADDRESS_MOCK,
+    )
+    def test_register_users_with_the_same_address_geocodes_once(
+        self, mock_get_validated_address
+    ):
+        addresses = ["123 Test St", "  123 TEST   st. ", "123 test st"]
+        responses = []
+        for index, address in enumerate(addresses):
+            if index == 2:
+                # A fresh worker only has the shared table to go on.
+                clear_geocoding_cache()
+            responses.append(
+                self.client.post(
+                    f"{self.prefix}/auth/register",
+                    json={
+                        **self.create_user_payload,
+                        "email": f"user{index}@mail.com",
+                        "doi": f"12345678{index}",
+                        "address": address,
+                    },
+                )
+            )
+        stats = self.client.get(f"{self.prefix}/health/geocoding-cache").json()
+
+        assert [response.status_code for response in responses] == [201, 201, 201]
+        mock_get_validated_address.assert_called_once()
+        assert stats["database_hits"] == 1
+        assert stats["memory_hits"] == 0
+        assert stats["misses"] == 0
+
+    def test_geocoding_cache_only_remembers_committed_addresses(self):
+        async def cache(address: str, *, commit: bool) -> int:
+            async with async_session_scope() as db:
+                await cache_address(
+                    db=db,
+                    address=address,
+                    validated_address=mocks.VALIDATED_ADDRESS_MOCK,
+                )
+                entries = get_geocoding_cache_stats()["memory_entries"]
+                await (db.commit() if commit else db.rollback())
+                return entries
+
+        async def get_cached(address: str):
+            async with async_session_scope() as db:
+                return await get_cached_address(db=db, address=address)
+
+        clear_geocoding_cache()
+        entries_before_rollback = asyncio.run(cache("1 Rolled Back St", commit=False))
+        entries_after_rollback = get_geocoding_cache_stats()["memory_entries"]
+        entries_before_commit = asyncio.run(cache("2 Committed St", commit=True))
+        entries_after_commit = get_geocoding_cache_stats()["memory_entries"]
+
+        assert entries_before_rollback == 0
+        assert entries_after_rollback == 0
+        assert asyncio.run(get_cached("1 Rolled Back St")) is None
+        assert entries_before_commit == 0
+        assert entries_after_commit == 1
+
+    def test_geocoding_cache_keeps_addresses_longer_than_its_key(self):
+        address = "Edificio " + "muy largo " * 40
+
+        async def cache():
+            async with async_session_scope() as db:
+                await cache_address(
+                    db=db,
+                    address=address,
+                    validated_address=mocks.VALIDATED_ADDRESS_MOCK,
+                )
+                await db.commit()
+
+        async def get_cached():
+            async with async_session_scope() as db:
+                return await get_cached_address(db=db, address=address)
+
+        asyncio.run(cache())
+        clear_geocoding_cache()
+
+        assert len(address) > 255
+        assert asyncio.run(get_cached()) == mocks.VALIDATED_ADDRESS_MOCK
+        assert get_geocoding_cache_stats()["database_hits"] == 1
+
+    def test_register_user_with_local_geocoder(self):
+        response = self.client.post(
+            f"{self.prefix}/auth/register", json=self.create_user_payload
+        )
+
+        expected_address = LocalGeocoder().geocode(self.create_user_payload["address"])
+
+        async def get_geolocation():
+            async with async_session_scope() as db:
+                return await db.scalar(
+                    select(Geolocation)
+                    .join(User, User.geolocation_id == Geolocation.id)
+                    .filter(User.id == response.json()["id"])
+                )
+
+        geolocation = asyncio.run(get_geolocation())
+
+        assert response.status_code == 201
+        assert isinstance(get_geocoder(), LocalGeocoder)
+        assert geolocation.latitude == expected_address.latitude
+        assert geolocation.longitude == expected_address.longitude
+
     def test_login_with_invalid_parameters(self):
         payload = self.login_payload.copy()
         payload["email"] = "invalid-email"
@@ -121,8 +244,7 @@ class TestAuthRouter(BaseTest):
         "src.services.geolocation_service.get_validated_address",
         return_value=mocks.VALIDATED_ADDRESS_MOCK,
     )
-    @patch("src.services.auth_service.send_email")
-    def test_login_successfully(self, mock_send_email, mock_get_validated_address):
+    def test_login_successfully(self, mock_get_validated_address, deliver_emails):
         register_response = self.client.post(
             f"{self.prefix}/auth/register", json=self.create_user_payload
         )
@@ -139,7 +261,7 @@ class TestAuthRouter(BaseTest):
         assert (
             json_response["otp_expiration_minutes"] == settings.otp_expiration_minutes
         )
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
         mock_get_validated_address.assert_called_once()
 
     def test_verify_otp_with_invalid_parameters(self):
@@ -167,9 +289,8 @@ class TestAuthRouter(BaseTest):
         return_value=mocks.VALIDATED_ADDRESS_MOCK,
     )
     @patch("src.services.otp_service.random.randint", return_value=123456)
-    @patch("src.services.auth_service.send_email")
     def test_verify_with_incorrect_otp(
-        self, mock_send_email, mock_randint, mock_get_validated_address
+        self, mock_randint, mock_get_validated_address, deliver_emails
     ):
         register_response = self.client.post(
             f"{self.prefix}/auth/register", json=self.create_user_payload
@@ -187,7 +308,7 @@ class TestAuthRouter(BaseTest):
 
         assert response.status_code == 401
         assert response.json() == {"message": "Invalid or expired OTP"}
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
         mock_randint.assert_called_once()
         mock_get_validated_address.assert_called_once()
 
@@ -196,9 +317,8 @@ class TestAuthRouter(BaseTest):
         return_value=mocks.VALIDATED_ADDRESS_MOCK,
     )
     @patch("src.services.otp_service.random.randint", return_value=123456)
-    @patch("src.services.auth_service.send_email")
     def test_verify_otp_successfully(
-        self, mock_send_email, mock_randint, mock_get_validated_address
+        self, mock_randint, mock_get_validated_address, deliver_emails
     ):
         register_response = self.client.post(
             f"{self.prefix}/auth/register", json=self.create_user_payload
@@ -219,6 +339,134 @@ class TestAuthRouter(BaseTest):
         assert json_response["message"] == "OTP verified successfully"
         assert "access_token" in json_response
         assert json_response["token_type"] == "bearer"
-        mock_send_email.assert_called_once()
+        assert jwt.decode(
+            json_response["access_token"],
+            settings.jwt_secret_key,
+            algorithms=[settings.jwt_algorithm],
+        ).keys() >= set(PRINCIPAL_CLAIMS)
+        assert len(deliver_emails()) == 1
         mock_randint.assert_called_once()
         mock_get_validated_address.assert_called_once()
+
+    @patch(
+        "src.services.geolocation_service.get_validated_address",
+        return_value=mocks.VALIDATED_ADDRESS_MOCK,
+    )
+    @patch("src.services.otp_service.random.randint", side_effect=[111111, 222222])
+    def test_new_login_invalidates_previous_otp(
+        self, mock_randint, mock_get_validated_address
+    ):
+        self.client.post(f"{self.prefix}/auth/register", json=self.create_user_payload)
+        self.client.post(f"{self.prefix}/auth/login", json=self.login_payload)
+        self.client.post(f"{self.prefix}/auth/login", json=self.login_payload)
+
+        stale_response = self.client.post(
+            f"{self.prefix}/auth/verify-otp",
+            json={**self.verify_otp_payload, "otp_code": "111111"},
+        )
+        response = self.client.post(
+            f"{self.prefix}/auth/verify-otp",
+            json={**self.verify_otp_payload, "otp_code": "222222"},
+        )
+
+        assert stale_response.status_code == 401
+        assert response.status_code == 200
+        assert mock_randint.call_count == 2
+
+    @patch(
+        "src.services.geolocation_service.get_validated_address",
+        return_value=mocks.VALIDATED_ADDRESS_MOCK,
+    )
+    def test_purge_spent_otps(self, mock_get_validated_address):
+        self.client.post(f"{self.prefix}/auth/register", json=self.create_user_payload)
+        for _ in range(3):
+            self.client.post(f"{self.prefix}/auth/login", json=self.login_payload)
+
+        async def purge() -> int:
+            async with async_session_scope() as db:
+                return await purge_spent_otps(db=db, batch_size=1)
+
+        deleted = asyncio.run(purge())
+        response = self.client.get(f"{self.prefix}/health/otps")
+        json_response = response.json()
+
+        assert deleted == 2
+        assert response.status_code == 200
+        assert json_response["total"] == json_response["active"] == 1
+        assert json_response["used"] == json_response["expired"] == 0
+        assert json_response["last_sweep_deleted"] == 2
+        assert json_response["last_sweep_at"] is not None
+
+    @pytest.mark.parametrize(
+        "authorized_client,role,can_list_zones",
+        [
+            ("admin_token", "admin", True),
+            ("institutional_token", "institutional", False),
+        ],
+        indirect=["authorized_client"],
+    )
+    def test_get_permissions(self, authorized_client, role, can_list_zones):
+        response = authorized_client.get(f"{self.prefix}/auth/permissions")
+        json_response = response.json()
+        paths = {endpoint["path"] for endpoint in json_response["allowed_endpoints"]}
+
+        assert response.status_code == 200
+        assert json_response["user"]["role"] == role
+        assert f"{self.prefix}/health" in paths
+        assert (f"{self.prefix}/zones" in paths) is can_list_zones
+        assert response.headers["etag"]
+
+    def test_get_permissions_not_modified(self, authorized_client):
+        response = authorized_client.get(f"{self.prefix}/auth/permissions")
+        cached_response = authorized_client.get(
+            f"{self.prefix}/auth/permissions",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        institutional_response = self.client.get(
+            f"{self.prefix}/auth/permissions",
+            headers={
+                "Authorization": f"Bearer {self.institutional_token}",
+                "If-None-Match": response.headers["etag"],
+            },
+        )
+
+        assert cached_response.status_code == 304
+        assert cached_response.headers["etag"] == response.headers["etag"]
+        assert institutional_response.status_code == 200
+
+    def test_get_permissions_without_querying_the_database(
+        self, authorized_client, query_budget
+    ):
+        with query_budget(0):
+            response = authorized_client.get(f"{self.prefix}/auth/permissions")
+            cached_response = authorized_client.get(
+                f"{self.prefix}/auth/permissions",
+                headers={"If-None-Match": response.headers["etag"]},
+            )
+
+        assert response.status_code == 200
+        assert cached_response.status_code == 304
+
+    def test_get_permissions_before_startup(self, monkeypatch):
+        monkeypatch.setattr(permission_service, "_permission_index", None)
+
+        with pytest.raises(RuntimeError, match="built at application startup"):
+            permission_service.get_role_permissions(UserRole.ADMIN)
+
+    @pytest.mark.parametrize(
+        "if_none_match",
+        ['"other", {etag}', "W/{etag}", "*"],
+        ids=["list", "weak", "any"],
+    )
+    def test_get_permissions_not_modified_with_if_none_match_forms(
+        self, authorized_client, if_none_match
+    ):
+        response = authorized_client.get(f"{self.prefix}/auth/permissions")
+        cached_response = authorized_client.get(
+            f"{self.prefix}/auth/permissions",
+            headers={
+                "If-None-Match": if_none_match.format(etag=response.headers["etag"])
+            },
+        )
+
+        assert cached_response.status_code == 304
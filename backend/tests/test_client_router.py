@@ -1,9 +1,18 @@
+import json
+import threading
+from unittest.mock import patch
+
 import pytest
 
+from src.core.config import settings
+from src.core.security import hash_password
+from src.models.enums.user_role import UserRole
+from tests import mocks
 from tests.base_test import BaseTest
 
 
 class TestClientRouter(BaseTest):
+    csv_header = "full_name,email,phone,doi,address,password\n"
 
     @pytest.mark.parametrize("authorized_client", ["commercial_token"], indirect=True)
     def test_get_seller_clients(self, authorized_client):
@@ -12,3 +21,139 @@ class TestClientRouter(BaseTest):
         assert response.status_code == 200
         assert "total_count" in json_response
         assert "clients" in json_response
+
+    @patch(
+        "src.services.client_import_service.get_validated_address",
+        return_value=mocks.VALIDATED_ADDRESS_MOCK,
+    )
+    def test_import_clients_from_csv(
+        self, mock_get_validated_address, authorized_client
+    ):
+        existing_client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        content = (
+            self.csv_header
+            + "Client One,one@mail.com,1234567890,900000001,123 Test St,pass123\n"
+            + "Client Two,two@mail.com,1234567890,900000002,  123 TEST st. ,pass123\n"
+            + "Client Three,three@mail.com,12ab,900000003,123 Test St,pass123\n"
+            + f"Client Four,{existing_client.email},1234567890,900000004,9 Side St,pass123\n"
+        )
+
+        response = authorized_client.post(
+            f"{self.prefix}/clients-batch",
+            files={"file": ("clients.csv", content.encode(), "text/csv")},
+        )
+        json_response = response.json()
+        seller_response = self.client.get(
+            f"{self.prefix}/clients",
+            headers={"Authorization": f"Bearer {self.commercial_token}"},
+        )
+
+        assert response.status_code == 201
+        assert json_response["success"] is False
+        assert json_response["rows_total"] == 4
+        assert json_response["rows_inserted"] == 2
+        assert json_response["errors"] == 2
+        assert "(row 3)" in json_response["errors_details"][0]
+        assert "(row 4)" in json_response["errors_details"][1]
+        assert "already exists" in json_response["errors_details"][1]
+        mock_get_validated_address.assert_called_once()
+        assert {"one@mail.com", "two@mail.com"} <= {
+            client["email"] for client in seller_response.json()["clients"]
+        }
+
+    def test_import_clients_from_json(self, authorized_client, deliver_emails):
+        content = json.dumps(
+            [
+                {
+                    "full_name": "Json Client",
+                    "email": "json@mail.com",
+                    "phone": "1234567890",
+                    "doi": "900000010",
+                    "address": "742 Evergreen Terrace",
+                    "password": "pass123",
+                }
+            ]
+        )
+
+        response = authorized_client.post(
+            f"{self.prefix}/clients-batch",
+            files={"file": ("clients.json", content.encode(), "application/json")},
+        )
+        login_response = self.client.post(
+            f"{self.prefix}/auth/login",
+            json={"email": "json@mail.com", "password": "pass123"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["success"] is True
+        assert response.json()["rows_inserted"] == 1
+        assert login_response.status_code == 200
+        assert len(deliver_emails()) == 1
+
+    @pytest.mark.parametrize(
+        "filename,content,message",
+        [
+            ("clients.csv", b"full_name,email\nA,a@mail.com\n", "Missing CSV columns"),
+            ("clients.json", b'{"email": "a@mail.com"}', "must contain a list"),
+            ("clients.csv", csv_header.encode(), "does not contain any client"),
+        ],
+    )
+    def test_import_clients_with_invalid_file(
+        self, authorized_client, filename, content, message
+    ):
+        response = authorized_client.post(
+            f"{self.prefix}/clients-batch", files={"file": (filename, content)}
+        )
+
+        assert response.status_code == 400
+        assert message in response.json()["message"]
+
+    def test_import_clients_hashes_outside_the_login_pool(self, authorized_client):
+        threads = []
+
+        def recording_hash_password(password):
+            threads.append(threading.current_thread().name)
+            return hash_password(password)
+
+        content = json.dumps(
+            [
+                {
+                    "full_name": "Pool Client",
+                    "email": "pool@mail.com",
+                    "phone": "1234567890",
+                    "doi": "900000020",
+                    "address": "742 Evergreen Terrace",
+                    "password": "pass123",
+                }
+            ]
+        )
+
+        with patch(
+            "src.services.client_import_service.hash_password",
+            side_effect=recording_hash_password,
+        ):
+            response = authorized_client.post(
+                f"{self.prefix}/clients-batch",
+                files={"file": ("clients.json", content.encode(), "application/json")},
+            )
+
+        assert response.status_code == 201
+        assert len(threads) == 1
+        assert threads[0].startswith("client-import-hashing")
+
+    def test_import_clients_over_the_row_limit(self, authorized_client):
+        content = self.csv_header + "".join(
+            f"Client {i},c{i}@mail.com,1234567890,9100000{i:02d},1 St,pass123\n"
+            for i in range(3)
+        )
+
+        with patch.object(settings, "client_import_max_rows", 2):
+            response = authorized_client.post(
+                f"{self.prefix}/clients-batch",
+                files={"file": ("clients.csv", content.encode(), "text/csv")},
+            )
+
+        assert response.status_code == 422
+        assert "limit of 2 clients" in response.json()["message"]
@@ -0,0 +1,57 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from src.db.database import _add_missing_columns, _create_missing_indexes
+
+_WORKERS = 4
+
+
+class TestDatabase:
+    @pytest.fixture(autouse=True)
+    def _engine(self, postgres_container):
+        self.engine = create_engine(postgres_container.get_connection_url())
+        yield
+        self.engine.dispose()
+
+    def _run_concurrently(self, step) -> None:
+        with ThreadPoolExecutor(max_workers=_WORKERS) as executor:
+            futures = [
+                executor.submit(step, engine=self.engine) for _ in range(_WORKERS)
+            ]
+            for future in futures:
+                future.result()
+
+    def test_add_missing_columns_from_concurrent_workers(self):
+        with self.engine.begin() as connection:
+            connection.execute(
+                text("ALTER TABLE distribution_centers DROP COLUMN latitude")
+            )
+
+        self._run_concurrently(_add_missing_columns)
+
+        columns = inspect(self.engine).get_columns("distribution_centers")
+        assert "latitude" in {column["name"] for column in columns}
+
+    def test_create_missing_indexes_from_concurrent_workers(self):
+        with self.engine.begin() as connection:
+            connection.execute(
+                text("DROP INDEX ix_orders_seller_id_delivery_date_status")
+            )
+
+        self._run_concurrently(_create_missing_indexes)
+
+        indexes = inspect(self.engine).get_indexes("orders")
+        assert "ix_orders_seller_id_delivery_date_status" in {
+            index["name"] for index in indexes
+        }
+
+    def test_create_missing_indexes_drops_removed_indexes(self):
+        with self.engine.begin() as connection:
+            connection.execute(text("CREATE INDEX ix_users_role ON users (role)"))
+
+        _create_missing_indexes(engine=self.engine)
+
+        indexes = inspect(self.engine).get_indexes("users")
+        assert "ix_users_role" not in {index["name"] for index in indexes}
@@ -0,0 +1,256 @@
+import asyncio
+import random
+import uuid
+from contextlib import suppress
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event, insert, text
+
+from src.db.database import async_session_scope
+from src.errors.errors import ApiError
+from src.models.db_models import OTP, Order, OrderProduct, User, Visit
+from src.models.enums.order_status import OrderStatus
+from src.models.enums.user_role import UserRole
+from src.models.enums.visit_status import VisitStatus
+from src.services.order_service import get_orders
+from src.services.otp_service import verify_otp
+from src.services.principal_cache_service import Principal
+from src.services.report_service import get_orders_report
+from src.services.seller_service import get_clients_by_seller_id
+from src.services.visit_service import get_visits
+from tests.base_test import BaseTest
+
+
+class TestDbIndexes(BaseTest):
+    sellers_count = 40
+    clients_count = 2000
+    rows_count = 4000
+
+    @pytest.fixture(autouse=True)
+    def _seed_dataset(self, postgres_container):
+        self.engine = create_engine(postgres_container.get_connection_url())
+        random.seed(7)
+        sellers = [
+            self._user(role=UserRole.COMMERCIAL) for _ in range(self.sellers_count)
+        ]
+        clients = [
+            self._user(
+                role=UserRole.INSTITUTIONAL, seller_id=random.choice(sellers)["id"]
+            )
+            for _ in range(self.clients_count)
+        ]
+        self.seller_id = sellers[0]["id"]
+        self.client_id = clients[0]["id"]
+        distribution_center_id = next(iter(self.distribution_centers)).id
+        product_id = next(iter(self.products)).id
+        geolocation_id = next(u for u in self.users if u.geolocation_id).geolocation_id
+        orders = [
+            {
+                "id": str(uuid.uuid4()),
+                "delivery_date": self._random_date(),
+                "status": random.choice(list(OrderStatus)),
+                "created_at": datetime.now(timezone.utc)
+                - timedelta(days=random.randint(0, 365)),
+                "seller_id": random.choice(sellers)["id"],
+                "client_id": random.choice(clients)["id"],
+                "distribution_center_id": distribution_center_id,
+            }
+            for _ in range(self.rows_count)
+        ]
+        visits = [
+            {
+                "id": str(uuid.uuid4()),
+                "expected_date": self._random_date(),
+                "status": random.choice(list(VisitStatus)),
+                "expected_geolocation_id": geolocation_id,
+                "seller_id": random.choice(sellers)["id"],
+                "client_id": random.choice(clients)["id"],
+            }
+            for _ in range(self.rows_count)
+        ]
+        otps = [
+            {
+                "id": str(uuid.uuid4()),
+                "code": f"{random.randint(0, 999999):06d}",
+                "expires_at": datetime.now() + timedelta(minutes=5),
+                "expiration_minutes": 5,
+                "is_used": random.random() < 0.9,
+                "user_id": random.choice(clients)["id"],
+            }
+            for _ in range(self.rows_count)
+        ]
+        order_products = [
+            {
+                "id": str(uuid.uuid4()),
+                "quantity": 1,
+                "order_id": order["id"],
+                "product_id": product_id,
+            }
+            for order in orders
+        ]
+        with self.engine.begin() as conn:
+            conn.execute(insert(User), sellers + clients)
+            conn.execute(insert(Order), orders)
+            conn.execute(insert(OrderProduct), order_products)
+            conn.execute(insert(Visit), visits)
+            conn.execute(insert(OTP), otps)
+            conn.execute(text("ANALYZE"))
+        yield
+        self.engine.dispose()
+
+    def test_get_orders_uses_seller_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_orders(
+                db=db,
+                current_user=Principal(id=self.seller_id, role=UserRole.COMMERCIAL),
+                delivery_date=date.today(),
+                order_status=OrderStatus.RECEIVED,
+                limit=20,
+                include_total=False,
+            ),
+            table="orders",
+        )
+
+        assert "ix_orders_seller_id_delivery_date_status" in plan
+
+    def test_get_orders_page_uses_seller_created_at_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_orders(
+                db=db,
+                current_user=Principal(id=self.seller_id, role=UserRole.COMMERCIAL),
+                limit=20,
+                include_total=False,
+            ),
+            table="orders",
+        )
+
+        assert "ix_orders_seller_id_created_at" in plan
+
+    def test_get_orders_uses_client_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_orders(
+                db=db,
+                current_user=Principal(id=self.client_id, role=UserRole.INSTITUTIONAL),
+                limit=20,
+                include_total=False,
+            ),
+            table="orders",
+        )
+
+        assert "ix_orders_client_id_delivery_date_status" in plan
+
+    def test_get_orders_report_uses_seller_created_at_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_orders_report(
+                db=db,
+                seller_id=self.seller_id,
+                start_date=datetime.now(timezone.utc) - timedelta(days=7),
+                end_date=None,
+                limit=20,
+                include_total=False,
+            ),
+            table="orders",
+        )
+
+        assert "ix_orders_seller_id_created_at" in plan
+
+    def test_order_products_lookup_uses_order_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_orders_report(
+                db=db,
+                seller_id=self.seller_id,
+                start_date=None,
+                end_date=None,
+                limit=20,
+                include_total=False,
+            ),
+            table="order_products",
+        )
+
+        assert "ix_order_products_order_id" in plan
+
+    def test_get_visits_uses_seller_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_visits(
+                db=db,
+                current_user=Principal(id=self.seller_id, role=UserRole.COMMERCIAL),
+                expected_date=date.today(),
+                limit=20,
+                include_total=False,
+            ),
+            table="visits",
+        )
+
+        assert "ix_visits_seller_id_expected_date_status" in plan
+
+    def test_verify_otp_uses_lookup_index(self):
+        plan = self._explain_service_call(
+            lambda db: verify_otp(
+                db=db, user=User(id=self.client_id), otp_code="123456"
+            ),
+            table="otps",
+        )
+
+        assert "ix_otps_user_id_code_is_used_expires_at" in plan
+
+    def test_get_clients_by_seller_uses_seller_index(self):
+        plan = self._explain_service_call(
+            lambda db: get_clients_by_seller_id(db=db, seller_id=self.seller_id),
+            table="users",
+        )
+
+        assert "ix_users_seller_id_role" in plan
+
+    @staticmethod
+    def _explain_service_call(call, *, table: str) -> str:
+        """EXPLAINs the statements the service call sends for the given table."""
+
+        async def explain() -> str:
+            statements = []
+
+            def capture(_conn, _cursor, statement, parameters, _context, _many):
+                if statement.startswith("SELECT") and f"FROM {table}" in statement:
+                    statements.append((statement, parameters))
+
+            async with async_session_scope() as db:
+                engine = db.bind.sync_engine
+                event.listen(engine, "before_cursor_execute", capture)
+                try:
+                    with suppress(ApiError):
+                        await call(db)
+                finally:
+                    event.remove(engine, "before_cursor_execute", capture)
+                connection = await db.connection()
+                plans = [
+                    line
+                    for statement, parameters in statements
+                    for line in (
+                        await connection.exec_driver_sql(
+                            f"EXPLAIN {statement}", parameters
+                        )
+                    ).scalars()
+                ]
+
+            assert statements, f"The service call did not query {table}"
+            return "\n".join(plans)
+
+        return asyncio.run(explain())
+
+    @staticmethod
+    def _user(*, role: UserRole, seller_id: str | None = None) -> dict:
+        user_id = str(uuid.uuid4())
+        return {
+            "id": user_id,
+            "full_name": "Seeded User",
+            "email": f"{user_id}@example.com",
+            "hashed_password": "x" * 60,
+            "phone": "123456789",
+            "doi": user_id,
+            "role": role,
+            "seller_id": seller_id,
+        }
+
+    @staticmethod
+    def _random_date() -> date:
+        return date.today() + timedelta(days=random.randint(-180, 180))
@@ -1,3 +1,6 @@
+import pytest
+
+from src.services.geocoding_service import get_validated_address
 from tests.base_test import BaseTest
 
 
@@ -52,3 +55,73 @@ class TestDistributionCenterRouter(BaseTest):
         assert json_response["address"] == distribution_center.address
         assert json_response["city"] == distribution_center.city
         assert json_response["country"] == distribution_center.country
+
+    def test_register_distribution_center_with_coordinates(self, authorized_client):
+        payload = {
+            "name": "Distribution Center Three",
+            "address": "789 North St",
+            "city": "City Three",
+            "country": "Country Three",
+            "latitude": 4.6097,
+            "longitude": -74.0817,
+        }
+        response = authorized_client.post(
+            f"{self.prefix}/distribution-centers", json=payload
+        )
+        json_response = response.json()
+        assert response.status_code == 201
+        assert json_response["name"] == payload["name"]
+        assert json_response["latitude"] == payload["latitude"]
+        assert json_response["longitude"] == payload["longitude"]
+        assert json_response["orders"] == []
+
+    def test_register_distribution_center_geocodes_address(self, authorized_client):
+        payload = {
+            "name": "Distribution Center Three",
+            "address": "789 North St",
+            "city": "City Three",
+            "country": "Country Three",
+        }
+        validated_address = get_validated_address(
+            address="789 North St, City Three, Country Three"
+        )
+        response = authorized_client.post(
+            f"{self.prefix}/distribution-centers", json=payload
+        )
+        json_response = response.json()
+        assert response.status_code == 201
+        assert json_response["latitude"] == validated_address.latitude
+        assert json_response["longitude"] == validated_address.longitude
+
+    def test_register_distribution_center_with_partial_coordinates(
+        self, authorized_client
+    ):
+        payload = {
+            "name": "Distribution Center Three",
+            "address": "789 North St",
+            "city": "City Three",
+            "country": "Country Three",
+            "latitude": 4.6097,
+        }
+        response = authorized_client.post(
+            f"{self.prefix}/distribution-centers", json=payload
+        )
+        json_response = response.json()
+        assert response.status_code == 400
+        assert (
+            json_response["message"]
+            == "Latitude and longitude must be provided together"
+        )
+
+    @pytest.mark.parametrize("authorized_client", ["commercial_token"], indirect=True)
+    def test_register_distribution_center_forbidden(self, authorized_client):
+        response = authorized_client.post(
+            f"{self.prefix}/distribution-centers",
+            json={
+                "name": "Distribution Center Three",
+                "address": "789 North St",
+                "city": "City Three",
+                "country": "Country Three",
+            },
+        )
+        assert response.status_code == 403
@@ -0,0 +1,145 @@
+import asyncio
+import os
+import smtplib
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pystache
+import pytest
+from sqlalchemy import select
+
+from src.core.config import settings
+from src.core.utils import get_template_path
+from src.db.database import async_session_scope
+from src.models.db_models import EmailOutbox
+from src.models.enums.email_status import EmailStatus
+from src.services.email_outbox_service import deliver_pending_emails, enqueue_email
+from src.services.email_service import LocalMailer, SmtpMailer, set_mailer
+from src.services.email_template_service import TemplateRegistry
+from src.services.requests.email_request import EmailRequest
+
+EMAIL_REQUEST = EmailRequest(
+    email_receiver="client@mail.com",
+    email_subject="Subject",
+    email_content="<p>Content</p>",
+)
+
+
+class FailingMailer(LocalMailer):
+    def send(self, email_request: EmailRequest) -> None:
+        raise smtplib.SMTPException("Service unavailable")
+
+
+async def _enqueue() -> None:
+    async with async_session_scope() as db:
+        await enqueue_email(db=db, email_request=EMAIL_REQUEST)
+        await db.commit()
+
+
+async def _deliver() -> tuple[int, EmailOutbox]:
+    async with async_session_scope() as db:
+        processed = await deliver_pending_emails(db=db, limit=10)
+        email = await db.scalar(select(EmailOutbox))
+
+        return processed, email
+
+
+class TestEmailService:
+    @pytest.fixture(autouse=True)
+    def _restore_mailer(self):
+        yield
+        set_mailer(None)
+
+    @patch("src.services.email_service.smtplib.SMTP_SSL")
+    def test_smtp_mailer_reuses_the_connection(self, mock_smtp_ssl):
+        mailer = SmtpMailer()
+        mailer.send(EMAIL_REQUEST)
+        mailer.send(EMAIL_REQUEST)
+        mailer.close()
+
+        mock_smtp_ssl.assert_called_once()
+        mock_smtp_ssl.return_value.login.assert_called_once_with(
+            settings.email_sender, settings.email_api_key
+        )
+        assert mock_smtp_ssl.return_value.send_message.call_count == 2
+        mock_smtp_ssl.return_value.quit.assert_called_once()
+
+    @patch("src.services.email_service.smtplib.SMTP_SSL")
+    def test_smtp_mailer_reconnects_after_a_disconnect(self, mock_smtp_ssl):
+        stale_connection, fresh_connection = MagicMock(), MagicMock()
+        stale_connection.send_message.side_effect = smtplib.SMTPServerDisconnected
+        mock_smtp_ssl.side_effect = [stale_connection, fresh_connection]
+        mailer = SmtpMailer()
+
+        mailer.send(EMAIL_REQUEST)
+
+        assert mock_smtp_ssl.call_count == 2
+        fresh_connection.send_message.assert_called_once()
+
+    def test_delivered_email_is_marked_as_sent(self):
+        mailer = LocalMailer()
+        set_mailer(mailer)
+        asyncio.run(_enqueue())
+
+        processed, email = asyncio.run(_deliver())
+
+        assert processed == 1
+        assert mailer.sent == [EMAIL_REQUEST]
+        assert email.status == EmailStatus.SENT
+        assert email.attempts == 1
+        assert email.email_content is None
+
+    def test_failed_email_is_retried_with_backoff(self):
+        set_mailer(FailingMailer())
+        asyncio.run(_enqueue())
+
+        processed, email = asyncio.run(_deliver())
+        processed_again, _ = asyncio.run(_deliver())
+
+        assert processed == 1
+        assert processed_again == 0
+        assert email.status == EmailStatus.PENDING
+        assert email.attempts == 1
+        assert email.last_error == "Service unavailable"
+        assert email.next_attempt_at > datetime.now(timezone.utc)
+
+    def test_email_fails_after_the_last_attempt(self, monkeypatch):
+        monkeypatch.setattr(settings, "email_max_attempts", 1)
+        set_mailer(FailingMailer())
+        asyncio.run(_enqueue())
+
+        _, email = asyncio.run(_deliver())
+
+        assert email.status == EmailStatus.FAILED
+        assert email.email_content == EMAIL_REQUEST.email_content
+
+    def test_template_registry_renders_like_pystache(self):
+        template_values = {
+            "full_name": "<Client>",
+            "otp_code": "123456",
+            "otp_expiration_minutes": 5,
+        }
+        registry = TemplateRegistry(directory=os.path.dirname(get_template_path("")))
+        registry.load()
+        with open(get_template_path("otp_template.html"), encoding="utf-8") as file:
+            expected_content = pystache.render(file.read(), template_values)
+
+        assert registry.render("otp_template.html", template_values) == (
+            expected_content
+        )
+
+    def test_template_registry_reloads_changed_templates(self, tmp_path):
+        template_path = tmp_path / "greeting.html"
+        template_path.write_text("Hola {{name}}", encoding="utf-8")
+        cached_registry = TemplateRegistry(directory=str(tmp_path))
+        reloading_registry = TemplateRegistry(directory=str(tmp_path), reload=True)
+        cached_registry.load()
+        reloading_registry.load()
+
+        template_path.write_text("Adiós {{name}}", encoding="utf-8")
+        os.utime(template_path, (0, os.path.getmtime(template_path) + 1))
+
+        assert cached_registry.render("greeting.html", {"name": "Ana"}) == "Hola Ana"
+        assert reloading_registry.render("greeting.html", {"name": "Ana"}) == (
+            "Adiós Ana"
+        )
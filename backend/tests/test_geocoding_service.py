@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock, patch
+
+import googlemaps
+import pytest
+
+from src.core.config import settings
+from src.errors.errors import ApiError, BadRequestException
+from src.services.geocoding_service import (
+    GoogleMapsGeocoder,
+    LocalGeocoder,
+    _build_gmaps_client,
+    get_validated_address,
+    set_geocoder,
+)
+from tests import mocks
+
+GEOCODE_RESULT = {
+    "formatted_address": "1600 Amphitheatre Parkway, Mountain View, CA 94043, USA",
+    "geometry": {
+        "location": {"lat": 37.4224764, "lng": -122.0842499},
+        "location_type": "ROOFTOP",
+    },
+}
+
+
+class TestGeocodingService:
+    @pytest.fixture(autouse=True)
+    def _restore_geocoder(self):
+        yield
+        set_geocoder(None)
+
+    def test_gmaps_client_is_shared_and_pooled(self, monkeypatch):
+        monkeypatch.setattr(settings, "google_maps_api_key", "AIza-test-key")
+        geocoder = GoogleMapsGeocoder()
+        session = geocoder.client.session
+
+        assert session is geocoder.client.session
+        assert session.get_adapter("https://maps.googleapis.com")._pool_maxsize == (
+            settings.google_maps_pool_size
+        )
+        assert geocoder.client.queries_per_second == (
+            settings.google_maps_queries_per_second
+        )
+        assert _build_gmaps_client().session is not session
+        geocoder.close()
+
+    @patch("src.services.geocoding_service.time.sleep")
+    def test_google_geocoder_retries_transient_errors(self, mock_sleep):
+        client = MagicMock()
+        client.geocode.side_effect = [
+            googlemaps.exceptions.Timeout(),
+            googlemaps.exceptions.TransportError("connection reset"),
+            [GEOCODE_RESULT],
+        ]
+        set_geocoder(GoogleMapsGeocoder(client=client))
+
+        validated_address = get_validated_address("1600 Amphitheatre Parkway")
+
+        assert (
+            validated_address.latitude == GEOCODE_RESULT["geometry"]["location"]["lat"]
+        )
+        assert client.geocode.call_count == 3
+        assert mock_sleep.call_count == 2
+        first_delay, second_delay = (call.args[0] for call in mock_sleep.call_args_list)
+        assert 0.5 * settings.google_maps_retry_backoff_seconds <= first_delay
+        assert second_delay <= 3 * settings.google_maps_retry_backoff_seconds
+
+    @patch("src.services.geocoding_service.time.sleep")
+    def test_google_geocoder_gives_up_after_max_retries(self, mock_sleep):
+        client = MagicMock()
+        client.geocode.side_effect = googlemaps.exceptions.Timeout()
+        set_geocoder(GoogleMapsGeocoder(client=client))
+
+        with pytest.raises(ApiError):
+            get_validated_address("1600 Amphitheatre Parkway")
+
+        assert client.geocode.call_count == settings.google_maps_max_retries + 1
+
+    def test_google_geocoder_does_not_retry_api_errors(self):
+        client = MagicMock()
+        client.geocode.side_effect = googlemaps.exceptions.ApiError("REQUEST_DENIED")
+        set_geocoder(GoogleMapsGeocoder(client=client))
+
+        with pytest.raises(ApiError):
+            get_validated_address("1600 Amphitheatre Parkway")
+
+        client.geocode.assert_called_once()
+
+    def test_google_geocoder_rejects_imprecise_results(self):
+        client = MagicMock()
+        client.geocode.return_value = [
+            {
+                **GEOCODE_RESULT,
+                "geometry": {
+                    **GEOCODE_RESULT["geometry"],
+                    "location_type": "APPROXIMATE",
+                },
+            }
+        ]
+        set_geocoder(GoogleMapsGeocoder(client=client))
+
+        with pytest.raises(BadRequestException):
+            get_validated_address("1600 Amphitheatre Parkway")
+
+    def test_local_geocoder(self):
+        geocoder = LocalGeocoder(
+            known_addresses={"1600 Amphitheatre Parkway": mocks.VALIDATED_ADDRESS_MOCK}
+        )
+
+        assert geocoder.geocode(" 1600 amphitheatre parkway.") == (
+            mocks.VALIDATED_ADDRESS_MOCK
+        )
+        first, second, other = (
+            geocoder.geocode(address)
+            for address in ("123 Test St", "123 TEST st", "456 Side St")
+        )
+        assert (first.latitude, first.longitude) == (second.latitude, second.longitude)
+        assert (first.latitude, first.longitude) != (other.latitude, other.longitude)
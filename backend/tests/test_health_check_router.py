@@ -1,3 +1,4 @@
+from src.core.config import settings
 from tests.base_test import BaseTest
 
 
@@ -13,3 +14,15 @@ class TestHealthCheckRouter(BaseTest):
         assert json_response["service"] == "API"
         assert "hostname" in response.headers
         assert "ip_address" in response.headers
+
+    def test_db_pool_stats(self):
+        response = self.client.get(f"{self.prefix}/health/db-pool")
+        assert response.status_code == 200
+        json_response = response.json()
+        assert json_response["max_connections"] == (
+            settings.db_pool_size + settings.db_max_overflow
+        )
+        assert json_response["pool_class"] == (
+            "NullPool" if settings.db_null_pool else "AsyncAdaptedQueuePool"
+        )
+        assert "hostname" in response.headers
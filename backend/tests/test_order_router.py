@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from unittest.mock import patch
 
@@ -227,6 +228,32 @@ class TestOrderRouter(BaseTest):
         )
         assert len(json_response["products"]) == len(payload["products"])
 
+    @pytest.mark.parametrize(
+        "authorized_client", ["institutional_token"], indirect=True
+    )
+    def test_register_orders_concurrently_does_not_oversell(self, authorized_client):
+        product = next(iter(self.products))
+        quantity = 15
+        workers = 12
+        payload = self.create_order_by_client_payload()
+        payload["products"][0]["quantity"] = quantity
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: authorized_client.post(
+                        f"{self.prefix}/orders", json=payload
+                    ),
+                    range(workers),
+                )
+            )
+        status_codes = [response.status_code for response in responses]
+        product_response = authorized_client.get(f"{self.prefix}/products/{product.id}")
+
+        assert status_codes.count(201) == product.stock // quantity
+        assert status_codes.count(409) == workers - product.stock // quantity
+        assert product_response.json()["stock"] == product.stock % quantity
+
     @pytest.mark.parametrize(
         "authorized_client", ["commercial_token", "institutional_token"], indirect=True
     )
@@ -238,6 +265,26 @@ class TestOrderRouter(BaseTest):
         assert "total_count" in json_response
         assert "orders" in json_response
 
+    def test_get_all_orders_paginated(self, authorized_client):
+        first_response = authorized_client.get(
+            f"{self.prefix}/orders", params={"limit": 1}
+        )
+        first_page = first_response.json()
+        second_response = authorized_client.get(
+            f"{self.prefix}/orders",
+            params={"limit": 1, "cursor": first_page["next_cursor"]},
+        )
+        second_page = second_response.json()
+
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+        assert first_page["total_count"] == len(self.orders)
+        assert "next_cursor" not in second_page
+        assert {
+            first_page["orders"][0]["id"],
+            second_page["orders"][0]["id"],
+        } == {order.id for order in self.orders}
+
     @pytest.mark.parametrize(
         "authorized_client", ["commercial_token", "institutional_token"], indirect=True
     )
@@ -309,3 +356,13 @@ class TestOrderRouter(BaseTest):
             == payload["distribution_center_id"]
         )
         assert len(json_response["products"]) == len(payload["products"])
+
+    @pytest.mark.parametrize("authorized_client", ["commercial_token"], indirect=True)
+    def test_get_order_by_id_query_budget(self, authorized_client, query_budget):
+        order = next(iter(self.orders))
+
+        with query_budget(3):
+            response = authorized_client.get(f"{self.prefix}/orders/{order.id}")
+
+        assert response.status_code == 200
+        assert len(response.json()["products"]) == 1
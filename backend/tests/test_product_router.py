@@ -1,8 +1,21 @@
+import asyncio
+import io
+from datetime import date, timedelta
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import create_engine, text
 
+from src.core.config import settings
+from src.db.database import async_session_scope
 from src.models.enums.user_role import UserRole
+from src.services import (
+    catalog_cache_service,
+    product_import_service,
+    product_service,
+)
+from src.services.catalog_cache_service import get_catalog_page
+from src.services.principal_cache_service import Principal
 from tests.base_test import BaseTest
 
 
@@ -105,11 +118,11 @@ class TestProductRouter(BaseTest):
         assert len(json_response["errors_details"]) == 1
 
     @patch(
-        "src.services.product_service.create_product",
+        "src.services.product_service._insert_products",
         side_effect=Exception("Database error"),
     )
     def test_register_products_bulk_causing_exception(
-        self, mock_create_product, authorized_client
+        self, mock_insert_products, authorized_client
     ):
         payload = {
             "products": [
@@ -146,7 +159,84 @@ class TestProductRouter(BaseTest):
         assert json_response["rows_inserted"] == 0
         assert json_response["errors"] == 2
         assert len(json_response["errors_details"]) == 2
-        mock_create_product.assert_called()
+        mock_insert_products.assert_called()
+
+    def test_register_products_bulk_isolates_failing_rows(self, authorized_client):
+        payload = {"products": []}
+        provider_id = next(iter(self.providers)).id
+        for i in range(3):
+            product = self.create_product_payload.copy()
+            product["name"] = f"Test Product {i}"
+            product["provider_id"] = provider_id
+            payload["products"].append(product)
+        insert_products = product_service._insert_products
+
+        async def fail_on_second_product(*, db, products):
+            if any(product.name == "Test Product 1" for product in products):
+                raise Exception("Database error")
+            await insert_products(db=db, products=products)
+
+        with patch(
+            "src.services.product_service._insert_products",
+            side_effect=fail_on_second_product,
+        ) as mock_insert_products:
+            response = authorized_client.post(
+                f"{self.prefix}/products-batch", json=payload
+            )
+        json_response = response.json()
+        assert response.status_code == 201
+        assert json_response["success"] is False
+        assert json_response["rows_inserted"] == 2
+        assert json_response["errors"] == 1
+        assert json_response["errors_details"] == [
+            "Unexpected error for product 'Test Product 1': Database error"
+        ]
+        assert mock_insert_products.call_count == 4
+
+    def test_register_products_bulk_refreshes_catalog_when_last_row_fails(
+        self, authorized_client
+    ):
+        provider_id = next(iter(self.providers)).id
+        payload = {
+            "products": [
+                {
+                    **self.create_product_payload,
+                    "name": name,
+                    "provider_id": provider_id,
+                }
+                for name in ("Test Product 0", "Test Product 1")
+            ]
+        }
+        response = authorized_client.get(f"{self.prefix}/products")
+        insert_products = product_service._insert_products
+
+        async def fail_on_last_product(*, db, products):
+            await insert_products(db=db, products=products)
+            if any(product.name == "Test Product 1" for product in products):
+                # Another request reads the catalog before the import commits.
+                async with async_session_scope() as reader:
+                    await get_catalog_page(
+                        db=reader, current_user=Principal(id="", role=UserRole.ADMIN)
+                    )
+                raise Exception("Database error")
+
+        with patch(
+            "src.services.product_service._insert_products",
+            side_effect=fail_on_last_product,
+        ):
+            bulk_response = authorized_client.post(
+                f"{self.prefix}/products-batch", json=payload
+            )
+        refreshed_response = authorized_client.get(
+            f"{self.prefix}/products",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        assert bulk_response.json()["rows_inserted"] == 1
+        assert refreshed_response.status_code == 200
+        assert "Test Product 0" in {
+            product["name"] for product in refreshed_response.json()["products"]
+        }
 
     def test_register_products_bulk_success(self, authorized_client):
         payload = {"products": []}
@@ -166,6 +256,125 @@ class TestProductRouter(BaseTest):
         assert json_response["errors"] == 0
         assert len(json_response["errors_details"]) == 0
 
+    def _catalog_csv(self, rows: list[str]) -> bytes:
+        header = (
+            "name,details,store,batch,image_url,due_date,stock,price_per_unit,"
+            "provider_id\n"
+        )
+
+        return (header + "".join(f"{row}\n" for row in rows)).encode()
+
+    def test_import_products_file(self, authorized_client, monkeypatch):
+        monkeypatch.setattr(settings, "product_import_batch_size", 2)
+        provider_id = next(iter(self.providers)).id
+        details = "Details for a catalog product."
+        content = self._catalog_csv(
+            [
+                f"Catalog 1,{details},Store,BATCH0001,,2030-01-01,10,9.5,{provider_id}",
+                f"Catalog 2,{details},Store,BATCH0002,,2030-01-01,0,9.5,{provider_id}",
+                f"Catalog 3,{details},Store,BATCH0003,,2030-01-01,10,9.5,{'0' * 36}",
+                f"Catalog 4,{details},Store,BATCH0004,,2030-01-01,10,9.5,{provider_id}",
+                f"Catalog 5,{details},Store,BATCH0005,,2030-01-01,10,9.5,{provider_id}",
+            ]
+        )
+
+        response = authorized_client.post(
+            f"{self.prefix}/products-batch/file",
+            files={"file": ("catalog.csv", content)},
+        )
+        json_response = response.json()
+        assert response.status_code == 201
+        assert json_response["success"] is False
+        assert json_response["rows_total"] == 5
+        assert json_response["rows_inserted"] == 3
+        assert json_response["errors"] == 2
+        assert json_response["errors_details"] == [
+            "Error for product 'Catalog 2' (row 2): stock: "
+            "Input should be greater than 0",
+            "Error for product 'Catalog 3' (row 3): "
+            "Provider with the given ID does not exist",
+        ]
+
+    def test_import_products_file_cancels_prefetched_chunk_on_failure(
+        self, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "product_import_batch_size", 1)
+        provider_id = next(iter(self.providers)).id
+        details = "Details for a catalog product."
+        content = self._catalog_csv(
+            [
+                f"Catalog {i},{details},Store,BATCH000{i},,2030-01-01,10,9.5,{provider_id}"
+                for i in range(2)
+            ]
+        )
+        read_chunk = product_import_service._read_chunk
+        prefetches = []
+
+        async def slow_prefetch(reader, rows_read):
+            if rows_read:
+                prefetches.append(asyncio.current_task())
+                await asyncio.Event().wait()
+            return await read_chunk(reader, rows_read=rows_read)
+
+        async def import_catalog():
+            async with async_session_scope() as db:
+                with pytest.raises(Exception, match="Database error"):
+                    await product_import_service.import_products(
+                        db=db, file=io.BytesIO(content)
+                    )
+            await asyncio.sleep(0)
+
+            return prefetches[0].cancelled()
+
+        with (
+            patch.object(product_import_service, "_read_chunk", slow_prefetch),
+            patch.object(
+                product_import_service,
+                "insert_product_rows",
+                side_effect=Exception("Database error"),
+            ),
+        ):
+            assert asyncio.run(import_catalog())
+
+    def test_import_products_file_limits_error_details(
+        self, authorized_client, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "product_import_batch_size", 2)
+        monkeypatch.setattr(settings, "product_import_max_error_details", 3)
+        content = self._catalog_csv([f"Catalog {i},,,,,,,," for i in range(5)])
+
+        response = authorized_client.post(
+            f"{self.prefix}/products-batch/file",
+            files={"file": ("catalog.csv", content)},
+        )
+        json_response = response.json()
+        assert response.status_code == 201
+        assert json_response["rows_inserted"] == 0
+        assert json_response["errors"] == 5
+        assert len(json_response["errors_details"]) == 3
+
+    @pytest.mark.parametrize(
+        "content, message",
+        [
+            (b"name,details\nA,B\n", "Missing CSV columns"),
+            (b"name,\xff\n", "Invalid CSV file"),
+            (
+                b"name,details,store,batch,due_date,stock,price_per_unit,provider_id\n",
+                "does not contain any product",
+            ),
+        ],
+    )
+    def test_import_products_file_with_invalid_file(
+        self, authorized_client, content, message
+    ):
+        response = authorized_client.post(
+            f"{self.prefix}/products-batch/file",
+            files={"file": ("catalog.csv", content)},
+        )
+
+        assert response.status_code == 400
+        assert message in response.json()["message"]
+
     def test_get_all_products(self, authorized_client):
         response = authorized_client.get(f"{self.prefix}/products")
         json_response = response.json()
@@ -191,6 +400,195 @@ class TestProductRouter(BaseTest):
         assert "products" in json_response
         assert isinstance(json_response["products"], list)
 
+    def test_get_all_products_paginated(self, authorized_client):
+        first_response = authorized_client.get(
+            f"{self.prefix}/products", params={"limit": 1}
+        )
+        first_page = first_response.json()
+        second_response = authorized_client.get(
+            f"{self.prefix}/products",
+            params={"limit": 1, "cursor": first_page["next_cursor"]},
+        )
+        second_page = second_response.json()
+
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+        assert first_page["total_count"] == len(self.products)
+        assert len(first_page["products"]) == 1
+        assert len(second_page["products"]) == 1
+        assert "next_cursor" not in second_page
+        assert {
+            first_page["products"][0]["id"],
+            second_page["products"][0]["id"],
+        } == {product.id for product in self.products}
+
+    def test_get_all_products_without_total(self, authorized_client):
+        response = authorized_client.get(
+            f"{self.prefix}/products", params={"include_total": False}
+        )
+        json_response = response.json()
+        assert response.status_code == 200
+        assert "total_count" not in json_response
+        assert len(json_response["products"]) == len(self.products)
+
+    def test_get_all_products_with_invalid_cursor(self, authorized_client):
+        response = authorized_client.get(
+            f"{self.prefix}/products", params={"cursor": "invalid-cursor"}
+        )
+        json_response = response.json()
+        assert response.status_code == 400
+        assert json_response["message"] == "Invalid pagination cursor"
+
+    def test_get_all_products_not_modified(self, authorized_client):
+        response = authorized_client.get(f"{self.prefix}/products")
+        etag = response.headers["ETag"]
+        cached_response = authorized_client.get(
+            f"{self.prefix}/products", headers={"If-None-Match": etag}
+        )
+        page_response = authorized_client.get(
+            f"{self.prefix}/products",
+            params={"limit": 1},
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 200
+        assert cached_response.status_code == 304
+        assert cached_response.headers["ETag"] == etag
+        assert page_response.status_code == 200
+        assert page_response.headers["ETag"] != etag
+
+    def test_get_all_products_not_modified_with_etag_list(self, authorized_client):
+        etag = authorized_client.get(f"{self.prefix}/products").headers["ETag"]
+        response = authorized_client.get(
+            f"{self.prefix}/products", headers={"If-None-Match": f'"other", W/{etag}'}
+        )
+
+        assert response.status_code == 304
+
+    def test_get_all_products_without_catalog_cache(
+        self, authorized_client, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "catalog_cache_ttl_seconds", 0)
+        response = authorized_client.get(f"{self.prefix}/products")
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert response.json()["total_count"] == len(self.products)
+
+    def test_get_all_products_refreshes_after_product_creation(self, authorized_client):
+        response = authorized_client.get(f"{self.prefix}/products")
+        create_response = authorized_client.post(
+            f"{self.prefix}/products",
+            json={
+                **self.create_product_payload,
+                "provider_id": next(iter(self.providers)).id,
+            },
+        )
+        refreshed_response = authorized_client.get(
+            f"{self.prefix}/products",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        assert create_response.status_code == 201
+        assert refreshed_response.status_code == 200
+        assert refreshed_response.json()["total_count"] == len(self.products) + 1
+        assert create_response.json()["id"] in {
+            product["id"] for product in refreshed_response.json()["products"]
+        }
+
+    def test_get_all_products_follows_the_shared_catalog_version(
+        self, authorized_client, postgres_container
+    ):
+        product = next(iter(self.products))
+        response = authorized_client.get(f"{self.prefix}/products")
+        engine = create_engine(postgres_container.get_connection_url())
+        # Plain SQL stands in for another worker: this process hears nothing of it.
+        with engine.begin() as connection:
+            connection.execute(
+                text("UPDATE products SET stock = 1 WHERE id = :id"), {"id": product.id}
+            )
+        unchanged_response = authorized_client.get(
+            f"{self.prefix}/products",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        with engine.begin() as connection:
+            connection.execute(
+                text("UPDATE catalog_versions SET version = version + 1")
+            )
+        engine.dispose()
+        refreshed_response = authorized_client.get(
+            f"{self.prefix}/products",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+
+        assert unchanged_response.status_code == 304
+        assert refreshed_response.status_code == 200
+        assert {
+            p["stock"]
+            for p in refreshed_response.json()["products"]
+            if p["id"] == product.id
+        } == {1}
+
+    def test_get_all_products_rebuilds_the_catalog_once(self):
+        builds = []
+        snapshot_class = catalog_cache_service.CatalogSnapshot
+
+        def count_builds(**kwargs):
+            builds.append(kwargs["version"])
+            return snapshot_class(**kwargs)
+
+        async def read_catalog():
+            async with async_session_scope() as db:
+                return await get_catalog_page(
+                    db=db, current_user=Principal(id="", role=UserRole.ADMIN)
+                )
+
+        async def read_concurrently():
+            return await asyncio.gather(*(read_catalog() for _ in range(5)))
+
+        with patch.object(catalog_cache_service, "CatalogSnapshot", count_builds):
+            pages = asyncio.run(read_concurrently())
+
+        assert len(builds) == 1
+        assert len({etag for _, etag in pages}) == 1
+
+    @pytest.mark.parametrize(
+        "authorized_client", ["institutional_token"], indirect=True
+    )
+    def test_get_all_products_hides_sold_out_products(self, authorized_client):
+        product = next(iter(self.products))
+        response = authorized_client.get(f"{self.prefix}/products")
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        order_response = seller_client.post(
+            f"{self.prefix}/orders",
+            json={
+                "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                "distribution_center_id": next(iter(self.distribution_centers)).id,
+                "client_id": next(
+                    user for user in self.users if user.role == UserRole.INSTITUTIONAL
+                ).id,
+                "products": [{"product_id": product.id, "quantity": product.stock}],
+            },
+        )
+        refreshed_response = authorized_client.get(
+            f"{self.prefix}/products",
+            headers={"If-None-Match": response.headers["ETag"]},
+        )
+        admin_client = self.client.__class__(self.client.app)
+        admin_client.headers.update({"Authorization": f"Bearer {self.admin_token}"})
+        admin_response = admin_client.get(f"{self.prefix}/products")
+
+        assert order_response.status_code == 201
+        assert product.id in {p["id"] for p in response.json()["products"]}
+        assert refreshed_response.status_code == 200
+        assert product.id not in {
+            p["id"] for p in refreshed_response.json()["products"]
+        }
+        assert product.id in {p["id"] for p in admin_response.json()["products"]}
+
     @pytest.mark.parametrize(
         "authorized_client", ["admin_token", "commercial_token"], indirect=True
     )
@@ -255,6 +653,164 @@ class TestProductRouter(BaseTest):
         assert isinstance(json_response["products"], list)
         mock_get_ranked_products.assert_called()
 
+    def test_rebuild_recommended_products(self, authorized_client):
+        order = next(iter(self.orders))
+        rebuild_response = authorized_client.post(
+            f"{self.prefix}/products/recommended/rebuild"
+        )
+        response = authorized_client.get(
+            f"{self.prefix}/products/recommended", params={"client_id": order.client_id}
+        )
+
+        assert rebuild_response.status_code == 200
+        assert rebuild_response.json()["rankings_count"] == (
+            len({order.client_id for order in self.orders}) + 1
+        )
+        assert response.status_code == 200
+        assert [product["id"] for product in response.json()["products"]] == [
+            next(iter(self.products)).id
+        ]
+
+    def test_get_recommended_products_includes_new_orders(self, authorized_client):
+        client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        first_product, second_product = list(self.products)[:2]
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        for product, quantity in ((first_product, 3), (second_product, 5)):
+            order_response = seller_client.post(
+                f"{self.prefix}/orders",
+                json={
+                    "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                    "distribution_center_id": next(iter(self.distribution_centers)).id,
+                    "client_id": client.id,
+                    "products": [{"product_id": product.id, "quantity": quantity}],
+                },
+            )
+            assert order_response.status_code == 201
+
+        response = authorized_client.get(
+            f"{self.prefix}/products/recommended", params={"client_id": client.id}
+        )
+
+        assert response.status_code == 200
+        assert [product["id"] for product in response.json()["products"]] == [
+            second_product.id,
+            first_product.id,
+        ]
+
+    def test_rebuild_recommended_products_with_co_purchases(self, authorized_client):
+        client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        first_product, second_product = list(self.products)[:2]
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        order_response = seller_client.post(
+            f"{self.prefix}/orders",
+            json={
+                "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                "distribution_center_id": next(iter(self.distribution_centers)).id,
+                "client_id": client.id,
+                "products": [
+                    {"product_id": first_product.id, "quantity": 1},
+                    {"product_id": second_product.id, "quantity": 2},
+                ],
+            },
+        )
+
+        rebuild_response = authorized_client.post(
+            f"{self.prefix}/products/recommended/rebuild"
+        )
+        response = authorized_client.get(
+            f"{self.prefix}/products/recommended", params={"client_id": client.id}
+        )
+
+        assert order_response.status_code == 201
+        assert rebuild_response.status_code == 200
+        assert rebuild_response.json()["neighbors_count"] == 2
+        assert response.status_code == 200
+        assert [product["id"] for product in response.json()["products"]] == [
+            first_product.id,
+            second_product.id,
+        ]
+
+    def test_get_recommended_products_includes_co_purchased_products(
+        self, authorized_client
+    ):
+        client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        # The fixture orders give the client units of the first product only.
+        bought_product = next(iter(self.products))
+        provider_id = next(iter(self.providers)).id
+        co_purchased_product, popular_product = (
+            authorized_client.post(
+                f"{self.prefix}/products",
+                json={
+                    **self.create_product_payload,
+                    "name": name,
+                    "provider_id": provider_id,
+                },
+            ).json()
+            for name in ("Co-purchased Product", "Popular Product")
+        )
+        other_client = self.client.post(
+            f"{self.prefix}/auth/register",
+            json={
+                "email": "other-client@mail.com",
+                "full_name": "Other Client",
+                "doi": "987654321",
+                "address": "456 Other St",
+                "phone": "1234567890",
+                "role": "institutional",
+                "password": "my_pass123",
+            },
+        ).json()
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        order_responses = [
+            seller_client.post(
+                f"{self.prefix}/orders",
+                json={
+                    "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                    "distribution_center_id": next(iter(self.distribution_centers)).id,
+                    "client_id": other_client["id"],
+                    "products": products,
+                },
+            )
+            for products in (
+                [
+                    {"product_id": bought_product.id, "quantity": 1},
+                    {"product_id": co_purchased_product["id"], "quantity": 1},
+                ],
+                [{"product_id": popular_product["id"], "quantity": 50}],
+            )
+        ]
+
+        rebuild_response = authorized_client.post(
+            f"{self.prefix}/products/recommended/rebuild"
+        )
+        response = authorized_client.get(
+            f"{self.prefix}/products/recommended",
+            params={"client_id": client.id, "limit": 2},
+        )
+
+        assert [r.status_code for r in order_responses] == [201, 201]
+        assert rebuild_response.status_code == 200
+        # The global ranking alone would fill the second slot with the popular product.
+        assert [product["id"] for product in response.json()["products"]] == [
+            bought_product.id,
+            co_purchased_product["id"],
+        ]
+
     def test_get_product_not_found(self, authorized_client):
         response = authorized_client.get(
             f"{self.prefix}/products/123e4567-e89b-12d3-a456-426614174000"
@@ -278,3 +834,12 @@ class TestProductRouter(BaseTest):
         assert json_response["due_date"] == str(product.due_date)
         assert json_response["stock"] == product.stock
         assert json_response["price_per_unit"] == product.price_per_unit
+
+    def test_get_product_query_budget(self, authorized_client, query_budget):
+        product = next(iter(self.products))
+
+        with query_budget(4):
+            response = authorized_client.get(f"{self.prefix}/products/{product.id}")
+
+        assert response.status_code == 200
+        assert len(response.json()["orders"]) == len(self.orders)
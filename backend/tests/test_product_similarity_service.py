@@ -0,0 +1,93 @@
+import math
+from unittest.mock import patch
+
+import pytest
+
+from src.services.product_similarity_service import (
+    blend_recommendations,
+    build_product_neighbors,
+)
+
+BASKETS = {
+    "order-1": ["milk", "bread", "eggs"],
+    "order-2": ["milk", "bread"],
+    "order-3": ["milk", "coffee"],
+    "order-4": ["tea"],
+}
+
+
+def _build(baskets: dict[str, list[str]], top_k: int = 10):
+    lines = [
+        (order_id, product_id)
+        for order_id, product_ids in baskets.items()
+        for product_id in product_ids
+    ]
+
+    return build_product_neighbors(
+        order_ids=[order_id for order_id, _ in lines],
+        product_ids=[product_id for _, product_id in lines],
+        top_k=top_k,
+    )
+
+
+class TestProductSimilarityService:
+    def test_build_product_neighbors_uses_cosine_similarity(self):
+        neighbors = _build(BASKETS)
+
+        assert neighbors["bread"] == [
+            ("milk", pytest.approx(2 / math.sqrt(2 * 3))),
+            ("eggs", pytest.approx(1 / math.sqrt(2 * 1))),
+        ]
+        assert neighbors["milk"][0] == ("bread", pytest.approx(2 / math.sqrt(3 * 2)))
+        assert "tea" not in neighbors
+
+    def test_build_product_neighbors_keeps_top_k(self):
+        neighbors = _build(BASKETS, top_k=1)
+
+        assert {product: len(items) for product, items in neighbors.items()} == {
+            "milk": 1,
+            "bread": 1,
+            "eggs": 1,
+            "coffee": 1,
+        }
+        assert neighbors["milk"][0][0] == "bread"
+
+    def test_build_product_neighbors_ignores_repeated_lines(self):
+        baskets = {**BASKETS, "order-2": ["milk", "bread", "bread"]}
+
+        assert _build(baskets) == _build(BASKETS)
+
+    def test_build_product_neighbors_in_chunks(self):
+        with patch("src.services.product_similarity_service._PAIRS_PER_CHUNK", 2):
+            chunked = _build(BASKETS)
+
+        assert chunked == _build(BASKETS)
+
+    def test_build_product_neighbors_without_orders(self):
+        assert _build({}) == {}
+        assert _build({"order-1": ["tea"]}) == {}
+
+    def test_blend_recommendations(self):
+        product_ids = blend_recommendations(
+            history=[("milk", 10), ("tea", 5)],
+            neighbors={
+                "milk": [("bread", 0.8), ("coffee", 0.3)],
+                "tea": [("coffee", 0.5)],
+            },
+        )
+
+        assert product_ids == ["milk", "bread", "coffee", "tea"]
+
+    def test_blend_recommendations_does_not_boost_bought_products(self):
+        product_ids = blend_recommendations(
+            history=[("milk", 10), ("tea", 6), ("bread", 5)],
+            neighbors={"milk": [("bread", 0.9)]},
+        )
+
+        assert product_ids == ["milk", "tea", "bread"]
+
+    def test_blend_recommendations_keeps_history_order_on_ties(self):
+        assert blend_recommendations(
+            history=[("tea", 4), ("milk", 4)], neighbors={}
+        ) == ["tea", "milk"]
+        assert blend_recommendations(history=[], neighbors={}) == []
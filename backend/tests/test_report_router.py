@@ -1,4 +1,15 @@
+import csv
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
 from src.models.enums.user_role import UserRole
+from src.services.report_service import ORDERS_REPORT_EXPORT_COLUMNS
+from src.services.sales_rollup_service import _SALES_ROLLUP_LOCK_ID
 from tests.base_test import BaseTest
 
 
@@ -41,3 +52,138 @@ class TestReportRouter(BaseTest):
         assert response.status_code == 200
         assert "total_count" in json_response
         assert "orders" in json_response
+
+    def test_get_orders_report_query_budget(self, authorized_client, query_budget):
+        with query_budget(4):
+            response = authorized_client.get(f"{self.prefix}/reports/orders")
+
+        assert response.status_code == 200
+        assert len(response.json()["orders"]) == len(self.orders)
+
+    def test_export_orders_report_as_csv(self, authorized_client):
+        response = authorized_client.get(
+            f"{self.prefix}/reports/orders", params={"format": "csv"}
+        )
+        rows = list(csv.reader(io.StringIO(response.text)))
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert "orders_report.csv" in response.headers["content-disposition"]
+        assert tuple(rows[0]) == ORDERS_REPORT_EXPORT_COLUMNS
+        assert {row[0] for row in rows[1:]} == {order.id for order in self.orders}
+
+    def test_export_orders_report_as_ndjson(self, authorized_client):
+        seller = next(user for user in self.users if user.role == UserRole.COMMERCIAL)
+        response = authorized_client.get(
+            f"{self.prefix}/reports/orders",
+            params={"format": "ndjson", "seller_id": seller.id},
+        )
+        records = [json.loads(line) for line in response.text.splitlines()]
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(records) == len(self.orders)
+        assert all(record["seller_id"] == seller.id for record in records)
+        assert all(
+            record["line_total"] == record["quantity"] * record["price_per_unit"]
+            for record in records
+        )
+
+    def test_export_orders_report_with_invalid_format(self, authorized_client):
+        response = authorized_client.get(
+            f"{self.prefix}/reports/orders", params={"format": "xml"}
+        )
+
+        assert response.status_code == 422
+
+    def test_get_sales_report_after_rebuild(self, authorized_client):
+        rebuild_response = authorized_client.post(
+            f"{self.prefix}/reports/sales/rebuild"
+        )
+        response = authorized_client.get(
+            f"{self.prefix}/reports/sales", params={"group_by": ["seller", "status"]}
+        )
+        json_response = response.json()
+        orders_report = authorized_client.get(f"{self.prefix}/reports/orders").json()
+        order_lines = [
+            product
+            for order in orders_report["orders"]
+            for product in order["products"]
+        ]
+
+        assert rebuild_response.status_code == 200
+        assert rebuild_response.json()["buckets_count"] >= 1
+        assert response.status_code == 200
+        assert json_response["total_units"] == sum(
+            line["quantity"] for line in order_lines
+        )
+        assert json_response["total_revenue"] == pytest.approx(
+            sum(line["quantity"] * line["price_per_unit"] for line in order_lines)
+        )
+        assert {bucket["seller_id"] for bucket in json_response["buckets"]} == {
+            order.seller_id for order in self.orders
+        }
+        assert all("product_id" not in bucket for bucket in json_response["buckets"])
+
+    def test_rebuild_sales_rollups_waits_for_orders_in_flight(
+        self, authorized_client, postgres_container
+    ):
+        engine = create_engine(postgres_container.get_connection_url())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with engine.begin() as connection:
+                # An order being placed holds the rollup lock until it commits.
+                connection.execute(
+                    text("SELECT pg_advisory_xact_lock_shared(:lock_id)"),
+                    {"lock_id": _SALES_ROLLUP_LOCK_ID},
+                )
+                rebuild = executor.submit(
+                    authorized_client.post, f"{self.prefix}/reports/sales/rebuild"
+                )
+                done_while_order_open = wait([rebuild], timeout=1).done
+            rebuild_response = rebuild.result(timeout=10)
+        engine.dispose()
+
+        assert not done_while_order_open
+        assert rebuild_response.status_code == 200
+
+    def test_get_sales_report_includes_new_orders(self, authorized_client):
+        seller = next(user for user in self.users if user.role == UserRole.COMMERCIAL)
+        client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        product = next(iter(self.products))
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        for quantity in (3, 4):
+            seller_client.post(
+                f"{self.prefix}/orders",
+                json={
+                    "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                    "distribution_center_id": next(iter(self.distribution_centers)).id,
+                    "client_id": client.id,
+                    "products": [{"product_id": product.id, "quantity": quantity}],
+                },
+            )
+
+        response = authorized_client.get(
+            f"{self.prefix}/reports/sales",
+            params={"group_by": "product", "seller_id": seller.id},
+        )
+        summary_response = seller_client.get(f"{self.prefix}/sellers/me")
+        json_response = response.json()
+
+        assert response.status_code == 200
+        assert json_response["buckets"] == [
+            {
+                "product_id": product.id,
+                "units": 7,
+                "revenue": pytest.approx(7 * product.price_per_unit),
+                "order_lines": 2,
+            }
+        ]
+        assert summary_response.json()["units_sold"] == 7
+        assert summary_response.json()["revenue"] == pytest.approx(
+            7 * product.price_per_unit
+        )
@@ -0,0 +1,117 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from src.services.route_optimization_service import (
+    haversine_matrix,
+    optimize_stop_sequence,
+    plan_vehicle_routes,
+    tour_distance,
+)
+
+
+class TestRouteOptimizationService:
+    def test_haversine_matrix(self):
+        distances = haversine_matrix(
+            np.array([(4.7110, -74.0721), (-12.0464, -77.0428), (4.7110, -74.0721)])
+        )
+
+        assert distances.shape == (3, 3)
+        assert np.allclose(distances, distances.T)
+        assert np.allclose(np.diag(distances), 0)
+        assert distances[0, 1] == pytest.approx(1892, rel=0.01)
+        assert distances[0, 2] == pytest.approx(0)
+
+    def test_optimize_stop_sequence_without_stops(self):
+        tour = optimize_stop_sequence(stops=[], depot=(4.65, -74.08))
+
+        assert tour.stop_sequence == []
+        assert tour.distance_km == 0
+
+    def test_optimize_stop_sequence_open_path_along_a_line(self):
+        stops = [(4.60 + 0.01 * index, -74.08) for index in range(8)]
+        order = [5, 0, 7, 2, 6, 1, 4, 3]
+
+        tour = optimize_stop_sequence(stops=[stops[index] for index in order])
+        visited = [order[index] for index in tour.stop_sequence]
+
+        assert visited in (list(range(8)), list(range(8))[::-1])
+        assert tour.distance_km == pytest.approx(
+            haversine_matrix(np.array([stops[0], stops[-1]]))[0, 1]
+        )
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_optimize_stop_sequence_matches_brute_force_on_small_tours(self, seed):
+        rng = random.Random(seed)
+        depot = (4.65, -74.08)
+        stops = [
+            (4.5 + rng.random() * 0.3, -74.2 + rng.random() * 0.3) for _ in range(7)
+        ]
+        distances = haversine_matrix(np.array([depot, *stops]))
+        optimum = min(
+            tour_distance(tour=[0, *permutation], distances=distances)
+            for permutation in itertools.permutations(range(1, len(stops) + 1))
+        )
+
+        tour = optimize_stop_sequence(stops=stops, depot=depot)
+
+        assert sorted(tour.stop_sequence) == list(range(len(stops)))
+        assert tour.distance_km == pytest.approx(optimum, rel=0.02)
+
+    def test_plan_vehicle_routes_respects_vehicle_limits(self):
+        rng = random.Random(3)
+        stops = [
+            (4.5 + rng.random() * 0.3, -74.2 + rng.random() * 0.3) for _ in range(60)
+        ]
+        demands = [rng.randint(1, 10) for _ in stops]
+        demands[0] = 51
+
+        plan = plan_vehicle_routes(
+            stops=stops,
+            demands=demands,
+            depot=(4.65, -74.08),
+            vehicle_count=4,
+            vehicle_capacity=50,
+            max_stops=8,
+        )
+        assigned = [index for tour in plan.tours for index in tour.stop_sequence]
+
+        assert len(plan.tours) == 4
+        assert all(len(tour.stop_sequence) <= 8 for tour in plan.tours)
+        assert all(
+            sum(demands[index] for index in tour.stop_sequence) <= 50
+            for tour in plan.tours
+        )
+        assert 0 in plan.unassigned
+        assert sorted(assigned + plan.unassigned) == list(range(len(stops)))
+
+    def test_plan_vehicle_routes_without_depot(self):
+        plan = plan_vehicle_routes(
+            stops=[(4.60, -74.08), (4.61, -74.08), (4.62, -74.08)],
+            demands=[1, 1, 1],
+            depot=None,
+            vehicle_count=1,
+            vehicle_capacity=10,
+        )
+
+        assert len(plan.tours) == 1
+        assert sorted(plan.tours[0].stop_sequence) == [0, 1, 2]
+        assert plan.unassigned == []
+
+    def test_plan_vehicle_routes_keeps_groups_apart(self):
+        plan = plan_vehicle_routes(
+            stops=[(4.600, -74.08), (4.601, -74.08), (4.602, -74.08)],
+            demands=[1, 1, 1],
+            depot=(4.65, -74.08),
+            vehicle_count=3,
+            vehicle_capacity=10,
+            groups=["2024-07-01", "2024-08-01", "2024-07-01"],
+        )
+
+        assert sorted(sorted(tour.stop_sequence) for tour in plan.tours) == [
+            [0, 2],
+            [1],
+        ]
+        assert plan.unassigned == []
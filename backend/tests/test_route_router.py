@@ -1,3 +1,11 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.models.enums.user_role import UserRole
+from src.services.route_optimization_service import haversine_matrix, tour_distance
 from tests.base_test import BaseTest
 
 
@@ -93,6 +101,162 @@ class TestRouteRouter(BaseTest):
         )
         assert len(json_response["orders"]) == len(payload["order_ids"])
 
+    def test_register_route_sequences_stops(self, authorized_client):
+        payload = self.create_route_payload()
+        payload["order_ids"] = [order.id for order in self.orders]
+        response = authorized_client.post(f"{self.prefix}/routes", json=payload)
+        route_id = response.json()["id"]
+        map_response = authorized_client.get(f"{self.prefix}/routes/{route_id}/map")
+        json_response = map_response.json()
+
+        assert response.status_code == 201
+        assert response.json()["estimated_distance_km"] > 0
+        assert map_response.status_code == 200
+        assert [stop["stop_sequence"] for stop in json_response["stops"]] == [1, 2]
+        assert {stop["order_id"] for stop in json_response["stops"]} == set(
+            payload["order_ids"]
+        )
+
+    def test_register_route_starts_and_ends_at_distribution_center(
+        self, authorized_client
+    ):
+        distribution_center_response = authorized_client.post(
+            f"{self.prefix}/distribution-centers",
+            json={
+                "name": "Depot",
+                "address": "Calle 100 # 15-20",
+                "city": "Bogotá",
+                "country": "Colombia",
+            },
+        )
+        distribution_center = distribution_center_response.json()
+        seller_client = self.client.__class__(self.client.app)
+        seller_client.headers.update(
+            {"Authorization": f"Bearer {self.commercial_token}"}
+        )
+        order_response = seller_client.post(
+            f"{self.prefix}/orders",
+            json={
+                "delivery_date": (date.today() + timedelta(days=1)).isoformat(),
+                "distribution_center_id": distribution_center["id"],
+                "client_id": next(
+                    user for user in self.users if user.role == UserRole.INSTITUTIONAL
+                ).id,
+                "products": [
+                    {"product_id": next(iter(self.products)).id, "quantity": 1}
+                ],
+            },
+        )
+        payload = self.create_route_payload()
+        payload["distribution_center_id"] = distribution_center["id"]
+        payload["order_ids"] = [order_response.json()["id"]]
+        response = authorized_client.post(f"{self.prefix}/routes", json=payload)
+        map_response = authorized_client.get(
+            f"{self.prefix}/routes/{response.json()['id']}/map"
+        )
+        stops = sorted(map_response.json()["stops"], key=lambda s: s["stop_sequence"])
+        distances = haversine_matrix(
+            np.array(
+                [
+                    (distribution_center["latitude"], distribution_center["longitude"]),
+                    *((stop["latitude"], stop["longitude"]) for stop in stops),
+                ]
+            )
+        )
+
+        assert distribution_center_response.status_code == 201
+        assert order_response.status_code == 201
+        assert response.status_code == 201
+        assert [stop["stop_sequence"] for stop in stops] == [1]
+        # The tour leaves the depot, visits the stop and comes back.
+        assert response.json()["estimated_distance_km"] == pytest.approx(
+            tour_distance(tour=[0, 1], distances=distances), abs=1e-3
+        )
+        assert response.json()["estimated_distance_km"] > 0
+
+    @pytest.mark.parametrize(
+        "vehicle_count,vehicle_capacity,routes_count,unassigned_count",
+        [(1, 15, 1, 1), (2, 100, 2, 0)],
+    )
+    def test_plan_routes(
+        self,
+        authorized_client,
+        vehicle_count,
+        vehicle_capacity,
+        routes_count,
+        unassigned_count,
+    ):
+        payload = {
+            "distribution_center_id": next(iter(self.orders)).distribution_center_id,
+            "delivery_date": "2024-12-31",
+            "vehicle_count": vehicle_count,
+            "vehicle_capacity": vehicle_capacity,
+        }
+        response = authorized_client.post(f"{self.prefix}/routes/plan", json=payload)
+        json_response = response.json()
+        planned_order_ids = [
+            order_id
+            for route in json_response["routes"]
+            for order_id in route["order_ids"]
+        ]
+
+        assert response.status_code == 200
+        assert len(json_response["routes"]) == routes_count
+        assert len(json_response["unassigned_order_ids"]) == unassigned_count
+        assert set(planned_order_ids + json_response["unassigned_order_ids"]) == {
+            order.id for order in self.orders
+        }
+        assert all(
+            route["total_units"] <= vehicle_capacity
+            for route in json_response["routes"]
+        )
+
+    def test_plan_routes_keeps_delivery_dates_apart(
+        self, authorized_client, postgres_container
+    ):
+        first_order, second_order = self.orders
+        engine = create_engine(postgres_container.get_connection_url())
+        with engine.begin() as connection:
+            # Both orders go to the same client, so only their dates differ.
+            connection.execute(
+                text("UPDATE orders SET client_id = :client_id"),
+                {"client_id": first_order.client_id},
+            )
+        engine.dispose()
+        payload = {
+            "distribution_center_id": first_order.distribution_center_id,
+            "delivery_date": "2024-12-31",
+            "vehicle_count": 2,
+            "vehicle_capacity": 100,
+        }
+
+        response = authorized_client.post(f"{self.prefix}/routes/plan", json=payload)
+        routes = sorted(
+            response.json()["routes"], key=lambda route: route["delivery_deadline"]
+        )
+
+        assert response.status_code == 200
+        assert [route["order_ids"] for route in routes] == [
+            [first_order.id],
+            [second_order.id],
+        ]
+        assert [route["delivery_deadline"] for route in routes] == [
+            "2024-07-01",
+            "2024-08-01",
+        ]
+
+    def test_plan_routes_with_nonexistent_distribution_center(self, authorized_client):
+        payload = {
+            "distribution_center_id": "00000000-0000-0000-0000-000000000000",
+            "delivery_date": "2024-12-31",
+            "vehicle_count": 1,
+            "vehicle_capacity": 10,
+        }
+        response = authorized_client.post(f"{self.prefix}/routes/plan", json=payload)
+
+        assert response.status_code == 404
+        assert "Distribution center not found" in response.json()["message"]
+
     def test_get_all_routes(self, authorized_client):
         response = authorized_client.get(f"{self.prefix}/routes")
         json_response = response.json()
@@ -155,3 +319,14 @@ class TestRouteRouter(BaseTest):
         assert json_response["restrictions"] == payload["restrictions"]
         assert "total_count" in json_response
         assert "stops" in json_response
+
+    def test_get_route_map_query_budget(self, authorized_client, query_budget):
+        payload = self.create_route_payload()
+        create_response = authorized_client.post(f"{self.prefix}/routes", json=payload)
+        route_id = create_response.json()["id"]
+
+        with query_budget(3):
+            response = authorized_client.get(f"{self.prefix}/routes/{route_id}/map")
+
+        assert response.status_code == 200
+        assert response.json()["total_count"] == len(payload["order_ids"])
@@ -1,6 +1,20 @@
+import asyncio
+import threading
 from unittest.mock import patch
 
-from src.core.security import create_access_token
+import bcrypt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.security import (
+    create_access_token,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
+from src.models.db_models import User
+from src.models.enums.user_role import UserRole
 from tests.base_test import BaseTest
 
 
@@ -80,3 +94,91 @@ class TestSecurityAccess(BaseTest):
             self.endpoint, headers={"Authorization": f"Bearer {self.admin_token}"}
         )
         assert response.status_code == 200
+
+    def test_password_hashing_runs_on_the_password_pool(self, monkeypatch):
+        monkeypatch.setattr(settings, "bcrypt_rounds", 5)
+        threads = []
+
+        def tracked_verify_password(plain_password, hashed_password):
+            threads.append(threading.current_thread().name)
+            return verify_password(plain_password, hashed_password)
+
+        async def hash_and_verify():
+            hashed_password = await hash_password_async("123456")
+            with patch("src.core.security.verify_password", tracked_verify_password):
+                return hashed_password, await asyncio.gather(
+                    verify_password_async("123456", hashed_password),
+                    verify_password_async("654321", hashed_password),
+                )
+
+        hashed_password, results = asyncio.run(hash_and_verify())
+
+        assert bcrypt.checkpw(b"123456", hashed_password.encode("utf-8"))
+        assert hashed_password.startswith("$2b$05$")
+        assert results == [True, False]
+        assert all(name.startswith("password-hashing") for name in threads)
+
+    def test_principal_is_authorized_from_token_claims(self, query_budget):
+        headers = {"Authorization": f"Bearer {self.admin_token}"}
+        with query_budget(10) as statements:
+            response = self.client.get(self.endpoint, headers=headers)
+
+        assert response.status_code == 200
+        assert not any("FROM users" in statement for statement in statements)
+
+    def test_access_denied_with_invalid_role_claim(self):
+        token = create_access_token(
+            data={"sub": "user-id", "role": "root", "seller_id": None, "zone_id": None}
+        )
+        response = self.client.get(
+            self.endpoint, headers={"Authorization": f"Bearer {token}"}
+        )
+
+        assert response.status_code == 401
+
+    def test_principal_is_cached_between_requests(self, query_budget):
+        admin = next(user for user in self.users if user.role == UserRole.ADMIN)
+        token = create_access_token(data={"sub": admin.id, "role": admin.role.value})
+        headers = {"Authorization": f"Bearer {token}"}
+        with query_budget(10) as first_statements:
+            first_response = self.client.get(self.endpoint, headers=headers)
+        with query_budget(10) as second_statements:
+            second_response = self.client.get(self.endpoint, headers=headers)
+
+        assert first_response.status_code == second_response.status_code == 200
+        assert any("FROM users" in statement for statement in first_statements)
+        assert not any("FROM users" in statement for statement in second_statements)
+
+    def test_principal_cache_is_invalidated_on_user_update(self, postgres_container):
+        seller = next(user for user in self.users if user.role == UserRole.COMMERCIAL)
+        token = create_access_token(data={"sub": seller.id, "role": seller.role.value})
+        headers = {"Authorization": f"Bearer {token}"}
+        denied_response = self.client.get(self.endpoint, headers=headers)
+
+        engine = create_engine(postgres_container.get_connection_url())
+        with Session(engine) as db:
+            db.get(User, seller.id).role = UserRole.ADMIN
+            db.commit()
+        engine.dispose()
+        granted_response = self.client.get(self.endpoint, headers=headers)
+
+        assert denied_response.status_code == 403
+        assert granted_response.status_code == 200
+
+    def test_principal_cache_is_invalidated_after_commit(self, postgres_container):
+        seller = next(user for user in self.users if user.role == UserRole.COMMERCIAL)
+        token = create_access_token(data={"sub": seller.id, "role": seller.role.value})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        engine = create_engine(postgres_container.get_connection_url())
+        with Session(engine) as db:
+            db.get(User, seller.id).role = UserRole.ADMIN
+            db.flush()
+            # A request between the flush and the commit still sees the old role.
+            flushed_response = self.client.get(self.endpoint, headers=headers)
+            db.commit()
+        engine.dispose()
+        committed_response = self.client.get(self.endpoint, headers=headers)
+
+        assert flushed_response.status_code == 403
+        assert committed_response.status_code == 200
@@ -1,5 +1,3 @@
-from unittest.mock import patch
-
 import pytest
 
 from tests.base_test import BaseTest
@@ -48,8 +46,7 @@ class TestSellerRouter(BaseTest):
         assert response.status_code == 422
         assert json_response["message"] == "Zone with the given ID does not exist"
 
-    @patch("src.services.seller_service.send_email")
-    def test_register_seller_success(self, mock_send_email, authorized_client):
+    def test_register_seller_success(self, authorized_client, deliver_emails):
         payload = self.create_seller_payload.copy()
         payload["zone_id"] = next(iter(self.zones)).id
 
@@ -61,11 +58,10 @@ class TestSellerRouter(BaseTest):
         assert json_response["email"] == payload["email"]
         assert json_response["phone"] == payload["phone"]
         assert json_response["zone"]["id"] == payload["zone_id"]
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
 
-    @patch("src.services.seller_service.send_email")
     def test_register_seller_with_duplicate_email(
-        self, mock_send_email, authorized_client
+        self, authorized_client, deliver_emails
     ):
         payload = self.create_seller_payload.copy()
         payload["zone_id"] = next(iter(self.zones)).id
@@ -80,11 +76,10 @@ class TestSellerRouter(BaseTest):
         assert (
             json_response2["message"] == "Seller with this email or DOI already exists"
         )
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
 
-    @patch("src.services.seller_service.send_email")
     def test_register_seller_with_duplicate_doi(
-        self, mock_send_email, authorized_client
+        self, authorized_client, deliver_emails
     ):
         payload = self.create_seller_payload.copy()
         payload["zone_id"] = next(iter(self.zones)).id
@@ -99,7 +94,7 @@ class TestSellerRouter(BaseTest):
         assert (
             json_response2["message"] == "Seller with this email or DOI already exists"
         )
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
 
     def test_get_all_sellers(self, authorized_client):
         response = authorized_client.get(f"{self.prefix}/sellers")
@@ -116,8 +111,7 @@ class TestSellerRouter(BaseTest):
         assert response.status_code == 404
         assert json_response["message"] == "Seller not found"
 
-    @patch("src.services.seller_service.send_email")
-    def test_get_seller_by_id_success(self, mock_send_email, authorized_client):
+    def test_get_seller_by_id_success(self, authorized_client, deliver_emails):
         payload = self.create_seller_payload.copy()
         payload["zone_id"] = next(iter(self.zones)).id
 
@@ -131,7 +125,7 @@ class TestSellerRouter(BaseTest):
         json_response = response.json()
         assert response.status_code == 200
         assert json_response["id"] == seller_id
-        mock_send_email.assert_called_once()
+        assert len(deliver_emails()) == 1
 
     @pytest.mark.parametrize("authorized_client", ["commercial_token"], indirect=True)
     def test_get_seller_summary_success(self, authorized_client):
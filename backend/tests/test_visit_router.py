@@ -1,8 +1,14 @@
-from datetime import date, datetime, timedelta
+import asyncio
+import uuid
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import insert
 
+from src.db.database import async_session_scope
+from src.models.db_models import Visit
+from src.models.enums.user_role import UserRole
 from src.models.enums.visit_status import VisitStatus
 from tests import mocks
 from tests.base_test import BaseTest
@@ -100,6 +106,58 @@ class TestVisitRouter(BaseTest):
         assert "total_count" in json_response
         assert "visits" in json_response
 
+    @pytest.mark.parametrize(
+        "authorized_client", ["commercial_token", "institutional_token"], indirect=True
+    )
+    def test_get_all_visits_paginated(self, authorized_client):
+        seller = next(user for user in self.users if user.role == UserRole.COMMERCIAL)
+        client = next(
+            user for user in self.users if user.role == UserRole.INSTITUTIONAL
+        )
+        admin = next(user for user in self.users if user.role == UserRole.ADMIN)
+        created_at = datetime.now(timezone.utc)
+        # Visits sharing created_at are ordered by id; the admin's visit belongs
+        # to neither the seller nor the client.
+        visits = [
+            {
+                "id": str(uuid.uuid4()),
+                "expected_date": date.today(),
+                "expected_geolocation_id": client.geolocation_id,
+                "client_id": client_id,
+                "seller_id": seller_id,
+                "created_at": created_at,
+            }
+            for client_id, seller_id in [(client.id, seller.id)] * 3
+            + [(admin.id, admin.id)]
+        ]
+
+        async def insert_visits():
+            async with async_session_scope() as db:
+                await db.execute(insert(Visit), visits)
+                await db.commit()
+
+        asyncio.run(insert_visits())
+        visible_ids = [
+            visit.id
+            for visit in sorted(self.visits, key=lambda v: (v.created_at, v.id))
+        ] + sorted(visit["id"] for visit in visits[:3])
+        pages = [
+            authorized_client.get(f"{self.prefix}/visits", params={"limit": 2}).json()
+        ]
+        while "next_cursor" in pages[-1]:
+            pages.append(
+                authorized_client.get(
+                    f"{self.prefix}/visits",
+                    params={"limit": 2, "cursor": pages[-1]["next_cursor"]},
+                ).json()
+            )
+
+        assert len(pages) == 3
+        assert all(page["total_count"] == len(visible_ids) for page in pages)
+        assert [visit["id"] for page in pages for visit in page["visits"]] == (
+            visible_ids
+        )
+
     @pytest.mark.parametrize(
         "authorized_client", ["commercial_token", "institutional_token"], indirect=True
     )
@@ -290,3 +348,13 @@ class TestVisitRouter(BaseTest):
         assert "visit_date" in json_response
         assert "report_geolocation" in json_response
         assert "visual_evidence_url" in json_response
+
+    @pytest.mark.parametrize(
+        "authorized_client", ["commercial_token", "institutional_token"], indirect=True
+    )
+    def test_get_all_visits_query_budget(self, authorized_client, query_budget):
+        with query_budget(3):
+            response = authorized_client.get(f"{self.prefix}/visits")
+
+        assert response.status_code == 200
+        assert len(response.json()["visits"]) == len(self.visits)